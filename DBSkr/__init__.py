@@ -34,11 +34,18 @@ from . import topgg
 from . import uniquebots
 
 from .assets import Assets, DiscordAvatar, ImageURL
+from .cache import Cache, CacheEntry, CacheStats, SQLiteCacheStore, VoteCache
 from .client import Client
+from .codec import JSONCodec, OrjsonCodec, default_codec
 from .enums import WebsiteType
 from .errors import *
 from .https import HttpClient
 from .models import *
+from .poller import VotePoller
+from .ratelimit import RateLimitBucket, RateLimiter, RateLimitStore, SQLiteRateLimitStore
+from .session import SessionManager
+from .voters import VoterSet
+from .webhook import VoteEvent, WebhookServer
 
 
 VersionInfo = namedtuple('VersionInfo', 'major minor micro releaselevel serial')
@@ -24,22 +24,27 @@ SOFTWARE.
 import io
 import os
 
-from typing import Union
+from typing import Optional, Union
 
 from aiohttp import ClientSession
 from urllib import parse
 
 from . import errors
+from .session import SessionManager
 
 
 class Assets:
-    """ KoreanBots 클라이언트, top.gg 클라이언트, UniqueBots 클라이언트로 부터 들어온 이미지 자료를 나타냅니다."""
-    def __init__(self, cls, support_format: list, session: ClientSession = None):
+    """ KoreanBots 클라이언트, top.gg 클라이언트, UniqueBots 클라이언트로 부터 들어온 이미지 자료를 나타냅니다.
+
+    에셋은 Http 클라이언트의 세션을 참조만 하며, :meth:`read` 혹은 :meth:`save` 를 호출할 때 세션을 사용합니다.
+    세션이 없는 경우에는 요청할 때만 임시 ClientSession을 생성합니다.
+    """
+    __slots__ = ("_class", "_support_format", "session")
+
+    def __init__(self, cls, support_format: list, session: Union[ClientSession, SessionManager] = None):
         self._class = cls
         self._support_format: list = support_format
-        if session is None:
-            session = ClientSession()
-        self.session = session
+        self.session: Optional[Union[ClientSession, SessionManager]] = session
 
     def __str__(self):
         return self.url()
@@ -61,8 +66,17 @@ class Assets:
         :class:`bytes`:
             에셋의 콘텐츠가 리턴됩니다.
         """
-        query = self._class.query
-        async with self.session.get(self.url(), query=query) as resp:
+        if isinstance(self.session, SessionManager):
+            session = await self.session.get_session()
+            return await self._read(session)
+        elif self.session is not None:
+            return await self._read(self.session)
+
+        async with ClientSession() as session:
+            return await self._read(session)
+
+    async def _read(self, session: ClientSession) -> bytes:
+        async with session.get(self.url()) as resp:
             if resp.status == 200:
                 return await resp.read()
             elif resp.status == 404:
@@ -124,8 +138,8 @@ class Assets:
 
             if isinstance(query, dict):
                 for i in query.keys():
-                    _query += i + "=" + query[i] + "&"
-                _query = _query.lstrip("&")
+                    _query += i + "=" + str(query[i]) + "&"
+                _query = _query.rstrip("&")
             else:
                 _query = query
 
@@ -141,7 +155,13 @@ class Assets:
 
 class DiscordAvatar(Assets):
     """ 디스코드 사용자 혹은 봇의 아이콘을 저장합니다."""
-    def __init__(self, user_id: Union[int, str], avatar: str, session: ClientSession = None, size: int = None):
+    __slots__ = ("path", "BASE", "query")
+
+    def __init__(self,
+                 user_id: Union[int, str],
+                 avatar: str,
+                 session: Union[ClientSession, SessionManager] = None,
+                 size: int = None):
         self.path = "/avatars/{}/{}".format(user_id, avatar)
         if size is not None:
             self.query = {
@@ -156,7 +176,9 @@ class ImageURL(Assets):
     """ KoreanBots 클라이언트, top.gg 클라이언트, UniqueBots 클라이언트로 부터 들어온 이미지 자료를 저장합니다.
     주로 저장되는 데이터는 백그라운드 사진, 배너 사진 등이 있습니다.
     """
-    def __init__(self, url: str, session: ClientSession = None):
+    __slots__ = ("path", "BASE", "query")
+
+    def __init__(self, url: str, session: Union[ClientSession, SessionManager] = None):
         http = parse.urlparse(url)
         self.path = http.path
 
@@ -0,0 +1,149 @@
+"""MIT License
+
+Copyright (c) 2021 gunyu1019
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+from collections import deque
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+
+def unique(keys: Iterable[Hashable]) -> List[Hashable]:
+    """ 순서를 유지한 채로 중복된 값을 제거합니다."""
+    return list(dict.fromkeys(keys))
+
+
+async def gather_map(func: Callable[[Any], Awaitable],
+                     keys: Iterable[Hashable],
+                     concurrency: int = 8,
+                     return_exceptions: bool = False) -> Dict[Hashable, Any]:
+    """
+    본 함수는 코루틴(비동기)함수 입니다.
+
+    `keys` 에 있는 값마다 `func` 를 최대 `concurrency` 개씩 동시에 실행한 후, 값별 결과를 반환합니다.
+    중복된 값은 한 번만 실행됩니다.
+
+    Parameters
+    ----------
+    func: Callable[[Any], Awaitable]
+        값 하나를 받아 결과를 반환하는 코루틴 함수 입니다.
+    keys: Iterable[Hashable]
+        실행할 값 목록 입니다.
+    concurrency: Optional[int]
+        동시에 실행할 최대 갯수 입니다. 기본값은 8개 입니다.
+    return_exceptions: Optional[bool]
+        True일 경우 예외가 발생한 값은 결과 대신 예외가 포함됩니다.
+        False일 경우 처음 발생한 예외를 그대로 발생시키며, 나머지 작업은 취소됩니다. 기본값은 False 입니다.
+    """
+    keys = unique(keys)
+    results = dict()
+    iterator = iter(keys)
+
+    async def worker():
+        # 모든 작업자가 하나의 iterator를 공유하여, 값이 들어온 순서대로 처리됩니다.
+        for key in iterator:
+            try:
+                results[key] = await func(key)
+            except Exception as exception:
+                if not return_exceptions:
+                    raise
+                results[key] = exception
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(max(1, min(concurrency, len(keys))))]
+    try:
+        await asyncio.gather(*workers)
+    except BaseException:
+        for task in workers:
+            task.cancel()
+        raise
+    return {key: results[key] for key in keys if key in results}
+
+
+async def iter_pages(fetch: Callable[[int], Awaitable[Tuple[List[Any], Optional[int]]]],
+                     start: int = 1,
+                     step: int = 1,
+                     prefetch: int = 1,
+                     limit: int = None) -> AsyncIterator[Any]:
+    """ 페이지를 차례대로 불러오며 항목을 하나씩 반환하는 비동기 제너레이터 입니다.
+    현재 페이지를 처리하는 동안 다음 페이지를 최대 `prefetch` 개까지 미리 불러옵니다.
+
+    Parameters
+    ----------
+    fetch: Callable[[int], Awaitable[Tuple[List, Optional[int]]]]
+        페이지 번호(혹은 offset)를 받아 항목 목록과 마지막 페이지 번호를 반환하는 코루틴 함수 입니다.
+        마지막 페이지 번호를 알 수 없다면 None을 반환하며, 이 경우 항목이 없는 페이지가 나올 때까지 불러옵니다.
+    start: Optional[int]
+        처음 불러올 페이지 번호 입니다. 기본값은 1 입니다.
+    step: Optional[int]
+        다음 페이지 번호와의 차이 입니다. offset을 사용하는 경우 한 번에 불러오는 항목 수를 입력합니다. 기본값은 1 입니다.
+    prefetch: Optional[int]
+        미리 불러올 최대 페이지 수 입니다. 기본값은 1 입니다.
+    limit: Optional[int]
+        반환할 최대 항목 수 입니다. 기본값은 None이며, 마지막 페이지까지 반환합니다.
+    """
+    if limit is not None and limit <= 0:
+        return
+
+    pending = deque()
+    next_page = start
+    last = None
+    page_size = None
+    received = 0
+    count = 0
+
+    def schedule():
+        nonlocal next_page
+        pending.append(asyncio.ensure_future(fetch(next_page)))
+        next_page += step
+
+    def can_schedule() -> bool:
+        if last is not None and next_page > last:
+            return False
+        if limit is not None and page_size:
+            # 이미 불러오고 있는 페이지로 충분하다면 더 이상 불러오지 않습니다.
+            return received + len(pending) * page_size < limit
+        return True
+
+    schedule()
+    try:
+        while len(pending) != 0:
+            items, last = await pending.popleft()
+            if len(items) == 0:
+                break
+            page_size = max(page_size or 0, len(items))
+            received += len(items)
+
+            while len(pending) < prefetch and can_schedule():
+                schedule()
+
+            for item in items:
+                yield item
+                count += 1
+                if limit is not None and count >= limit:
+                    return
+
+            if len(pending) == 0 and can_schedule():
+                schedule()
+    finally:
+        for task in pending:
+            if task.done() and not task.cancelled():
+                task.exception()
+            task.cancel()
@@ -0,0 +1,638 @@
+"""MIT License
+
+Copyright (c) 2021 gunyu1019
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+import json
+import logging
+import random
+import sqlite3
+import threading
+import time
+import zlib
+
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence, Tuple
+
+from . import errors
+
+log = logging.getLogger(__name__)
+
+#: :class:`VoteCache` 가 사용하는 키 값의 접두어 입니다.
+VOTE_PREFIX = "vote:"
+
+
+class CacheStats:
+    """ 캐시의 사용 통계를 나타냅니다.
+
+    Attributes
+    ------------
+    hits: int
+        캐시에서 값을 찾은 횟수 입니다.
+    misses: int
+        캐시에서 값을 찾지 못한 횟수 입니다.
+    evictions: int
+        최대 갯수를 넘어 오래된 값이 삭제된 횟수 입니다.
+    expirations: int
+        유효 시간이 지나 값이 삭제된 횟수 입니다.
+    stale: int
+        유효 시간이 지난 값을 반환한 횟수 입니다.
+    """
+    def __init__(self):
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.expirations: int = 0
+        self.stale: int = 0
+
+    def __repr__(self):
+        return "<CacheStats hits={0.hits} misses={0.misses} evictions={0.evictions} " \
+               "expirations={0.expirations} stale={0.stale}>".format(self)
+
+    @property
+    def hit_rate(self) -> float:
+        """ 캐시 적중률(0.0 ~ 1.0) 입니다."""
+        total = self.hits + self.misses
+        if total == 0:
+            return 0.0
+        return self.hits / total
+
+
+class CacheEntry:
+    """ 캐시에 저장된 값 하나를 나타냅니다.
+
+    Attributes
+    ------------
+    value: Any
+        저장된 응답 값 입니다.
+    exception: Optional[Exception]
+        값을 찾을 수 없었던 경우(NotFound)에 발생한 예외 입니다.
+    endpoint: Optional[str]
+        저장된 값의 종류(예: `bot`, `users`) 입니다.
+    expires: float
+        값이 만료되는 시간(Unix Timestamp) 입니다.
+    """
+    def __init__(self, value: Any = None, exception: Exception = None, endpoint: str = None, expires: float = 0.0):
+        self.value = value
+        self.exception = exception
+        self.endpoint = endpoint
+        self.expires = expires
+
+    def expired(self, now: float = None) -> bool:
+        if now is None:
+            now = time.time()
+        return now >= self.expires
+
+    def servable(self, max_stale: float, now: float = None) -> bool:
+        """ 유효 시간이 지났더라도 `max_stale` 초 이내라면 반환할 수 있는 값인지 확인합니다."""
+        if now is None:
+            now = time.time()
+        return self.exception is None and now < self.expires + max_stale
+
+
+class SQLiteCacheStore:
+    """ SQLite 데이터베이스 파일에 캐시를 저장하는 2차 저장소입니다.
+    :class:`Cache` 와 :class:`VoteCache` 의 메모리 캐시 아래에서 동작하며, 프로세스를 재시작하더라도 저장된 응답을 다시 사용할 수 있습니다.
+    응답은 JSON으로 변환한 후 zlib으로 압축하여 저장합니다.
+
+    Parameters
+    ----------
+    path: str
+        SQLite 데이터베이스 파일의 경로 입니다.
+    max_bytes: Optional[int]
+        저장할 최대 용량(압축된 응답 기준, 바이트) 입니다. 기본값은 64MiB 입니다.
+        최대 용량을 넘으면 가장 먼저 만료되는 값부터 삭제합니다.
+    timeout: Optional[float]
+        다른 프로세스가 데이터베이스를 사용 중일 때 기다릴 최대 시간(초)입니다. 기본값은 5초 입니다.
+    evict_interval: Optional[int]
+        만료된 값과 최대 용량을 넘는 값을 삭제하는 주기(저장 횟수) 입니다. 기본값은 128번 입니다.
+    """
+    def __init__(self, path: str, max_bytes: int = 64 * 1024 * 1024, timeout: float = 5.0, evict_interval: int = 128):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.evict_interval = evict_interval
+
+        self._writes: int = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=timeout, isolation_level=None, check_same_thread=False)
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, "
+                "value BLOB, "
+                "size INTEGER, "
+                "expires REAL, "
+                "deadline REAL)"
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS cache_deadline ON cache (deadline)")
+
+    def close(self):
+        """ 데이터베이스 연결을 종료합니다."""
+        with self._lock:
+            self._connection.close()
+
+    @staticmethod
+    def encode(value: Any) -> bytes:
+        return zlib.compress(json.dumps(value, separators=(",", ":")).encode("utf-8"))
+
+    @staticmethod
+    def decode(value: bytes) -> Any:
+        return json.loads(zlib.decompress(value).decode("utf-8"))
+
+    def get(self, key: str) -> Optional[Tuple[Any, float]]:
+        """ 키 값에 해당하는 응답 값과 만료 시간을 불러옵니다. 값이 없거나 삭제될 시간이 지났다면 None을 반환합니다."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, expires FROM cache WHERE key = ? AND deadline > ?", (key, time.time())
+            ).fetchone()
+        if row is None:
+            return
+        return self.decode(row[0]), row[1]
+
+    def set(self, key: str, value: Any, expires: float, deadline: float = None):
+        """ 키 값에 응답 값을 저장합니다. 값은 `deadline` 까지 보관되며, 비어있을 경우 `expires` 를 사용합니다."""
+        if deadline is None:
+            deadline = expires
+        data = self.encode(value)
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO cache (key, value, size, expires, deadline) VALUES (?, ?, ?, ?, ?)",
+                (key, data, len(data), expires, deadline)
+            )
+            self._writes += 1
+            if self._writes % self.evict_interval == 0:
+                self._evict()
+
+    def delete(self, key: str):
+        """ 키 값에 해당하는 값을 삭제합니다."""
+        with self._lock:
+            self._connection.execute("DELETE FROM cache WHERE key = ?", (key, ))
+
+    def clear(self, prefix: str = None, exclude: Sequence[str] = ()):
+        """ 저장된 값을 삭제합니다.
+
+        Parameters
+        ----------
+        prefix: Optional[str]
+            `prefix` 로 시작하는 키 값만 삭제합니다. 기본값은 None이며, 모든 값을 삭제합니다.
+        exclude: Optional[Sequence[str]]
+            삭제하지 않을 키 값의 접두어 목록 입니다.
+        """
+        query = "DELETE FROM cache WHERE 1"
+        args = []
+        if prefix is not None:
+            query += " AND substr(key, 1, ?) = ?"
+            args += [len(prefix), prefix]
+        for value in exclude:
+            query += " AND substr(key, 1, ?) != ?"
+            args += [len(value), value]
+        with self._lock:
+            self._connection.execute(query, args)
+
+    def evict(self):
+        """ 만료된 값과 최대 용량을 넘는 값을 삭제합니다."""
+        with self._lock:
+            self._evict()
+
+    def _evict(self):
+        self._connection.execute("DELETE FROM cache WHERE deadline <= ?", (time.time(), ))
+
+        size = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM cache").fetchone()[0]
+        if size <= self.max_bytes:
+            return
+
+        # 가장 먼저 만료되는 값부터 최대 용량 이하가 될 때까지 삭제합니다.
+        rows = self._connection.execute("SELECT key, size FROM cache ORDER BY deadline").fetchall()
+        keys = []
+        for key, row_size in rows:
+            if size <= self.max_bytes:
+                break
+            keys.append((key, ))
+            size -= row_size
+        self._connection.executemany("DELETE FROM cache WHERE key = ?", keys)
+
+    def _run(self, func, *args):
+        try:
+            func(*args)
+        except (sqlite3.Error, TypeError, ValueError) as exception:
+            log.warning(f"Failed to write cache to {self.path}: {exception.__class__.__name__} {exception}")
+
+    def submit(self, func, *args):
+        """ 실행 중인 이벤트 루프의 Executor에서 `func` 를 실행합니다. 실행이 끝날 때까지 기다리지 않습니다."""
+        loop = asyncio.get_event_loop()
+        loop.run_in_executor(None, self._run, func, *args)
+
+    async def fetch(self, key: str) -> Optional[Tuple[Any, float]]:
+        """
+        본 함수는 코루틴(비동기)함수 입니다.
+
+        Executor에서 키 값에 해당하는 응답 값과 만료 시간을 불러옵니다.
+        """
+        loop = asyncio.get_event_loop()
+        try:
+            return await loop.run_in_executor(None, self.get, key)
+        except (sqlite3.Error, ValueError, zlib.error) as exception:
+            log.warning(f"Failed to load {key} from {self.path}: {exception.__class__.__name__} {exception}")
+
+
+class Cache:
+    """ KoreanBots 클라이언트, top.gg 클라이언트, UniqueBots 클라이언트의 응답을 메모리에 저장하는 캐시입니다.
+    최대 갯수를 넘으면 가장 오래 사용하지 않은 값부터 삭제(LRU)하며, 값의 종류(endpoint)마다 유효 시간(TTL)을 설정할 수 있습니다.
+
+    Parameters
+    ----------
+    max_size: Optional[int]
+        캐시에 저장할 최대 값의 갯수 입니다. 기본값은 1024개 입니다.
+    ttl: Optional[Dict[str, float]]
+        값의 종류(`bot`, `users` 등)별 유효 시간(초) 입니다. 설정하지 않은 종류는 `default_ttl` 을 사용합니다.
+    default_ttl: Optional[float]
+        기본 유효 시간(초) 입니다. 기본값은 300초(5분) 입니다.
+    negative_ttl: Optional[float]
+        값을 찾을 수 없었던(NotFound) 결과를 저장할 시간(초) 입니다. 기본값은 60초 입니다.
+        0으로 설정할 경우 NotFound 결과를 저장하지 않습니다.
+    jitter: Optional[float]
+        여러 값이 동시에 만료되지 않도록 유효 시간에 더해지는 무작위 비율 입니다. 기본값은 0.1(±10%) 입니다.
+    max_stale: Optional[float]
+        유효 시간이 지난 값을 계속 반환할 수 있는 최대 시간(초) 입니다. 기본값은 0이며, 만료된 값을 반환하지 않습니다.
+        0보다 큰 값으로 설정할 경우 만료된 값을 즉시 반환하고 백그라운드에서 새로운 값을 불러옵니다(stale-while-revalidate).
+        새로운 값을 불러오는 도중 오류가 발생하거나 사용량 제한에 걸리더라도, 최대 시간까지는 만료된 값을 계속 반환합니다.
+    store: Optional[SQLiteCacheStore]
+        메모리 캐시 아래에서 응답을 저장할 2차 저장소 입니다. 기본값은 None이며, 메모리에만 저장합니다.
+
+    Attributes
+    ------------
+    stats: CacheStats
+        캐시의 사용 통계 입니다.
+    """
+    DEFAULT_TTL: Dict[str, float] = {
+        "bot": 300.0,
+        "users": 600.0
+    }
+
+    def __init__(self,
+                 max_size: int = 1024,
+                 ttl: Dict[str, float] = None,
+                 default_ttl: float = 300.0,
+                 negative_ttl: float = 60.0,
+                 jitter: float = 0.1,
+                 max_stale: float = 0.0,
+                 store: SQLiteCacheStore = None):
+        self.max_size = max_size
+        self.ttl: Dict[str, float] = dict(self.DEFAULT_TTL)
+        if ttl is not None:
+            self.ttl.update(ttl)
+        self.default_ttl = default_ttl
+        self.negative_ttl = negative_ttl
+        self.jitter = jitter
+        self.max_stale = max_stale
+        self.store = store
+
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._revalidating: Dict[str, asyncio.Future] = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key: str):
+        entry = self._entries.get(key)
+        return entry is not None and not entry.expired()
+
+    def _expires(self, ttl: float) -> float:
+        if self.jitter:
+            ttl *= 1 + random.uniform(-self.jitter, self.jitter)
+        return time.time() + ttl
+
+    def get_ttl(self, endpoint: str = None) -> float:
+        """ 값의 종류에 해당하는 유효 시간(초)을 불러옵니다."""
+        return self.ttl.get(endpoint, self.default_ttl)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """ 키 값에 해당하는 캐시를 불러옵니다. 값이 없거나 만료되었다면 None을 반환합니다."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return
+
+        if entry.expired():
+            if not entry.servable(self.max_stale):
+                del self._entries[key]
+                self.stats.expirations += 1
+            self.stats.misses += 1
+            return
+
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return entry
+
+    def get_stale(self, key: str) -> Optional[CacheEntry]:
+        """ 유효 시간이 지났지만 `max_stale` 이내인 캐시를 불러옵니다. 반환할 수 있는 값이 없다면 None을 반환합니다."""
+        entry = self._entries.get(key)
+        if entry is None or not entry.expired() or not entry.servable(self.max_stale):
+            return
+        self._entries.move_to_end(key)
+        self.stats.stale += 1
+        return entry
+
+    def _put(self, key: str, entry: CacheEntry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def set(self, key: str, value: Any, endpoint: str = None, ttl: float = None):
+        """ 키 값에 응답 값을 저장합니다. `ttl` 이 비어있을 경우 값의 종류에 해당하는 유효 시간을 사용합니다."""
+        if ttl is None:
+            ttl = self.get_ttl(endpoint)
+        entry = CacheEntry(value=value, endpoint=endpoint, expires=self._expires(ttl))
+        self._put(key, entry)
+        if self.store is not None:
+            self.store.submit(self.store.set, key, value, entry.expires, entry.expires + self.max_stale)
+
+    def set_exception(self, key: str, exception: Exception, endpoint: str = None):
+        """ 값을 찾을 수 없었던 결과(NotFound)를 저장합니다."""
+        if not self.negative_ttl:
+            return
+        self._put(key, CacheEntry(exception=exception, endpoint=endpoint, expires=self._expires(self.negative_ttl)))
+
+    def invalidate(self, key: str):
+        """ 키 값에 해당하는 캐시를 삭제합니다."""
+        self._entries.pop(key, None)
+        if self.store is not None:
+            self.store.submit(self.store.delete, key)
+
+    def clear(self):
+        """ 모든 캐시를 삭제합니다. 2차 저장소(`store`)가 있다면 저장소의 응답도 함께 삭제하며,
+        같은 저장소를 사용하는 :class:`VoteCache` 와 :class:`DBSkr.VotePoller` 의 값은 삭제하지 않습니다."""
+        self._entries.clear()
+        if self.store is not None:
+            self.store.submit(self.store.clear, None, (VOTE_PREFIX, "poller:"))
+
+    async def fetch(self, key: str, func: Callable[[], Awaitable[Any]], endpoint: str = None) -> Any:
+        """
+        본 함수는 코루틴(비동기)함수 입니다.
+
+        캐시에 값이 있다면 저장된 값을 반환하고, 없다면 `func` 를 통하여 값을 불러온 후 저장합니다.
+        값을 찾을 수 없는 경우(NotFound)에는 예외도 함께 저장되어, 유효 시간 동안 같은 예외가 발생합니다.
+
+        Parameters
+        ----------
+        key: str
+            캐시를 구분하는 키 값 입니다.
+        func: Callable[[], Awaitable]
+            값을 불러오는 코루틴 함수 입니다.
+        endpoint: Optional[str]
+            값의 종류 입니다.
+        """
+        entry = self.get(key)
+        if entry is not None:
+            if entry.exception is not None:
+                raise entry.exception
+            return entry.value
+
+        if self.store is not None:
+            entry = await self._load(key, endpoint=endpoint)
+            if entry is not None and not entry.expired():
+                return entry.value
+
+        if self.max_stale:
+            entry = self.get_stale(key)
+            if entry is not None:
+                self.revalidate(key, func, endpoint=endpoint)
+                return entry.value
+
+        try:
+            value = await func()
+        except errors.NotFound as exception:
+            self.set_exception(key, exception, endpoint=endpoint)
+            raise
+        self.set(key, value, endpoint=endpoint)
+        return value
+
+    async def _load(self, key: str, endpoint: str = None) -> Optional[CacheEntry]:
+        result = await self.store.fetch(key)
+        if result is None:
+            return
+        value, expires = result
+        entry = CacheEntry(value=value, endpoint=endpoint, expires=expires)
+        self._put(key, entry)
+        return entry
+
+    def revalidate(self, key: str, func: Callable[[], Awaitable[Any]], endpoint: str = None) -> asyncio.Future:
+        """ 백그라운드에서 `func` 를 통하여 새로운 값을 불러와 캐시에 저장합니다.
+        같은 키 값에 대하여 이미 새로운 값을 불러오고 있다면, 진행 중인 작업을 반환합니다.
+        """
+        future = self._revalidating.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._revalidate(key, func, endpoint=endpoint))
+            self._revalidating[key] = future
+        return future
+
+    async def _revalidate(self, key: str, func: Callable[[], Awaitable[Any]], endpoint: str = None):
+        try:
+            value = await func()
+        except errors.NotFound as exception:
+            self.set_exception(key, exception, endpoint=endpoint)
+        except Exception as exception:
+            # 오류가 발생하거나 사용량 제한에 걸린 경우, 기존 값을 max_stale 까지 계속 반환합니다.
+            log.warning(f"Failed to revalidate {key}, serving stale data: {exception.__class__.__name__} {exception}")
+        else:
+            self.set(key, value, endpoint=endpoint)
+        finally:
+            self._revalidating.pop(key, None)
+
+
+class VoteCache:
+    """ 사용자의 투표(하트) 여부를 저장하는 캐시입니다.
+    투표 결과는 실제로 바뀔 수 있는 시점까지만 저장되며, 최대 갯수를 넘으면 가장 오래 사용하지 않은 값부터 삭제(LRU)합니다.
+
+    * 투표한 결과는 투표가 만료되는 시간까지 저장됩니다.
+      KoreanBots는 마지막으로 하트를 준 시간(`lastVote`)에 `window` 를 더한 시간을 사용합니다.
+      그 외 웹사이트는 투표하지 않은 결과를 마지막으로 확인한 시간에 `window` 를 더한 시간을 사용하며,
+      이를 알 수 없는 경우에는 `positive_ttl` 만큼 저장합니다.
+    * 투표하지 않은 결과는 언제든지 바뀔 수 있으므로 `negative_ttl` 만큼만 저장됩니다.
+
+    Parameters
+    ----------
+    max_size: Optional[int]
+        캐시에 저장할 최대 값의 갯수 입니다. 기본값은 4096개 입니다.
+    window: Optional[float]
+        투표가 유효한 시간(초) 입니다. 기본값은 43200초(12시간) 입니다.
+    positive_ttl: Optional[float]
+        투표한 시간을 알 수 없는 투표 결과를 저장할 시간(초) 입니다. 기본값은 300초(5분) 입니다.
+    negative_ttl: Optional[float]
+        투표하지 않은 결과를 저장할 시간(초) 입니다. 기본값은 60초 입니다.
+    store: Optional[SQLiteCacheStore]
+        메모리 캐시 아래에서 투표한 결과를 저장할 2차 저장소 입니다. 기본값은 None이며, 메모리에만 저장합니다.
+
+    Attributes
+    ------------
+    stats: CacheStats
+        캐시의 사용 통계 입니다.
+    """
+    def __init__(self,
+                 max_size: int = 4096,
+                 window: float = 43200.0,
+                 positive_ttl: float = 300.0,
+                 negative_ttl: float = 60.0,
+                 store: SQLiteCacheStore = None):
+        self.max_size = max_size
+        self.window = window
+        self.positive_ttl = positive_ttl
+        self.negative_ttl = negative_ttl
+        self.store = store
+
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._checked: "OrderedDict[str, float]" = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key: str):
+        entry = self._entries.get(key)
+        return entry is not None and not entry.expired()
+
+    @staticmethod
+    def key(web_type: str, bot_id: int, user_id: int) -> str:
+        """ 웹사이트, 봇 ID, 사용자 ID로 캐시의 키 값을 생성합니다."""
+        return "{0}{1}:{2}:{3}".format(VOTE_PREFIX, web_type, bot_id, user_id)
+
+    def get(self, web_type: str, bot_id: int, user_id: int) -> Optional[Any]:
+        """ 저장된 투표 정보를 불러옵니다. 값이 없거나 만료되었다면 None을 반환합니다."""
+        key = self.key(web_type, bot_id, user_id)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return
+
+        if entry.expired():
+            del self._entries[key]
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return
+
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return entry.value
+
+    async def load(self, web_type: str, bot_id: int, user_id: int) -> Optional[Any]:
+        """
+        본 함수는 코루틴(비동기)함수 입니다.
+
+        저장된 투표 정보를 불러옵니다. 메모리 캐시에 값이 없다면 2차 저장소에서 불러옵니다.
+        """
+        value = self.get(web_type, bot_id, user_id)
+        if value is not None or self.store is None:
+            return value
+
+        key = self.key(web_type, bot_id, user_id)
+        result = await self.store.fetch(key)
+        if result is None:
+            return
+        value, expires = result
+        self._put(key, CacheEntry(value=value, endpoint="vote", expires=expires))
+        return value
+
+    def _put(self, key: str, entry: CacheEntry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def _expires(self, key: str, voted: bool, last_vote: float = None, now: float = None) -> float:
+        if now is None:
+            now = time.time()
+
+        if not voted:
+            return now + self.negative_ttl
+
+        if last_vote is not None:
+            # 밀리초 단위의 Timestamp
+            if last_vote > 1e12:
+                last_vote /= 1000
+            return last_vote + self.window
+
+        # 마지막으로 투표하지 않은 것을 확인한 이후에 투표하였으므로, 그 시간부터 window 동안은 유효합니다.
+        checked = self._checked.get(key)
+        if checked is not None and checked + self.window > now:
+            return checked + self.window
+        return now + self.positive_ttl
+
+    def set(self, web_type: str, bot_id: int, user_id: int, value: Any, voted: bool, last_vote: float = None):
+        """ 투표 정보를 저장합니다.
+
+        Parameters
+        ----------
+        web_type: str
+            투표 정보를 불러온 웹사이트 입니다.
+        bot_id: int
+            봇 ID 값 입니다.
+        user_id: int
+            유저 ID 값 입니다.
+        value: Any
+            웹사이트로 부터 들어온 투표 정보 입니다.
+        voted: bool
+            투표 여부 입니다.
+        last_vote: Optional[float]
+            마지막으로 투표한 시간(Unix Timestamp) 입니다.
+        """
+        now = time.time()
+        key = self.key(web_type, bot_id, user_id)
+        expires = self._expires(key, voted, last_vote=last_vote, now=now)
+
+        if not voted:
+            self._checked[key] = now
+            self._checked.move_to_end(key)
+            while len(self._checked) > self.max_size:
+                self._checked.popitem(last=False)
+        else:
+            self._checked.pop(key, None)
+
+        if expires <= now:
+            self._entries.pop(key, None)
+            return
+
+        self._put(key, CacheEntry(value=value, endpoint="vote", expires=expires))
+        # 투표하지 않은 결과는 금방 바뀌므로 2차 저장소에 저장하지 않습니다.
+        if self.store is not None and voted:
+            self.store.submit(self.store.set, key, value, expires)
+
+    def invalidate(self, web_type: str, bot_id: int, user_id: int):
+        """ 저장된 투표 정보를 삭제합니다."""
+        key = self.key(web_type, bot_id, user_id)
+        self._entries.pop(key, None)
+        self._checked.pop(key, None)
+        if self.store is not None:
+            self.store.submit(self.store.delete, key)
+
+    def clear(self):
+        """ 모든 투표 정보를 삭제합니다. 2차 저장소(`store`)가 있다면 저장소의 투표 정보도 함께 삭제합니다."""
+        self._entries.clear()
+        self._checked.clear()
+        if self.store is not None:
+            self.store.submit(self.store.clear, VOTE_PREFIX)
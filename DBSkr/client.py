@@ -26,12 +26,16 @@ import logging
 import aiohttp
 import asyncio
 
-from typing import List
+from typing import Dict, Iterable, List
 
 from .https import HttpClient
 from .enums import WebsiteType
 from .models import *
-from .errors import ClientException, TooManyRequests
+from .errors import ClientException
+from .cache import Cache, VoteCache
+from .codec import JSONCodec
+from .ratelimit import RateLimitStore
+from .voters import VoterSet
 
 log = logging.getLogger(__name__)
 
@@ -65,6 +69,20 @@ class Client:
     autopost_interval: Optional[int]
         `autopost` 를 활성화하였을 때 작동하는 매개변수 입니다. 초단위로 주기를 설정합니다.
         기본값은 3600초(30분) 간격으로 설정됩니다. 만약 설정할 경우 무조건 900초(15분) 이상 설정해야합니다.
+    ratelimit_store: Optional[RateLimitStore]
+        사용량 제한 정보를 저장할 저장소 입니다. 기본값은 None이며, 프로세스 메모리에 저장합니다.
+        여러 프로세스(클러스터)가 사용량 제한 정보를 공유하려면 :class:`SQLiteRateLimitStore` 를 전달해주세요.
+    cache: Optional[Cache]
+        모든 웹사이트의 봇 정보와 사용자 정보를 저장할 캐시 입니다. 기본값은 None이며, 캐시를 사용하지 않습니다.
+    vote_cache: Optional[VoteCache]
+        모든 웹사이트의 사용자 투표 여부를 저장할 캐시 입니다. 기본값은 None이며, 캐시를 사용하지 않습니다.
+    keep_data: Optional[bool]
+        모델에 응답 값(`data`)을 보관할지 설정합니다. 기본값은 True 입니다.
+        False일 경우 모델을 만든 후 응답 값을 보관하지 않아 메모리를 적게 사용하며, 모델의 `data` 는 None 입니다.
+        아직 변환하지 않은 값(프로필 사진, 소유자 등)은 원본 중 필요한 값만 남겨두고 처음 접근할 때 변환합니다.
+    codec: Optional[JSONCodec]
+        응답 값과 요청 본문을 변환할 JSON 변환기 입니다. 기본값은 None이며, `orjson` 이 설치되어 있다면 `orjson` 을,
+        그렇지 않다면 파이썬 표준 라이브러리(`json`)를 사용합니다.
     """
     def __init__(self,
                  bot: discord.Client,
@@ -74,7 +92,12 @@ class Client:
                  session: aiohttp.ClientSession = None,
                  loop: asyncio.AbstractEventLoop = None,
                  autopost: bool = True,
-                 autopost_interval: int = 3600):
+                 autopost_interval: int = 3600,
+                 ratelimit_store: RateLimitStore = None,
+                 cache: Cache = None,
+                 vote_cache: VoteCache = None,
+                 keep_data: bool = True,
+                 codec: JSONCodec = None):
         self.koreanbots_token = koreanbots_token
         self.topgg_token = topgg_token
         self.uniquebots_token = uniquebots_token
@@ -83,7 +106,12 @@ class Client:
                                topgg_token=topgg_token,
                                uniquebots_token=uniquebots_token,
                                session=session,
-                               loop=loop)
+                               loop=loop,
+                               ratelimit_store=ratelimit_store,
+                               cache=cache,
+                               vote_cache=vote_cache,
+                               keep_data=keep_data,
+                               codec=codec)
 
         self.autopost = autopost
         self.autopost_interval: int = autopost_interval
@@ -107,17 +135,26 @@ class Client:
             if self.koreanbots_token == self.topgg_token == self.uniquebots_token is None:
                 return
             log.info('Autoposting guild count.')
-            try:
-                await self.stats()
-            except TooManyRequests:
-                pass
+            result = await self.stats()
+            for web_type, exception in result.exceptions.items():
+                log.warning(f"Failed autopost guild count to {web_type.value}. ({exception})")
             await asyncio.sleep(self.autopost_interval)
 
+    async def close(self):
+        """
+        본 함수는 코루틴(비동기)함수 입니다.
+
+        자동으로 길드 정보를 전송하는 작업을 중단하고, Http 클라이언트의 세션을 종료합니다.
+        """
+        if self.autopost:
+            self.autopost_task.cancel()
+        await self.http.close()
+
     def guild_count(self) -> int:
         """`discord.Client`의 .guilds 값에 있는 목록의 갯수를 읽어옵니다."""
         return len(self.client.guilds)
 
-    async def bot(self, bot_id: int = None, web_type: List[WebsiteType] = None) -> WebsiteBot:
+    async def bot(self, bot_id: int = None, web_type: List[WebsiteType] = None, timeout: float = None) -> WebsiteBot:
         """
         본 함수는 코루틴(비동기)함수 입니다.
 
@@ -130,6 +167,9 @@ class Client:
         web_type: Optional[list[WebsiteType]]
             값을 불러올 웹사이트를 선택하실 수 있습니다. 기본 값은 토큰 유/무에 따른 모든 웹클라이언트에 발송됩니다.
             배열 안에 있는 웹사이트 유형에 따라 일부 정보만 불러올 수 있습니다.
+        timeout: Optional[float]
+            웹사이트의 응답을 기다릴 최대 시간(초)입니다. 기본 값은 None이며, 모든 웹사이트의 응답을 기다립니다.
+            시간 내에 응답하지 않은 웹사이트는 결과 모델의 `timed_out` 목록에 포함되며, 응답한 웹사이트의 값만 반환됩니다.
         Returns
         -------
         WebsiteBot:
@@ -137,9 +177,12 @@ class Client:
         """
         if bot_id is None:
             bot_id = self.client.user.id
-        return await self.http.bot(bot_id=bot_id, web_type=web_type)
+        return await self.http.bot(bot_id=bot_id, web_type=web_type, timeout=timeout)
 
-    async def stats(self, guild_count: int = None, web_type: List[WebsiteType] = None) -> WebsiteStats:
+    async def stats(self,
+                    guild_count: int = None,
+                    web_type: List[WebsiteType] = None,
+                    timeout: float = None) -> WebsiteStats:
         """
         본 함수는 코루틴(비동기)함수 입니다.
 
@@ -157,6 +200,9 @@ class Client:
         web_type: Optional[list[WebsiteType]]
             값을 보낼 웹사이트를 선택하실 수 있습니다. 기본 값은 토큰 유/무에 따른 모든 웹클라이언트에 발송됩니다.
             배열 안에 있는 웹사이트 유형에 따라 일부 웹사이트에만 발송합니다.
+        timeout: Optional[float]
+            웹사이트의 응답을 기다릴 최대 시간(초)입니다. 기본 값은 None이며, 모든 웹사이트의 응답을 기다립니다.
+            시간 내에 응답하지 않은 웹사이트는 결과 모델의 `timed_out` 목록에 포함되며, 응답한 웹사이트의 값만 반환됩니다.
         Returns
         -------
         WebsiteStats:
@@ -164,9 +210,10 @@ class Client:
         """
         if guild_count is None:
             guild_count = self.guild_count()
-        return await self.http.stats(bot_id=self.client.user.id, guild_count=guild_count, web_type=web_type)
+        return await self.http.stats(bot_id=self.client.user.id, guild_count=guild_count,
+                                     web_type=web_type, timeout=timeout)
 
-    async def vote(self, user_id: int, web_type: List[WebsiteType] = None) -> WebsiteVote:
+    async def vote(self, user_id: int, web_type: List[WebsiteType] = None, timeout: float = None) -> WebsiteVote:
         """
         본 함수는 코루틴(비동기)함수 입니다.
 
@@ -179,15 +226,48 @@ class Client:
         web_type: Optional[list[WebsiteType]]
             값을 불러올 웹사이트를 선택하실 수 있습니다. 기본 값은 토큰 유/무에 따른 모든 웹클라이언트에 발송됩니다.
             배열 안에 있는 웹사이트 유형에 따라 일부 정보만 불러올 수 있습니다.
+        timeout: Optional[float]
+            웹사이트의 응답을 기다릴 최대 시간(초)입니다. 기본 값은 None이며, 모든 웹사이트의 응답을 기다립니다.
+            시간 내에 응답하지 않은 웹사이트는 결과 모델의 `timed_out` 목록에 포함되며, 응답한 웹사이트의 값만 반환됩니다.
 
         Returns
         -------
         WebsiteVote:
             웹사이트로 부터 들어온 사용자 투표 정보에 대한 정보가 포함되어 있습니다.
         """
-        return await self.http.vote(bot_id=self.client.user.id, user_id=user_id, web_type=web_type)
+        return await self.http.vote(bot_id=self.client.user.id, user_id=user_id, web_type=web_type, timeout=timeout)
+
+    async def vote_many(self, user_ids: Iterable[int],
+                        web_type: List[WebsiteType] = None,
+                        timeout: float = None,
+                        concurrency: int = 8) -> Dict[int, WebsiteVote]:
+        """
+        본 함수는 코루틴(비동기)함수 입니다.
+
+        `user_ids`에 들어있는 사용자들이 봇에 하트 혹은 투표를 누른 여부에 대하여 한 번에 불러옵니다.
+        중복된 사용자는 한 번만 불러오며, 캐시에 저장된 사용자는 API를 호출하지 않습니다.
+
+        Parameters
+        ----------
+        user_ids: Iterable[int]
+            유저 ID 값 목록이 포함되어 있습니다.
+        web_type: Optional[list[WebsiteType]]
+            값을 불러올 웹사이트를 선택하실 수 있습니다. 기본 값은 토큰 유/무에 따른 모든 웹클라이언트에 발송됩니다.
+            배열 안에 있는 웹사이트 유형에 따라 일부 정보만 불러올 수 있습니다.
+        timeout: Optional[float]
+            웹사이트의 응답을 기다릴 최대 시간(초)입니다. 기본 값은 None이며, 모든 웹사이트의 응답을 기다립니다.
+        concurrency: Optional[int]
+            웹사이트별로 동시에 보낼 최대 요청 갯수 입니다. 기본값은 8개 입니다.
+
+        Returns
+        -------
+        Dict[int, WebsiteVote]:
+            유저 ID 별로 웹사이트로 부터 들어온 사용자 투표 정보가 포함되어 있습니다.
+        """
+        return await self.http.vote_many(bot_id=self.client.user.id, user_ids=user_ids, web_type=web_type,
+                                         timeout=timeout, concurrency=concurrency)
 
-    async def votes(self, web_type: List[WebsiteType] = None) -> WebsiteVotes:
+    async def votes(self, web_type: List[WebsiteType] = None, timeout: float = None) -> WebsiteVotes:
         """
         본 함수는 코루틴(비동기)함수 입니다.
 
@@ -202,15 +282,38 @@ class Client:
         web_type: Optional[list[WebsiteType]]
             값을 불러올 웹사이트를 선택하실 수 있습니다. 기본 값은 토큰 유/무에 따른 모든 웹클라이언트에 발송됩니다.
             배열 안에 있는 웹사이트 유형에 따라 일부 정보만 불러올 수 있습니다.
+        timeout: Optional[float]
+            웹사이트의 응답을 기다릴 최대 시간(초)입니다. 기본 값은 None이며, 모든 웹사이트의 응답을 기다립니다.
+            시간 내에 응답하지 않은 웹사이트는 결과 모델의 `timed_out` 목록에 포함되며, 응답한 웹사이트의 값만 반환됩니다.
 
         Returns
         -------
         WebsiteVotes:
             웹사이트로 부터 들어온 봇 하트 정보가 포함되어 있습니다.
         """
-        return await self.http.votes(bot_id=self.client.user.id, web_type=web_type)
+        return await self.http.votes(bot_id=self.client.user.id, web_type=web_type, timeout=timeout)
+
+    async def voters(self, web_type: List[WebsiteType] = None, timeout: float = None) -> VoterSet:
+        """
+        본 함수는 코루틴(비동기)함수 입니다.
+
+        한 곳 이상의 웹사이트에서 하트 혹은 투표를 누른 사용자의 ID 목록을 :class:`VoterSet` 으로 불러옵니다.
+
+        Parameters
+        ----------
+        web_type: Optional[list[WebsiteType]]
+            값을 불러올 웹사이트를 선택하실 수 있습니다. 기본 값은 토큰 유/무에 따른 모든 웹클라이언트에 발송됩니다.
+        timeout: Optional[float]
+            웹사이트의 응답을 기다릴 최대 시간(초)입니다. 기본 값은 None이며, 모든 웹사이트의 응답을 기다립니다.
+
+        Returns
+        -------
+        VoterSet:
+            웹사이트로 부터 들어온 사용자의 ID 목록이 포함되어 있습니다.
+        """
+        return await self.http.voters(bot_id=self.client.user.id, web_type=web_type, timeout=timeout)
 
-    async def users(self, user_id: int, web_type: List[WebsiteType] = None) -> WebsiteUser:
+    async def users(self, user_id: int, web_type: List[WebsiteType] = None, timeout: float = None) -> WebsiteUser:
         """
         본 함수는 코루틴(비동기)함수 입니다.
 
@@ -223,10 +326,13 @@ class Client:
         web_type: Optional[list[WebsiteType]]
             값을 불러올 웹사이트를 선택하실 수 있습니다. 기본 값은 토큰 유/무에 따른 모든 웹클라이언트에 발송됩니다.
             배열 안에 있는 웹사이트 유형에 따라 일부 정보만 불러올 수 있습니다.
+        timeout: Optional[float]
+            웹사이트의 응답을 기다릴 최대 시간(초)입니다. 기본 값은 None이며, 모든 웹사이트의 응답을 기다립니다.
+            시간 내에 응답하지 않은 웹사이트는 결과 모델의 `timed_out` 목록에 포함되며, 응답한 웹사이트의 값만 반환됩니다.
 
         Returns
         -------
         WebsiteUser
             웹사이트로 부터 들어온 사용자 정보가 포함되어 있습니다.
         """
-        return await self.http.users(user_id=user_id, web_type=web_type)
+        return await self.http.users(user_id=user_id, web_type=web_type, timeout=timeout)
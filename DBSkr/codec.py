@@ -0,0 +1,93 @@
+"""MIT License
+
+Copyright (c) 2021 gunyu1019
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import aiohttp
+import json
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JSONCodec:
+    """ 요청 본문을 만들고 응답 값을 변환하는 JSON 변환기 입니다.
+    기본 변환기는 파이썬 표준 라이브러리(`json`)를 사용합니다.
+
+    다른 JSON 라이브러리를 사용하려면 이 클래스를 상속받아 :meth:`loads` 와 :meth:`dumps` 를 구현한 후,
+    Http 클라이언트의 `codec` 으로 전달해주세요.
+    """
+    #: 변환기의 이름 입니다.
+    name: str = "json"
+
+    def __repr__(self):
+        return "<{0.__class__.__name__} name={0.name}>".format(self)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """ JSON 문자열 혹은 UTF-8로 인코딩된 바이트를 변환합니다."""
+        return json.loads(data)
+
+    def dumps(self, value: Any) -> bytes:
+        """ 값을 UTF-8로 인코딩된 JSON 바이트로 변환합니다."""
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    async def read(self, response: aiohttp.ClientResponse) -> Any:
+        """
+        본 함수는 코루틴(비동기)함수 입니다.
+
+        응답 본문을 문자열로 바꾸지 않고 바이트 그대로 변환합니다. 응답 본문이 비어있다면 None을 반환합니다.
+        """
+        body = await response.read()
+        if not body.strip():
+            return None
+        return self.loads(body)
+
+
+class OrjsonCodec(JSONCodec):
+    """ `orjson <https://github.com/ijl/orjson>`_ 을 사용하는 JSON 변환기 입니다.
+    응답의 바이트를 문자열로 바꾸지 않고 바로 변환합니다.
+    """
+    name: str = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise RuntimeError("orjson is not installed")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+    def dumps(self, value: Any) -> bytes:
+        return orjson.dumps(value)
+
+
+_default: Optional[JSONCodec] = None
+
+
+def default_codec() -> JSONCodec:
+    """ 기본 JSON 변환기를 불러옵니다. `orjson` 이 설치되어 있다면 :class:`OrjsonCodec` 을,
+    그렇지 않다면 :class:`JSONCodec` 을 사용합니다."""
+    global _default
+    if _default is None:
+        _default = OrjsonCodec() if orjson is not None else JSONCodec()
+    return _default
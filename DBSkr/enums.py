@@ -22,13 +22,43 @@ SOFTWARE.
 """
 
 from enum import Enum
+from typing import Any, Dict, Optional
+
+_indexes: Dict[type, Optional[Dict[Any, Enum]]] = dict()
+
+
+def get_index(cls) -> Optional[Dict[Any, Enum]]:
+    """ 열거형의 값으로 멤버를 찾는 색인을 불러옵니다. 색인은 열거형마다 한 번만 만들어집니다.
+    해시할 수 없는 값을 가진 열거형은 색인을 만들지 않으며, None을 반환합니다."""
+    try:
+        return _indexes[cls]
+    except KeyError:
+        pass
+
+    index = dict()
+    try:
+        for member in cls:
+            # 같은 값을 가진 멤버가 있다면, 먼저 선언된 멤버를 사용합니다.
+            index.setdefault(member.value, member)
+    except TypeError:
+        index = None
+    _indexes[cls] = index
+    return index
 
 
 def get_value(cls, val):
-    enum_val = [i for i in cls if i.value == val]
-    if len(enum_val) == 0:
-        return val
-    return enum_val[0]
+    index = get_index(cls)
+    if index is not None:
+        try:
+            return index.get(val, val)
+        except TypeError:
+            # 해시할 수 없는 값은 아래에서 하나씩 비교합니다.
+            pass
+
+    for member in cls:
+        if member.value == val:
+            return member
+    return val
 
 
 class WebsiteType(Enum):
@@ -0,0 +1,80 @@
+"""MIT License
+
+Copyright (c) 2021 gunyu1019
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from typing import Any, Optional
+
+from .enums import WebsiteType
+
+
+class VoteEvent:
+    """ 웹훅(:class:`WebhookServer`) 혹은 투표 목록 확인(`poll`)을 통하여 들어온 투표 정보에 대한 값입니다.
+    `on_dbskr_vote` 이벤트를 통하여 전달되며, 투표를 받는 방법과 웹사이트에 관계없이 같은 형태로 전달됩니다.
+
+    .. code-block:: python3
+
+        @bot.event
+        async def on_dbskr_vote(event: DBSkr.VoteEvent):
+            ...
+
+    Attributes
+    ------------
+    web_type: WebsiteType
+        투표가 발생한 웹사이트 입니다.
+    bot_id: str
+        투표를 받은 디스코드 봇의 ID 입니다.
+    user_id: str
+        투표한 사용자의 ID 입니다.
+    vote: Union[koreanbots.Vote, topgg.VotedUser, uniquebots.User]
+        웹사이트별 투표 정보 입니다. 투표 목록 확인을 통하여 들어온 경우, top.gg는 :class:`topgg.VotedUser`,
+        UniqueBots는 :class:`uniquebots.User` 입니다.
+    is_test: bool
+        웹사이트에서 보낸 테스트 투표인지 여부 입니다.
+    is_weekend: bool
+        주말 투표(투표가 두 번으로 계산됨)인지 여부 입니다. top.gg만 해당됩니다.
+    query: Optional[str]
+        투표 페이지의 쿼리 값 입니다. top.gg만 해당됩니다.
+    data: Optional[dict]
+        웹훅 혹은 투표 목록으로 들어온 값 입니다. `keep_data` 를 사용하지 않는 경우 None 입니다.
+    """
+    def __init__(self,
+                 web_type: WebsiteType,
+                 bot_id: str,
+                 user_id: str,
+                 vote: Any,
+                 data: Optional[dict],
+                 is_test: bool = False,
+                 is_weekend: bool = False,
+                 query: str = None):
+        self.web_type = web_type
+        self.bot_id = bot_id
+        self.user_id = user_id
+        self.vote = vote
+        self.data = data
+        self.is_test = is_test
+        self.is_weekend = is_weekend
+        self.query = query
+
+    def __repr__(self):
+        return "<VoteEvent web_type={0.web_type} bot_id={0.bot_id} user_id={0.user_id} is_test={0.is_test}>".format(
+            self
+        )
@@ -23,14 +23,23 @@ SOFTWARE.
 
 import asyncio
 import aiohttp
-from typing import List
+import logging
+from typing import Any, Awaitable, Callable, Dict, Iterable, List
 
 from . import koreanbots
 from . import topgg
 from . import uniquebots
 
+from .bulk import unique
 from .models import *
 from .enums import WebsiteType
+from .cache import Cache, VoteCache
+from .codec import JSONCodec
+from .ratelimit import RateLimiter, RateLimitStore
+from .session import SessionManager
+from .voters import VoterSet
+
+log = logging.getLogger(__name__)
 
 
 class HttpClient:
@@ -53,29 +62,162 @@ class HttpClient:
         비동기를 사용하기 위한 asyncio.AbstractEventLoop 입니다.
         기본값은 None 입니다.
         기본 asyncio.AbstractEventLoop는 asyncio.get_event_loop()를 사용하여 얻습니다.
+    session_manager: Optional[SessionManager]
+        모든 웹사이트의 Http 클라이언트가 공유하는 SessionManager 입니다.
+        기본값은 None이며, `session` 값을 사용하는 SessionManager를 생성하게 됩니다.
+        커넥션 풀의 크기, DNS 캐시, Keep-Alive 시간을 조정하려면 직접 SessionManager를 생성하여 전달해주세요.
+    ratelimit_store: Optional[RateLimitStore]
+        사용량 제한 정보를 저장할 저장소 입니다. 기본값은 None이며, 프로세스 메모리에 저장합니다.
+        여러 프로세스(클러스터)가 사용량 제한 정보를 공유하려면 :class:`SQLiteRateLimitStore` 를 전달해주세요.
+    cache: Optional[Cache]
+        모든 웹사이트의 봇 정보와 사용자 정보를 저장할 캐시 입니다. 기본값은 None이며, 캐시를 사용하지 않습니다.
+    vote_cache: Optional[VoteCache]
+        모든 웹사이트의 사용자 투표 여부를 저장할 캐시 입니다. 기본값은 None이며, 캐시를 사용하지 않습니다.
+    keep_data: Optional[bool]
+        모델에 응답 값(`data`)을 보관할지 설정합니다. 기본값은 True 입니다.
+        False일 경우 모델을 만든 후 응답 값을 보관하지 않아 메모리를 적게 사용하며, 모델의 `data` 는 None 입니다.
+        아직 변환하지 않은 값(프로필 사진, 소유자 등)은 원본 중 필요한 값만 남겨두고 처음 접근할 때 변환합니다.
+    codec: Optional[JSONCodec]
+        응답 값과 요청 본문을 변환할 JSON 변환기 입니다. 기본값은 None이며, `orjson` 이 설치되어 있다면 `orjson` 을,
+        그렇지 않다면 파이썬 표준 라이브러리(`json`)를 사용합니다.
     """
     def __init__(self,
                  loop: asyncio.AbstractEventLoop = None,
                  session: aiohttp.ClientSession = None,
                  koreanbots_token: str = None,
                  topgg_token: str = None,
-                 uniquebots_token: str = None):
+                 uniquebots_token: str = None,
+                 session_manager: SessionManager = None,
+                 ratelimit_store: RateLimitStore = None,
+                 cache: Cache = None,
+                 vote_cache: VoteCache = None,
+                 keep_data: bool = True,
+                 codec: JSONCodec = None):
         self.loop = loop
         self.koreanbots_token = koreanbots_token
         self.topgg_token = topgg_token
         self.uniquebots_token = uniquebots_token
 
+        if session_manager is None:
+            session_manager = SessionManager(session=session)
+        self.session_manager = session_manager
+        self.ratelimit_store = ratelimit_store
+        self.cache = cache
+        self.vote_cache = vote_cache
+        self.keep_data = keep_data
+        self.codec = codec
+
         self.koreanbots_http = None
         self.topgg_http = None
         self.uniquebots_http = None
         if koreanbots_token is not None:
-            self.koreanbots_http = koreanbots.HttpClient(token=self.koreanbots_token, session=session, loop=loop)
+            self.koreanbots_http = koreanbots.HttpClient(token=self.koreanbots_token, session=session, loop=loop,
+                                                         session_manager=self.session_manager,
+                                                         ratelimit_store=self.ratelimit_store,
+                                                         cache=self.cache,
+                                                         vote_cache=self.vote_cache,
+                                                         keep_data=self.keep_data,
+                                                         codec=self.codec)
         if topgg_token is not None:
-            self.topgg_http = topgg.HttpClient(token=self.topgg_token, session=session, loop=loop)
+            self.topgg_http = topgg.HttpClient(token=self.topgg_token, session=session, loop=loop,
+                                               session_manager=self.session_manager,
+                                               ratelimit_store=self.ratelimit_store,
+                                               cache=self.cache,
+                                               vote_cache=self.vote_cache,
+                                               keep_data=self.keep_data,
+                                               codec=self.codec)
         if uniquebots_token is not None:
-            self.uniquebots_http = uniquebots.HttpClient(token=self.uniquebots_token, session=session, loop=loop)
+            self.uniquebots_http = uniquebots.HttpClient(token=self.uniquebots_token, session=session, loop=loop,
+                                                         session_manager=self.session_manager,
+                                                         ratelimit_store=self.ratelimit_store,
+                                                         cache=self.cache,
+                                                         vote_cache=self.vote_cache,
+                                                         keep_data=self.keep_data,
+                                                         codec=self.codec)
+
+    async def close(self):
+        """
+        본 함수는 코루틴(비동기)함수 입니다.
+
+        모든 웹사이트의 Http 클라이언트가 공유하는 세션을 종료합니다.
+        """
+        await self.session_manager.close()
+
+    def ratelimits(self) -> Dict[WebsiteType, RateLimiter]:
+        """ 활성화된 웹사이트의 경로별 사용량 제한 정보를 불러옵니다."""
+        result = dict()
+        for site in [WebsiteType.koreanbots, WebsiteType.topgg, WebsiteType.uniquebots]:
+            http = self._get_http(site)
+            if http is not None:
+                result[site] = http.ratelimit
+        return result
+
+    def _get_http(self, web_type: WebsiteType):
+        if web_type == WebsiteType.koreanbots:
+            return self.koreanbots_http
+        elif web_type == WebsiteType.topgg:
+            return self.topgg_http
+        elif web_type == WebsiteType.uniquebots:
+            return self.uniquebots_http
+        return
+
+    async def _gather(self,
+                      func: Callable[[Any], Awaitable],
+                      web_type: List[WebsiteType] = None,
+                      support_type: List[WebsiteType] = None,
+                      timeout: float = None) -> Dict[str, Any]:
+        """
+        본 함수는 코루틴(비동기)함수 입니다.
 
-    async def bot(self, bot_id: int, web_type: List[WebsiteType] = None):
+        각 웹사이트의 Http 클라이언트에 `func`를 동시에 요청한 후, 결과 값과 예외를 웹사이트별로 나누어 반환합니다.
+        한 웹사이트에서 예외가 발생하더라도 다른 웹사이트의 결과 값은 그대로 반환됩니다.
+        `timeout`(초)이 지나도록 응답하지 않은 웹사이트의 요청은 취소되며, `timed_out` 목록에 포함됩니다.
+        """
+        if web_type is None:
+            web_type = [WebsiteType.koreanbots, WebsiteType.topgg, WebsiteType.uniquebots]
+        if support_type is None:
+            support_type = [WebsiteType.koreanbots, WebsiteType.topgg, WebsiteType.uniquebots]
+
+        tasks = dict()
+        for site in support_type:
+            http = self._get_http(site)
+            if http is None or site not in web_type:
+                continue
+            tasks[site] = asyncio.ensure_future(func(http))
+
+        results = dict()
+        exceptions = dict()
+        timed_out = list()
+        pending = list()
+        if len(tasks) != 0:
+            try:
+                await asyncio.wait(tasks.values(), timeout=timeout)
+            finally:
+                # 시간이 초과되었거나 호출한 쪽이 취소된 경우, 남은 요청이 계속 실행되지 않도록 모두 취소합니다.
+                pending = [task for task in tasks.values() if not task.done()]
+                for task in pending:
+                    task.cancel()
+                if len(pending) != 0:
+                    await asyncio.gather(*pending, return_exceptions=True)
+
+        for site, task in tasks.items():
+            if task in pending:
+                log.warning(f"Request to {site.value} timed out after {timeout} seconds")
+                timed_out.append(site)
+                continue
+
+            exception = task.exception()
+            if exception is not None:
+                log.warning(f"Failed to request {site.value}: {exception.__class__.__name__} {exception}")
+                exceptions[site] = exception
+            else:
+                results[site.value] = task.result()
+
+        results['exceptions'] = exceptions
+        results['timed_out'] = timed_out
+        return results
+
+    async def bot(self, bot_id: int, web_type: List[WebsiteType] = None, timeout: float = None):
         """
         본 함수는 코루틴(비동기)함수 입니다.
 
@@ -88,45 +230,26 @@ class HttpClient:
         web_type: Optional[list[WebsiteType]]
             값을 불러올 웹사이트를 선택하실 수 있습니다. 기본 값은 토큰 유/무에 따른 모든 웹클라이언트에 발송됩니다.
             배열 안에 있는 웹사이트 유형에 따라 일부 정보만 불러올 수 있습니다.
+        timeout: Optional[float]
+            웹사이트의 응답을 기다릴 최대 시간(초)입니다. 기본 값은 None이며, 모든 웹사이트의 응답을 기다립니다.
+            시간 내에 응답하지 않은 웹사이트는 결과 모델의 `timed_out` 목록에 포함되며, 응답한 웹사이트의 값만 반환됩니다.
         Returns
         -------
         WebsiteBot:
             웹사이트로 부터 들어온 봇 정보가 포함되어 있습니다.
         """
-        if web_type is None:
-            web_type = [WebsiteType.koreanbots, WebsiteType.topgg, WebsiteType.uniquebots]
-        kbots = None
-        tbots = None
-        ubots = None
-
-        if self.koreanbots_http is not None and self.koreanbots_token is not None \
-                and WebsiteType.koreanbots in web_type:
-            kbots = await self.koreanbots_http.bot(bot_id=bot_id)
-        if self.topgg_http is not None and self.topgg_token is not None and WebsiteType.topgg in web_type:
-            tbots = await self.topgg_http.bot(bot_id=bot_id)
-        if self.uniquebots_http is not None and self.uniquebots_token is not None \
-                and WebsiteType.uniquebots in web_type:
-            ubots = await self.uniquebots_http.bot(bot_id=bot_id)
-        return WebsiteBot(koreanbots=kbots, topgg=tbots, uniquebots=ubots)
-
-    async def stats(self, bot_id: int, guild_count: int, web_type: List[WebsiteType] = None):
-        if web_type is None:
-            web_type = [WebsiteType.koreanbots, WebsiteType.topgg, WebsiteType.uniquebots]
-        kbots = None
-        tbots = None
-        ubots = None
-
-        if self.koreanbots_http is not None and self.koreanbots_token is not None \
-                and WebsiteType.koreanbots in web_type:
-            kbots = await self.koreanbots_http.stats(bot_id=bot_id, guild_count=guild_count)
-        if self.topgg_http is not None and self.topgg_token is not None and WebsiteType.topgg in web_type:
-            tbots = await self.topgg_http.stats(bot_id=bot_id, guild_count=guild_count)
-        if self.uniquebots_http is not None and self.uniquebots_token is not None \
-                and WebsiteType.uniquebots in web_type:
-            ubots = await self.uniquebots_http.stats(bot_id=bot_id, guild_count=guild_count)
-        return WebsiteStats(koreanbots=kbots, topgg=tbots, uniquebots=ubots)
-
-    async def vote(self, bot_id: int, user_id: int, web_type: List[WebsiteType] = None):
+        results = await self._gather(lambda http: http.bot(bot_id=bot_id),
+                                     web_type=web_type,
+                                     timeout=timeout)
+        return WebsiteBot(**results)
+
+    async def stats(self, bot_id: int, guild_count: int, web_type: List[WebsiteType] = None, timeout: float = None):
+        results = await self._gather(lambda http: http.stats(bot_id=bot_id, guild_count=guild_count),
+                                     web_type=web_type,
+                                     timeout=timeout)
+        return WebsiteStats(**results)
+
+    async def vote(self, bot_id: int, user_id: int, web_type: List[WebsiteType] = None, timeout: float = None):
         """
         본 함수는 코루틴(비동기)함수 입니다.
 
@@ -141,29 +264,73 @@ class HttpClient:
         web_type: Optional[List[WebsiteType]]
             값을 불러올 웹사이트를 선택하실 수 있습니다. 기본 값은 토큰 유/무에 따른 모든 웹클라이언트에 발송됩니다.
             배열 안에 있는 웹사이트 유형에 따라 일부 정보만 불러올 수 있습니다.
+        timeout: Optional[float]
+            웹사이트의 응답을 기다릴 최대 시간(초)입니다. 기본 값은 None이며, 모든 웹사이트의 응답을 기다립니다.
+            시간 내에 응답하지 않은 웹사이트는 결과 모델의 `timed_out` 목록에 포함되며, 응답한 웹사이트의 값만 반환됩니다.
 
         Returns
         -------
         WebsiteVote:
             웹사이트로 부터 들어온 사용자 투표 정보에 대한 정보가 포함되어 있습니다.
         """
-        if web_type is None:
-            web_type = [WebsiteType.koreanbots, WebsiteType.topgg, WebsiteType.uniquebots]
-        kbots = None
-        tbots = None
-        ubots = None
-
-        if self.koreanbots_http is not None and self.koreanbots_token is not None \
-                and WebsiteType.koreanbots in web_type:
-            kbots = await self.koreanbots_http.vote(bot_id=bot_id, user_id=user_id)
-        if self.topgg_http is not None and self.topgg_token is not None and WebsiteType.topgg in web_type:
-            tbots = await self.topgg_http.vote(bot_id=bot_id, user_id=user_id)
-        if self.uniquebots_http is not None and self.uniquebots_token is not None \
-                and WebsiteType.uniquebots in web_type:
-            ubots = await self.uniquebots_http.vote(bot_id=bot_id, user_id=user_id)
-        return WebsiteVote(koreanbots=kbots, topgg=tbots, uniquebots=ubots)
-
-    async def votes(self, bot_id: int, web_type: List[WebsiteType] = None):
+        results = await self._gather(lambda http: http.vote(bot_id=bot_id, user_id=user_id),
+                                     web_type=web_type,
+                                     timeout=timeout)
+        return WebsiteVote(**results)
+
+    async def vote_many(self, bot_id: int, user_ids: Iterable[int],
+                        web_type: List[WebsiteType] = None,
+                        timeout: float = None,
+                        concurrency: int = 8) -> Dict[int, WebsiteVote]:
+        """
+        본 함수는 코루틴(비동기)함수 입니다.
+
+        `user_ids`에 들어있는 사용자들이 봇에 하트 혹은 투표를 누른 여부에 대하여 한 번에 불러옵니다.
+        중복된 사용자는 한 번만 불러오며, 캐시에 저장된 사용자는 API를 호출하지 않습니다.
+
+        Parameters
+        ----------
+        bot_id: int
+            봇 ID 값이 포함됩니다.
+        user_ids: Iterable[int]
+            유저 ID 값 목록이 포함되어 있습니다.
+        web_type: Optional[List[WebsiteType]]
+            값을 불러올 웹사이트를 선택하실 수 있습니다. 기본 값은 토큰 유/무에 따른 모든 웹클라이언트에 발송됩니다.
+            배열 안에 있는 웹사이트 유형에 따라 일부 정보만 불러올 수 있습니다.
+        timeout: Optional[float]
+            웹사이트의 응답을 기다릴 최대 시간(초)입니다. 기본 값은 None이며, 모든 웹사이트의 응답을 기다립니다.
+            시간 내에 응답하지 않은 웹사이트는 모든 사용자의 `timed_out` 목록에 포함됩니다.
+        concurrency: Optional[int]
+            웹사이트별로 동시에 보낼 최대 요청 갯수 입니다. 기본값은 8개 입니다.
+
+        Returns
+        -------
+        Dict[int, WebsiteVote]:
+            유저 ID 별로 웹사이트로 부터 들어온 사용자 투표 정보가 포함되어 있습니다.
+            특정 사용자에 대하여 발생한 예외는 해당 사용자의 `exceptions` 에 포함됩니다.
+        """
+        user_ids = unique(user_ids)
+        results = await self._gather(lambda http: http.vote_many(bot_id=bot_id, user_ids=user_ids,
+                                                                 concurrency=concurrency, return_exceptions=True),
+                                     web_type=web_type,
+                                     timeout=timeout)
+
+        votes = dict()
+        for user_id in user_ids:
+            data = dict()
+            exceptions = dict(results['exceptions'])
+            for site in [WebsiteType.koreanbots, WebsiteType.topgg, WebsiteType.uniquebots]:
+                if site.value not in results:
+                    continue
+                vote = results[site.value].get(user_id)
+                if isinstance(vote, Exception):
+                    exceptions[site] = vote
+                    continue
+                data[site.value] = vote
+            votes[user_id] = WebsiteVote(**data, exceptions=exceptions, timed_out=list(results['timed_out']))
+        return votes
+
+    async def votes(self, bot_id: int, web_type: List[WebsiteType] = None, timeout: float = None):
         """
         본 함수는 코루틴(비동기)함수 입니다.
 
@@ -180,26 +347,62 @@ class HttpClient:
         web_type: Optional[List[WebsiteType]]
             값을 불러올 웹사이트를 선택하실 수 있습니다. 기본 값은 토큰 유/무에 따른 모든 웹클라이언트에 발송됩니다.
             배열 안에 있는 웹사이트 유형에 따라 일부 정보만 불러올 수 있습니다.
+        timeout: Optional[float]
+            웹사이트의 응답을 기다릴 최대 시간(초)입니다. 기본 값은 None이며, 모든 웹사이트의 응답을 기다립니다.
+            시간 내에 응답하지 않은 웹사이트는 결과 모델의 `timed_out` 목록에 포함되며, 응답한 웹사이트의 값만 반환됩니다.
 
         Returns
         -------
         WebsiteVotes:
             웹사이트로 부터 들어온 봇 하트 정보가 포함되어 있습니다.
         """
-        if web_type is None:
-            web_type = [WebsiteType.koreanbots, WebsiteType.topgg, WebsiteType.uniquebots]
-        tbots = None
-        ubots = None
+        results = await self._gather(lambda http: http.votes(bot_id=bot_id),
+                                     web_type=web_type,
+                                     support_type=[WebsiteType.topgg, WebsiteType.uniquebots],
+                                     timeout=timeout)
+        return WebsiteVotes(**results)
+
+    async def voters(self, bot_id: int, web_type: List[WebsiteType] = None, timeout: float = None) -> VoterSet:
+        """
+        본 함수는 코루틴(비동기)함수 입니다.
 
-        if self.topgg_http is not None and self.topgg_token is not None \
-                and WebsiteType.topgg in web_type:
-            tbots = await self.topgg_http.votes(bot_id=bot_id)
-        if self.uniquebots_http is not None and self.uniquebots_token is not None \
-                and WebsiteType.uniquebots in web_type:
-            ubots = await self.uniquebots_http.votes(bot_id=bot_id)
-        return WebsiteVotes(topgg=tbots, uniquebots=ubots)
+        한 곳 이상의 웹사이트에서 하트 혹은 투표를 누른 사용자의 ID 목록을 :class:`VoterSet` 으로 불러옵니다.
+        사용자 정보는 :meth:`VoterSet.get` 혹은 :meth:`VoterSet.materialize` 로 불러오며, :meth:`users` 의 결과가 반환됩니다.
 
-    async def users(self, user_id: int, web_type: List[WebsiteType] = None):
+        Notes
+        -----
+        koreanbots 에서는 사용자 하트 목록을 불러오지 못합니다. topgg 혹은 uniquebots 에서만 불러옵니다.
+
+        Parameters
+        ----------
+        bot_id: int
+            봇 ID 값이 포함됩니다.
+        web_type: Optional[List[WebsiteType]]
+            값을 불러올 웹사이트를 선택하실 수 있습니다. 기본 값은 토큰 유/무에 따른 모든 웹클라이언트에 발송됩니다.
+        timeout: Optional[float]
+            웹사이트의 응답을 기다릴 최대 시간(초)입니다. 기본 값은 None이며, 모든 웹사이트의 응답을 기다립니다.
+            시간 내에 응답하지 않았거나 예외가 발생한 웹사이트의 사용자는 포함되지 않습니다.
+
+        Returns
+        -------
+        VoterSet:
+            웹사이트로 부터 들어온 사용자의 ID 목록이 포함되어 있습니다.
+        """
+        results = await self._gather(lambda http: http.voters(bot_id=bot_id),
+                                     web_type=web_type,
+                                     support_type=[WebsiteType.topgg, WebsiteType.uniquebots],
+                                     timeout=timeout)
+
+        async def loader(user_id: int) -> WebsiteUser:
+            return await self.users(user_id=user_id, web_type=web_type, timeout=timeout)
+
+        voters = VoterSet(loader=loader)
+        for site in [WebsiteType.topgg, WebsiteType.uniquebots]:
+            if site.value in results:
+                voters.update(results[site.value])
+        return voters
+
+    async def users(self, user_id: int, web_type: List[WebsiteType] = None, timeout: float = None):
         """
         본 함수는 코루틴(비동기)함수 입니다.
 
@@ -212,24 +415,16 @@ class HttpClient:
         web_type: Optional[list[WebsiteType]]
             값을 불러올 웹사이트를 선택하실 수 있습니다. 기본 값은 토큰 유/무에 따른 모든 웹클라이언트에 발송됩니다.
             배열 안에 있는 웹사이트 유형에 따라 일부 정보만 불러올 수 있습니다.
+        timeout: Optional[float]
+            웹사이트의 응답을 기다릴 최대 시간(초)입니다. 기본 값은 None이며, 모든 웹사이트의 응답을 기다립니다.
+            시간 내에 응답하지 않은 웹사이트는 결과 모델의 `timed_out` 목록에 포함되며, 응답한 웹사이트의 값만 반환됩니다.
 
         Returns
         -------
         WebsiteUser
             웹사이트로 부터 들어온 사용자 정보가 포함되어 있습니다.
         """
-        if web_type is None:
-            web_type = [WebsiteType.koreanbots, WebsiteType.topgg, WebsiteType.uniquebots]
-        kbots = None
-        tbots = None
-        ubots = None
-
-        if self.koreanbots_http is not None and self.koreanbots_token is not None \
-                and WebsiteType.koreanbots in web_type:
-            kbots = await self.koreanbots_http.users(user_id=user_id)
-        if self.topgg_http is not None and self.topgg_token is not None and WebsiteType.topgg in web_type:
-            tbots = await self.topgg_http.users(user_id=user_id)
-        if self.uniquebots_http is not None and self.uniquebots_token is not None \
-                and WebsiteType.uniquebots in web_type:
-            ubots = await self.uniquebots_http.users(user_id=user_id)
-        return WebsiteUser(koreanbots=kbots, topgg=tbots, uniquebots=ubots)
+        results = await self._gather(lambda http: http.users(user_id=user_id),
+                                     web_type=web_type,
+                                     timeout=timeout)
+        return WebsiteUser(**results)
@@ -23,13 +23,14 @@ SOFTWARE.
 
 import aiohttp
 import asyncio
-import json
-import time
 import logging
 
-from datetime import datetime
-
 from .errors import *
+from ..cache import Cache
+from ..codec import JSONCodec, default_codec
+from ..ratelimit import RateLimiter, RateLimitStore
+from ..session import SessionManager
+from ..singleflight import SingleFlight, request_key, request_params
 
 log = logging.getLogger(__name__)
 
@@ -40,39 +41,54 @@ class Api:
                  version: int = 2,
                  session: aiohttp.ClientSession = None,
                  loop: asyncio.AbstractEventLoop = None,
-                 refresh_session: int = 300):
+                 session_manager: SessionManager = None,
+                 ratelimit_store: RateLimitStore = None,
+                 cache: Cache = None,
+                 codec: JSONCodec = None):
         self.BASE = "https://koreanbots.dev/api"
         self.token = token
         self.version = version
         self.loop = loop
-        if session is not None:
-            self.session = session
-        else:
-            self.session = aiohttp.ClientSession(loop=self.loop)
-
-        self._session_start = time.time()
-        self.refresh_session_period = refresh_session
+        if session_manager is None:
+            session_manager = SessionManager(session=session)
+        self.session_manager = session_manager
+        self.ratelimit = RateLimiter(name="koreanbots", store=ratelimit_store)
+        self.flight = SingleFlight()
+        self.cache = cache
+        self.codec = codec or default_codec()
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        return self.session_manager.session
 
     async def close(self):
-        await self.session.close()
-
-    async def refresh_session(self):
-        await self.session.close()
-        self.session = aiohttp.ClientSession(loop=self.loop)
-        self._session_start = time.time()
+        await self.session_manager.close()
 
-    async def get_session(self):
-        if not self.session:
-            await self.refresh_session()
-        elif 0 <= self.refresh_session_period <= time.time() - self._session_start:
-            await self.refresh_session()
-        return self.session
+    async def get_session(self) -> aiohttp.ClientSession:
+        return await self.session_manager.get_session()
 
-    async def requests(self, method: str, path: str, **kwargs):
+    def url(self, path: str) -> str:
         if self.version is None:
-            url = "{}{}".format(self.BASE, path)
-        else:
-            url = "{}/v{}{}".format(self.BASE, self.version, path)
+            return "{}{}".format(self.BASE, path)
+        return "{}/v{}{}".format(self.BASE, self.version, path)
+
+    async def requests(self, method: str, path: str, endpoint: str = None, **kwargs):
+        url = self.url(path)
+        if 'params' in kwargs:
+            kwargs['params'] = request_params(kwargs['params'])
+
+        if method.upper() != "GET":
+            return await self._requests(method, url, path, **kwargs)
+
+        # 같은 GET 요청이 동시에 들어오면 하나의 요청으로 처리합니다.
+        key = request_key(method, url, kwargs.get('params'))
+        if self.cache is not None and endpoint is not None:
+            return await self.cache.fetch(
+                key, lambda: self.flight.do(key, lambda: self._requests(method, url, path, **kwargs)), endpoint=endpoint
+            )
+        return await self.flight.do(key, lambda: self._requests(method, url, path, **kwargs))
+
+    async def _requests(self, method: str, url: str, path: str, **kwargs):
         headers = {
             'Content-Type': 'application/json'
         }
@@ -83,27 +99,21 @@ class Api:
             kwargs['headers'].update(headers)
         else:
             kwargs['headers'] = headers
+        if 'json' in kwargs:
+            kwargs['data'] = self.codec.dumps(kwargs.pop('json'))
 
+        route = self.ratelimit.route(method, path)
         for tries in range(5):
+            await self.ratelimit.acquire(route)
             session = await self.get_session()
             async with session.request(method, url, **kwargs) as response:
-                if response.content_type == "application/json":
-                    data = await response.json()
-                else:
-                    fp_data = await response.text()
-                    data = json.loads(fp_data)
+                data = await self.codec.read(response)
                 log.debug(f'{method} {url} returned {response.status}')
 
-                remain_remaining = response.headers.get('x-ratelimit-remaining')
-                remain_limit = response.headers.get('x-ratelimit-limit')
-                if remain_remaining == 0 or response.status == 429:
-                    _remain_limit = int(response.headers.get('x-ratelimit-reset'))
-                    reset_limit = datetime.fromtimestamp(_remain_limit)
-
-                    retry_after = reset_limit - datetime.now()
-                    log.warning(f"Rate limited. Retry in {retry_after.total_seconds()} seconds"
-                                f" (Current: {remain_remaining}/Maximum: {remain_limit}) | Tries: {tries}")
-                    await asyncio.sleep(retry_after.total_seconds())
+                bucket = await self.ratelimit.update(route, response.headers, response.status)
+                if response.status == 429:
+                    log.warning(f"Rate limited. Retry in {bucket.delay():.2f} seconds"
+                                f" (Current: {bucket.remaining}/Maximum: {bucket.limit}) | Tries: {tries}")
                     continue
 
                 if 200 <= response.status < 300:
@@ -24,6 +24,7 @@ import asyncio
 import aiohttp
 import logging
 import discord
+from typing import AsyncIterator
 
 from .enums import WidgetType, WidgetStyle
 from .errors import *
@@ -59,6 +60,10 @@ class Client:
     autopost_interval: Optional[int]
         `autopost` 를 활성화하였을 때 작동하는 매개변수 입니다. 초단위로 주기를 설정합니다.
         기본값은 3600초(30분) 간격으로 설정됩니다. 만약 설정할 경우 무조건 180초(3분) 이상 설정해야합니다.
+    keep_data: Optional[bool]
+        모델에 응답 값(`data`)을 보관할지 설정합니다. 기본값은 True 입니다.
+        False일 경우 모델을 만든 후 응답 값을 보관하지 않아 메모리를 적게 사용하며, 모델의 `data` 는 None 입니다.
+        아직 변환하지 않은 값(프로필 사진, 소유자 등)은 원본 중 필요한 값만 남겨두고 처음 접근할 때 변환합니다.
     """
     def __init__(self,
                  bot: discord.Client,
@@ -66,12 +71,13 @@ class Client:
                  session: aiohttp.ClientSession = None,
                  loop: asyncio.AbstractEventLoop = None,
                  autopost: bool = True,
-                 autopost_interval: int = 3600):
+                 autopost_interval: int = 3600,
+                 keep_data: bool = True):
         self.token = token
         self.client = bot
 
         self.loop = loop or self.client.loop
-        self.http = HttpClient(token=token, session=session, loop=self.loop)
+        self.http = HttpClient(token=token, session=session, loop=self.loop, keep_data=keep_data)
 
         self.autopost = autopost
         self.autopost_interval: int = autopost_interval
@@ -199,6 +205,50 @@ class Client:
         """
         return await self.http.votes(page=page)
 
+    def iter_search(self, query: str, limit: int = None, prefetch: int = 1, start: int = 1) -> AsyncIterator[Bot]:
+        """
+        KoreanBots에서 봇을 검색한 결과를 모든 페이지에 걸쳐 하나씩 불러옵니다.
+        현재 페이지를 처리하는 동안 다음 페이지를 미리 불러오며, 중간에 반복을 멈추면 남은 요청은 취소됩니다.
+
+        Parameters
+        ----------
+        query: str
+            검색할 내용이 포함됩니다.
+        limit: Optional[int]
+            불러올 최대 봇 수 입니다. 기본값은 None이며, 마지막 페이지까지 불러옵니다.
+        prefetch: Optional[int]
+            미리 불러올 최대 페이지 수 입니다. 기본값은 1 입니다.
+        start: Optional[int]
+            처음 불러올 페이지 입니다. 기본값은 1 입니다.
+
+        Returns
+        -------
+        AsyncIterator[Bot]:
+            KoreanBots로 부터 들어온 봇 정보가 포함되어 있습니다.
+        """
+        return self.http.iter_search(query=query, limit=limit, prefetch=prefetch, start=start)
+
+    def iter_votes(self, limit: int = None, prefetch: int = 1, start: int = 1) -> AsyncIterator[Bot]:
+        """
+        하트 수가 많은 순으로 디스코드 봇을 모든 페이지에 걸쳐 하나씩 불러옵니다.
+        현재 페이지를 처리하는 동안 다음 페이지를 미리 불러오며, 중간에 반복을 멈추면 남은 요청은 취소됩니다.
+
+        Parameters
+        ----------
+        limit: Optional[int]
+            불러올 최대 봇 수 입니다. 기본값은 None이며, 마지막 페이지까지 불러옵니다.
+        prefetch: Optional[int]
+            미리 불러올 최대 페이지 수 입니다. 기본값은 1 입니다.
+        start: Optional[int]
+            처음 불러올 페이지 입니다. 기본값은 1 입니다.
+
+        Returns
+        -------
+        AsyncIterator[Bot]:
+            KoreanBots로 부터 들어온 봇 정보가 포함되어 있습니다.
+        """
+        return self.http.iter_votes(limit=limit, prefetch=prefetch, start=start)
+
     async def new(self) -> Bots:
         """
         본 함수는 코루틴(비동기)함수 입니다.
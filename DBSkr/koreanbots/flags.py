@@ -26,12 +26,16 @@ from .enums import BotFlag, UserFlag
 
 class BaseFlag:
     """ KoreanBots의 모든 Flag 값의 베이스 모델입니다."""
+    __slots__ = ("value", )
+
     def __init__(self, data: int):
         self.value = data
 
 
 class BotFlagModel(BaseFlag):
     """ KoreanBots에 등록된 디스코드 봇의 Flag 값입니다."""
+    __slots__ = ("flags", )
+
     def __init__(self, data):
         super().__init__(data)
 
@@ -72,6 +76,8 @@ class BotFlagModel(BaseFlag):
 
 class UserFlagModel(BaseFlag):
     """ KoreanBots에 있는 사용자의 Flag 값입니다."""
+    __slots__ = ("flags", )
+
     def __init__(self, data):
         super().__init__(data)
 
@@ -21,6 +21,7 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 import asyncio
+from typing import AsyncIterator, Dict, Iterable
 
 import aiohttp
 
@@ -28,6 +29,11 @@ from .api import Api
 from .models import Bot, Vote, Bots, Stats, User
 from .enums import WidgetType, WidgetStyle
 from .widget import Widget
+from ..bulk import gather_map, iter_pages
+from ..cache import Cache, VoteCache
+from ..codec import JSONCodec
+from ..ratelimit import RateLimiter, RateLimitStore
+from ..session import SessionManager
 
 
 class HttpClient:
@@ -45,15 +51,56 @@ class HttpClient:
         비동기를 사용하기 위한 asyncio.AbstractEventLoop 입니다.
         기본값은 None 입니다.
         기본 asyncio.AbstractEventLoop는 asyncio.get_event_loop()를 사용하여 얻습니다.
+    session_manager: Optional[SessionManager]
+        여러 Http 클라이언트가 커넥션 풀을 공유하기 위한 SessionManager 입니다.
+        기본값은 None이며, `session` 값을 사용하는 SessionManager를 생성하게 됩니다.
+    ratelimit_store: Optional[RateLimitStore]
+        사용량 제한 정보를 저장할 저장소 입니다. 기본값은 None이며, 프로세스 메모리에 저장합니다.
+        여러 프로세스가 사용량 제한 정보를 공유하려면 :class:`DBSkr.SQLiteRateLimitStore` 를 전달해주세요.
+    cache: Optional[Cache]
+        봇 정보(:meth:`bot`)와 사용자 정보(:meth:`users`)를 저장할 캐시 입니다. 기본값은 None이며, 캐시를 사용하지 않습니다.
+    vote_cache: Optional[VoteCache]
+        사용자의 투표 여부(:meth:`vote`)를 저장할 캐시 입니다. 기본값은 None이며, 캐시를 사용하지 않습니다.
+    keep_data: Optional[bool]
+        모델에 응답 값(`data`)을 보관할지 설정합니다. 기본값은 True 입니다.
+        False일 경우 모델을 만든 후 응답 값을 보관하지 않아 메모리를 적게 사용하며, 모델의 `data` 는 None 입니다.
+        아직 변환하지 않은 값(프로필 사진, 소유자 등)은 원본 중 필요한 값만 남겨두고 처음 접근할 때 변환합니다.
+    codec: Optional[JSONCodec]
+        응답 값과 요청 본문을 변환할 JSON 변환기 입니다. 기본값은 None이며, `orjson` 이 설치되어 있다면 `orjson` 을,
+        그렇지 않다면 파이썬 표준 라이브러리(`json`)를 사용합니다.
     """
     def __init__(self,
                  token: str = None,
                  session: aiohttp.ClientSession = None,
-                 loop: asyncio.AbstractEventLoop = None):
+                 loop: asyncio.AbstractEventLoop = None,
+                 session_manager: SessionManager = None,
+                 ratelimit_store: RateLimitStore = None,
+                 cache: Cache = None,
+                 vote_cache: VoteCache = None,
+                 keep_data: bool = True,
+                 codec: JSONCodec = None):
         self.token = token
         self.loop = loop
-        self.requests = Api(token=token, session=session, loop=loop)
+        self.requests = Api(token=token, session=session, loop=loop,
+                            session_manager=session_manager, ratelimit_store=ratelimit_store,
+                            cache=cache,
+                            codec=codec)
         self.session = session
+        self.vote_cache = vote_cache
+        self.keep_data = keep_data
+
+    @property
+    def ratelimit(self) -> RateLimiter:
+        """ KoreanBots API의 경로별 사용량 제한 정보를 불러옵니다."""
+        return self.requests.ratelimit
+
+    async def close(self):
+        """
+        본 함수는 코루틴(비동기)함수 입니다.
+
+        Http 클라이언트가 사용하는 세션을 종료합니다.
+        """
+        await self.requests.close()
 
     async def bot(self, bot_id: int) -> Bot:
         """
@@ -74,8 +121,8 @@ class HttpClient:
         path = "/bots/{bot_id}".format(bot_id=bot_id)
 
         self.requests.version = 2
-        result = await self.requests.get(path=path)
-        return Bot(result)
+        result = await self.requests.get(path=path, endpoint="bot")
+        return Bot(result, session=self.requests.session_manager, keep_data=self.keep_data)
 
     async def search(self, query: str, page: int = 1) -> Bots:
         """
@@ -99,11 +146,11 @@ class HttpClient:
             "query": query,
             "page": page
         }
-        path = "/v2/search/bots"
+        path = "/search/bots"
 
         self.requests.version = 2
-        result = await self.requests.get(path=path, query=params)
-        return Bots(result)
+        result = await self.requests.get(path=path, params=params)
+        return Bots(result, session=self.requests.session_manager, keep_data=self.keep_data)
 
     async def new(self) -> Bots:
         """
@@ -116,11 +163,11 @@ class HttpClient:
         Bots:
             KoreanBots로 부터 들어온 봇 정보가 포함되어 있습니다.
         """
-        path = "/v2/list/bots/new"
+        path = "/list/bots/new"
 
         self.requests.version = 2
         result = await self.requests.get(path=path)
-        return Bots(result)
+        return Bots(result, session=self.requests.session_manager, keep_data=self.keep_data)
 
     async def votes(self, page: int = 1) -> Bots:
         """
@@ -141,11 +188,68 @@ class HttpClient:
         params = {
             "page": page
         }
-        path = "/v2/list/bots/new"
+        path = "/list/bots/votes"
 
         self.requests.version = 2
-        result = await self.requests.get(path=path, query=params)
-        return Bots(result)
+        result = await self.requests.get(path=path, params=params)
+        return Bots(result, session=self.requests.session_manager, keep_data=self.keep_data)
+
+    def iter_search(self, query: str, limit: int = None, prefetch: int = 1, start: int = 1) -> AsyncIterator[Bot]:
+        """
+        KoreanBots에서 봇을 검색한 결과를 모든 페이지에 걸쳐 하나씩 불러옵니다.
+        현재 페이지를 처리하는 동안 다음 페이지를 미리 불러오며, 중간에 반복을 멈추면 남은 요청은 취소됩니다.
+
+        .. code-block:: python3
+
+            async for bot in client.iter_search("music", limit=50):
+                ...
+
+        Parameters
+        ----------
+        query: str
+            검색할 내용이 포함됩니다.
+        limit: Optional[int]
+            불러올 최대 봇 수 입니다. 기본값은 None이며, 마지막 페이지까지 불러옵니다.
+        prefetch: Optional[int]
+            미리 불러올 최대 페이지 수 입니다. 기본값은 1 입니다.
+        start: Optional[int]
+            처음 불러올 페이지 입니다. 기본값은 1 입니다.
+
+        Returns
+        -------
+        AsyncIterator[Bot]:
+            KoreanBots로 부터 들어온 봇 정보가 포함되어 있습니다.
+        """
+        async def fetch(page: int):
+            bots = await self.search(query=query, page=page)
+            return bots.results, bots.total
+
+        return iter_pages(fetch, start=start, prefetch=prefetch, limit=limit)
+
+    def iter_votes(self, limit: int = None, prefetch: int = 1, start: int = 1) -> AsyncIterator[Bot]:
+        """
+        하트 수가 많은 순으로 디스코드 봇을 모든 페이지에 걸쳐 하나씩 불러옵니다.
+        현재 페이지를 처리하는 동안 다음 페이지를 미리 불러오며, 중간에 반복을 멈추면 남은 요청은 취소됩니다.
+
+        Parameters
+        ----------
+        limit: Optional[int]
+            불러올 최대 봇 수 입니다. 기본값은 None이며, 마지막 페이지까지 불러옵니다.
+        prefetch: Optional[int]
+            미리 불러올 최대 페이지 수 입니다. 기본값은 1 입니다.
+        start: Optional[int]
+            처음 불러올 페이지 입니다. 기본값은 1 입니다.
+
+        Returns
+        -------
+        AsyncIterator[Bot]:
+            KoreanBots로 부터 들어온 봇 정보가 포함되어 있습니다.
+        """
+        async def fetch(page: int):
+            bots = await self.votes(page=page)
+            return bots.results, bots.total
+
+        return iter_pages(fetch, start=start, prefetch=prefetch, limit=limit)
 
     async def stats(self, bot_id: int, guild_count: int) -> Stats:
         """
@@ -172,7 +276,7 @@ class HttpClient:
 
         self.requests.version = 2
         result = await self.requests.post(path=path, json=data)
-        return Stats(result)
+        return Stats(result, keep_data=self.keep_data)
 
     async def vote(self, bot_id: int, user_id: int) -> Vote:
         """
@@ -192,14 +296,52 @@ class HttpClient:
         Vote:
             KoreanBots로 부터 들어온 사용자 투표 정보에 대한 정보가 포함되어 있습니다.
         """
+        if self.vote_cache is not None:
+            result = await self.vote_cache.load("koreanbots", bot_id, user_id)
+            if result is not None:
+                return Vote(result, keep_data=self.keep_data)
+
         data = {
             "userID": str(user_id)
         }
         path = "/bots/{bot_id}/vote".format(bot_id=bot_id)
 
         self.requests.version = 2
-        result = await self.requests.get(path=path, query=data)
-        return Vote(result)
+        result = await self.requests.get(path=path, params=data)
+        vote = Vote(result, keep_data=self.keep_data)
+        if self.vote_cache is not None:
+            self.vote_cache.set("koreanbots", bot_id, user_id, result,
+                                voted=vote.voted, last_vote=result.get("data", {}).get("lastVote"))
+        return vote
+
+    async def vote_many(self, bot_id: int, user_ids: Iterable[int],
+                        concurrency: int = 8, return_exceptions: bool = False) -> Dict[int, Vote]:
+        """
+        본 함수는 코루틴(비동기)함수 입니다.
+
+        `user_ids`에 들어있는 사용자들이 봇에 하트를 누른 여부에 대하여 한 번에 불러옵니다.
+        중복된 사용자는 한 번만 불러오며, 캐시에 저장된 사용자는 API를 호출하지 않습니다.
+        요청은 최대 `concurrency` 개씩 동시에 보내지며, 사용량 제한에 걸리면 초기화될 때까지 순서대로 대기합니다.
+
+        Parameters
+        ----------
+        bot_id: int
+            봇 ID 값이 포함됩니다.
+        user_ids: Iterable[int]
+            유저 ID 값 목록이 포함되어 있습니다.
+        concurrency: Optional[int]
+            동시에 보낼 최대 요청 갯수 입니다. 기본값은 8개 입니다.
+        return_exceptions: Optional[bool]
+            True일 경우 예외가 발생한 사용자는 결과 대신 예외가 포함됩니다.
+            False일 경우 처음 발생한 예외를 그대로 발생시킵니다. 기본값은 False 입니다.
+
+        Returns
+        -------
+        Dict[int, Vote]:
+            유저 ID 별로 KoreanBots로 부터 들어온 사용자 투표 정보가 포함되어 있습니다.
+        """
+        return await gather_map(lambda user_id: self.vote(bot_id=bot_id, user_id=user_id), user_ids,
+                                concurrency=concurrency, return_exceptions=return_exceptions)
 
     def widget(self,
                widget_type: WidgetType,
@@ -248,7 +390,7 @@ class HttpClient:
             query['icon'] = icon
 
         path = "/widget/bots/{widget_type}/{bot_id}".format(widget_type=widget_t, bot_id=bot_id)
-        return Widget(path=path, query=query, session=self.session)
+        return Widget(path=path, query=query, session=self.requests.session_manager)
 
     async def users(self, user_id: int) -> User:
         """
@@ -269,5 +411,5 @@ class HttpClient:
         path = "/users/{user_id}".format(user_id=user_id)
 
         self.requests.version = 2
-        result = await self.requests.get(path=path)
-        return User(result)
+        result = await self.requests.get(path=path, endpoint="users")
+        return User(result, session=self.requests.session_manager, keep_data=self.keep_data)
@@ -22,19 +22,26 @@ SOFTWARE.
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Union
+
+from aiohttp import ClientSession
 
 from .enums import *
 from .flags import BotFlagModel, UserFlagModel
 from ..assets import DiscordAvatar, ImageURL
+from ..lazy import lazy_property, prune
+from ..session import SessionManager
 
 
 class BaseKoreanBots:
-    def __init__(self, data: dict):
-        self.data: dict = data
+    __slots__ = ("data", "code", "version")
+
+    def __init__(self, data: dict, keep_data: bool = True):
+        # keep_data 가 False 일 경우, 응답 값은 모델을 만든 후 보관하지 않습니다.
+        self.data: Optional[dict] = data if keep_data else None
 
-        self.code: int = self.data.get("code")
-        self.version: int = self.data.get("version")
+        self.code: int = data.get("code")
+        self.version: int = data.get("version")
 
 
 class Bot(BaseKoreanBots):
@@ -89,37 +96,74 @@ class Bot(BaseKoreanBots):
     banner: Optional[ImageURL]
         디스코드 봇의 배너입니다.
     """
-    def __init__(self, data: dict):
-        super().__init__(data)
+    __slots__ = ("_source", "_session", "id", "discriminator", "_avatar", "name", "_flags", "library", "prefix",
+                 "votes", "servers", "intro", "desc", "_categories", "status", "state", "_owners", "website",
+                 "github", "invite", "support", "vanity", "_background", "_banner")
 
-        _data = data.get("data")
+    def __init__(self, data: dict,
+                 session: Union[ClientSession, SessionManager] = None,
+                 keep_data: bool = True):
+        super().__init__(data, keep_data=keep_data)
+
+        # 목록(Bots)에 포함된 봇 정보는 `data` 로 감싸져 있지 않습니다.
+        _data = data.get("data", data)
+        self._source: Optional[dict] = _data
+        self._session = session
         self.id: str = _data.get("id")
         self.discriminator: str = _data.get("tag")
-        self.avatar: DiscordAvatar = DiscordAvatar(user_id=self.id, avatar=_data.get("avatar"))
         self.name: str = _data.get("name")
-        self.flags: BotFlagModel = BotFlagModel(_data.get("flags", 0))
         self.library: str = _data.get("lib")
         self.prefix: str = _data.get("prefix")
         self.votes: int = _data.get("votes")
         self.servers: int = _data.get("servers")
         self.intro: str = _data.get("intro")
         self.desc: str = _data.get("desc")
-        self.categories: list = [get_value(Category, x) for x in _data.get("category")]
         self.status: Status = get_value(Status, _data.get("status"))
-        self.state: State = get_value(State, data.get("state"))
-
-        self.owners: list = [User(i) if isinstance(i, dict) else i for i in _data.get("owners", [])]
+        self.state: State = get_value(State, _data.get("state"))
 
         # Optional Data
         self.website: Optional[str] = _data.get("web")
         self.github: Optional[str] = _data.get("git")
         self.invite: Optional[str] = _data.get("url")
-        self.support: Optional[str] = "https://discord.gg/" + _data.get("discord")
+        self.support: Optional[str] = "https://discord.gg/" + _data.get("discord") \
+            if _data.get("discord") is not None else None
 
         # For Premium (Optional Data)
         self.vanity: Optional[str] = _data.get("vanity")
-        self.background: Optional[ImageURL] = ImageURL(url=_data.get("bg")) if _data.get("bg") is not None else None
-        self.banner: Optional[ImageURL] = ImageURL(url=_data.get("banner")) if _data.get("bg") is not None else None
+
+        if not keep_data:
+            prune(self)
+
+    @lazy_property
+    def avatar(self) -> DiscordAvatar:
+        return DiscordAvatar(user_id=self.id, avatar=self._source.get("avatar"), session=self._session)
+
+    @lazy_property
+    def flags(self) -> BotFlagModel:
+        return BotFlagModel(self._source.get("flags", 0))
+
+    @lazy_property.using("category")
+    def categories(self) -> list:
+        return [get_value(Category, x) for x in self._source.get("category") or []]
+
+    @lazy_property
+    def owners(self) -> list:
+        return [
+            User(i, session=self._session, keep_data=self.data is not None) if isinstance(i, dict) else i
+            for i in self._source.get("owners", [])
+        ]
+
+    @lazy_property.using("bg")
+    def background(self) -> Optional[ImageURL]:
+        if self._source.get("bg") is None:
+            return
+        return ImageURL(url=self._source.get("bg"), session=self._session)
+
+    @lazy_property
+    def banner(self) -> Optional[ImageURL]:
+        if self._source.get("banner") is None:
+            return
+        return ImageURL(url=self._source.get("banner"), session=self._session)
 
     def __eq__(self, other):
         return self.id == other.id
@@ -145,17 +189,18 @@ class Bots(BaseKoreanBots):
     results: List[Bot]
         검색된 결과가 들어있습니다.
     """
-    def __init__(self, data: dict):
-        super().__init__(data)
-        self.type: str = data.get("data", {}).get("type")
-        self.current: int = data.get("currentPage")
-        self.total: int = data.get("totalPage")
+    __slots__ = ("type", "current", "total", "results")
 
-        _data = []
-        for i in data.get("data"):
-            _data.append(Bot(i))
+    def __init__(self, data: dict,
+                 session: Union[ClientSession, SessionManager] = None,
+                 keep_data: bool = True):
+        super().__init__(data, keep_data=keep_data)
+        _data = data.get("data") or {}
+        self.type: str = _data.get("type")
+        self.current: int = _data.get("currentPage")
+        self.total: int = _data.get("totalPage")
 
-        self.results: list = _data
+        self.results: list = [Bot(i, session=session, keep_data=keep_data) for i in _data.get("data") or []]
 
     def __len__(self):
         return len(self.results)
@@ -169,8 +214,10 @@ class Stats(BaseKoreanBots):
     message: str
         KoreanBots에서 회신한 메세지입니다.
     """
-    def __init__(self, data: dict):
-        super().__init__(data)
+    __slots__ = ("message", )
+
+    def __init__(self, data: dict, keep_data: bool = True):
+        super().__init__(data, keep_data=keep_data)
         self.message: str = data.get("message")
 
 
@@ -181,16 +228,23 @@ class Vote(BaseKoreanBots):
     ------------
     voted: bool
         하트 여부를 반환합니다.
-    last_vote: datetime
+    last_vote: Optional[datetime]
         마지막으로 하트를 준 시간을 반환합니다.
     """
-    def __init__(self, data: dict):
-        super().__init__(data)
+    __slots__ = ("voted", "last_vote")
+
+    def __init__(self, data: dict, keep_data: bool = True):
+        super().__init__(data, keep_data=keep_data)
 
         _data = data.get("data")
         last_vote = _data.get("lastVote")
         self.voted: bool = _data.get("voted", False)
-        self.last_vote: datetime = datetime.fromtimestamp(last_vote)
+        self.last_vote: Optional[datetime] = None
+        if last_vote is not None:
+            # KoreanBots API는 밀리초 단위의 Timestamp를 반환합니다.
+            if last_vote > 1e12:
+                last_vote /= 1000
+            self.last_vote = datetime.fromtimestamp(last_vote)
 
     def __eq__(self, other):
         return self.voted == other
@@ -217,16 +271,34 @@ class User(BaseKoreanBots):
     flags: UserFlagModel
         KoreanBots에 등록된 사용자의 Flag 값 입니다.
     """
-    def __init__(self, data: dict):
-        super().__init__(data)
+    __slots__ = ("_source", "_session", "id", "_flags", "github", "discriminator", "name", "_bots")
+
+    def __init__(self, data: dict,
+                 session: Union[ClientSession, SessionManager] = None,
+                 keep_data: bool = True):
+        super().__init__(data, keep_data=keep_data)
 
         _data = data.get("data", data)
+        self._source: Optional[dict] = _data
+        self._session = session
         self.id: str = _data.get("id")
-        self.flags: UserFlagModel = UserFlagModel(_data.get("flags", 0))
         self.github: Optional[str] = _data.get("github")
         self.discriminator: str = _data.get("tag")
         self.name: str = _data.get("username")
-        self.bots: list = [Bot(i) if isinstance(i, dict) else i for i in _data.get("bots", [])]
+
+        if not keep_data:
+            prune(self)
+
+    @lazy_property
+    def flags(self) -> UserFlagModel:
+        return UserFlagModel(self._source.get("flags", 0))
+
+    @lazy_property
+    def bots(self) -> list:
+        return [
+            Bot(i, session=self._session, keep_data=self.data is not None) if isinstance(i, dict) else i
+            for i in self._source.get("bots", [])
+        ]
 
     def __eq__(self, other):
         return self.id == other.id
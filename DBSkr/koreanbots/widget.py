@@ -25,6 +25,8 @@ from ..assets import Assets
 
 
 class Widget(Assets):
+    __slots__ = ("path", "BASE", "query")
+
     def __init__(self, path: str, query: dict, session):
         self.path = path
         self.query = query
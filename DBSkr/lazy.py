@@ -0,0 +1,103 @@
+"""MIT License
+
+Copyright (c) 2021 gunyu1019
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+
+class lazy_property:
+    """ 처음 접근할 때 값을 변환하고, 변환한 값을 저장해두는 프로퍼티 입니다.
+    변환한 값은 `_{name}` slot에 저장되므로, 사용하는 모델은 `__slots__` 에 `_{name}` 을 선언해야 합니다.
+
+    .. code-block:: python3
+
+        class Bot:
+            __slots__ = ("_source", "_avatar")
+
+            @lazy_property
+            def avatar(self) -> DiscordAvatar:
+                return DiscordAvatar(user_id=self._source.get("id"), avatar=self._source.get("avatar"))
+
+    원본 값(`_source`)에서 사용하는 키가 프로퍼티의 이름과 다르다면, :meth:`using` 으로 키를 지정해야 합니다.
+    지정한 키는 :func:`prune` 에서 원본 값을 줄일 때 사용됩니다.
+    """
+    def __init__(self, func: Callable[[Any], Any], keys: Sequence[str] = None):
+        self.func = func
+        self.name = func.__name__
+        self.slot = "_" + func.__name__
+        self.keys = tuple(keys) if keys is not None else (func.__name__, )
+        self.__doc__ = func.__doc__
+
+    @classmethod
+    def using(cls, *keys: str) -> Callable[[Callable[[Any], Any]], "lazy_property"]:
+        """ 원본 값(`_source`)의 `keys` 를 사용하는 :class:`lazy_property` 를 만듭니다."""
+        def decorator(func: Callable[[Any], Any]) -> "lazy_property":
+            return cls(func, keys)
+        return decorator
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        try:
+            return getattr(instance, self.slot)
+        except AttributeError:
+            value = self.func(instance)
+            setattr(instance, self.slot, value)
+            return value
+
+    def __set__(self, instance, value):
+        setattr(instance, self.slot, value)
+
+
+_fields: Dict[type, List[lazy_property]] = dict()
+_keys: Dict[type, Tuple[str, ...]] = dict()
+
+
+def lazy_fields(cls: type) -> List[lazy_property]:
+    """ 클래스에 선언된 :class:`lazy_property` 목록을 불러옵니다."""
+    fields = _fields.get(cls)
+    if fields is None:
+        fields = list()
+        for base in reversed(cls.__mro__):
+            fields += [value for value in vars(base).values() if isinstance(value, lazy_property)]
+        _fields[cls] = fields
+    return fields
+
+
+def materialize(instance):
+    """ 모델의 모든 :class:`lazy_property` 값을 변환한 후, 원본 값(`_source`)을 더 이상 보관하지 않습니다."""
+    for field in lazy_fields(type(instance)):
+        field.__get__(instance, type(instance))
+    instance._source = None
+
+
+def prune(instance):
+    """ 원본 값(`_source`)에서 :class:`lazy_property` 가 사용하는 값만 남깁니다.
+    이미 모델의 속성으로 옮겨진 값은 더 이상 보관하지 않으며, 나머지 값은 처음 접근할 때 변환합니다."""
+    source = instance._source
+    if source is None:
+        return
+
+    keys = _keys.get(type(instance))
+    if keys is None:
+        keys = _keys[type(instance)] = tuple(key for field in lazy_fields(type(instance)) for key in field.keys)
+    instance._source = {key: source[key] for key in keys if key in source}
@@ -22,12 +22,43 @@ SOFTWARE.
 """
 
 
+from typing import Dict, List
+
+from .enums import WebsiteType
+
+
 class WebsiteBase:
-    def __init__(self, koreanbots=None, topgg=None, uniquebots=None):
+    __slots__ = ("koreanbots", "topgg", "uniquebots", "exceptions", "timed_out")
+
+    def __init__(self, koreanbots=None, topgg=None, uniquebots=None,
+                 exceptions: Dict[WebsiteType, Exception] = None,
+                 timed_out: List[WebsiteType] = None):
         self.koreanbots = koreanbots
         self.topgg = topgg
         self.uniquebots = uniquebots
 
+        if exceptions is None:
+            exceptions = dict()
+        self.exceptions: Dict[WebsiteType, Exception] = exceptions
+
+        if timed_out is None:
+            timed_out = list()
+        self.timed_out: List[WebsiteType] = timed_out
+
+    def is_failed(self, web_type: WebsiteType = None) -> bool:
+        """ 웹사이트로 부터 값을 불러오는 도중 예외가 발생한 경우 `True`를 리턴합니다.
+        `web_type`이 비어있을 경우 한 곳 이상의 웹사이트에서 예외가 발생하였는지 확인합니다."""
+        if web_type is None:
+            return len(self.exceptions) != 0
+        return web_type in self.exceptions
+
+    def is_timed_out(self, web_type: WebsiteType = None) -> bool:
+        """ 제한 시간 내에 웹사이트로 부터 응답을 받지 못한 경우 `True`를 리턴합니다.
+        `web_type`이 비어있을 경우 한 곳 이상의 웹사이트에서 응답이 지연되었는지 확인합니다."""
+        if web_type is None:
+            return len(self.timed_out) != 0
+        return web_type in self.timed_out
+
 
 class WebsiteBot(WebsiteBase):
     """ 웹사이트로 부터 들어온 봇 정보의 모델을 나타냅니다.
@@ -40,9 +71,18 @@ class WebsiteBot(WebsiteBase):
         top.gg로 부터 들어온 값이 포함됩니다.
     uniquebots: Optional
         UniqueBots로 부터 들어온 값이 포함됩니다.
+    exceptions: Dict[WebsiteType, Exception]
+        값을 불러오는 도중 발생한 웹사이트별 예외가 포함됩니다.
+    timed_out: List[WebsiteType]
+        제한 시간 내에 응답하지 않은 웹사이트 목록이 포함됩니다.
     """
-    def __init__(self, koreanbots=None, topgg=None, uniquebots=None):
-        super().__init__(koreanbots=koreanbots, topgg=topgg, uniquebots=uniquebots)
+    __slots__ = ()
+
+    def __init__(self, koreanbots=None, topgg=None, uniquebots=None,
+                 exceptions: Dict[WebsiteType, Exception] = None,
+                 timed_out: List[WebsiteType] = None):
+        super().__init__(koreanbots=koreanbots, topgg=topgg, uniquebots=uniquebots,
+                         exceptions=exceptions, timed_out=timed_out)
 
 
 class WebsiteStats(WebsiteBase):
@@ -56,9 +96,18 @@ class WebsiteStats(WebsiteBase):
         top.gg로 부터 들어온 값이 포함됩니다.
     uniquebots: Optional
         UniqueBots로 부터 들어온 값이 포함됩니다.
+    exceptions: Dict[WebsiteType, Exception]
+        값을 불러오는 도중 발생한 웹사이트별 예외가 포함됩니다.
+    timed_out: List[WebsiteType]
+        제한 시간 내에 응답하지 않은 웹사이트 목록이 포함됩니다.
     """
-    def __init__(self, koreanbots=None, topgg=None, uniquebots=None):
-        super().__init__(koreanbots=koreanbots, topgg=topgg, uniquebots=uniquebots)
+    __slots__ = ()
+
+    def __init__(self, koreanbots=None, topgg=None, uniquebots=None,
+                 exceptions: Dict[WebsiteType, Exception] = None,
+                 timed_out: List[WebsiteType] = None):
+        super().__init__(koreanbots=koreanbots, topgg=topgg, uniquebots=uniquebots,
+                         exceptions=exceptions, timed_out=timed_out)
 
 
 class WebsiteVote(WebsiteBase):
@@ -72,9 +121,18 @@ class WebsiteVote(WebsiteBase):
         top.gg로 부터 들어온 값이 포함됩니다.
     uniquebots: Optional
         UniqueBots로 부터 들어온 값이 포함됩니다.
+    exceptions: Dict[WebsiteType, Exception]
+        값을 불러오는 도중 발생한 웹사이트별 예외가 포함됩니다.
+    timed_out: List[WebsiteType]
+        제한 시간 내에 응답하지 않은 웹사이트 목록이 포함됩니다.
     """
-    def __init__(self, koreanbots=None, topgg=None, uniquebots=None):
-        super().__init__(koreanbots=koreanbots, topgg=topgg, uniquebots=uniquebots)
+    __slots__ = ()
+
+    def __init__(self, koreanbots=None, topgg=None, uniquebots=None,
+                 exceptions: Dict[WebsiteType, Exception] = None,
+                 timed_out: List[WebsiteType] = None):
+        super().__init__(koreanbots=koreanbots, topgg=topgg, uniquebots=uniquebots,
+                         exceptions=exceptions, timed_out=timed_out)
 
 
 class WebsiteVotes(WebsiteBase):
@@ -86,9 +144,17 @@ class WebsiteVotes(WebsiteBase):
         top.gg로 부터 들어온 값이 포함됩니다.
     uniquebots: Optional
         UniqueBots로 부터 들어온 값이 포함됩니다.
+    exceptions: Dict[WebsiteType, Exception]
+        값을 불러오는 도중 발생한 웹사이트별 예외가 포함됩니다.
+    timed_out: List[WebsiteType]
+        제한 시간 내에 응답하지 않은 웹사이트 목록이 포함됩니다.
     """
-    def __init__(self, topgg=None, uniquebots=None):
-        super().__init__(topgg=topgg, uniquebots=uniquebots)
+    __slots__ = ()
+
+    def __init__(self, topgg=None, uniquebots=None,
+                 exceptions: Dict[WebsiteType, Exception] = None,
+                 timed_out: List[WebsiteType] = None):
+        super().__init__(topgg=topgg, uniquebots=uniquebots, exceptions=exceptions, timed_out=timed_out)
 
 
 class WebsiteUser(WebsiteBase):
@@ -102,6 +168,15 @@ class WebsiteUser(WebsiteBase):
         top.gg로 부터 들어온 값이 포함됩니다.
     uniquebots: Optional
         UniqueBots로 부터 들어온 값이 포함됩니다.
+    exceptions: Dict[WebsiteType, Exception]
+        값을 불러오는 도중 발생한 웹사이트별 예외가 포함됩니다.
+    timed_out: List[WebsiteType]
+        제한 시간 내에 응답하지 않은 웹사이트 목록이 포함됩니다.
     """
-    def __init__(self, koreanbots=None, topgg=None, uniquebots=None):
-        super().__init__(koreanbots=koreanbots, topgg=topgg, uniquebots=uniquebots)
+    __slots__ = ()
+
+    def __init__(self, koreanbots=None, topgg=None, uniquebots=None,
+                 exceptions: Dict[WebsiteType, Exception] = None,
+                 timed_out: List[WebsiteType] = None):
+        super().__init__(koreanbots=koreanbots, topgg=topgg, uniquebots=uniquebots,
+                         exceptions=exceptions, timed_out=timed_out)
@@ -0,0 +1,208 @@
+"""MIT License
+
+Copyright (c) 2021 gunyu1019
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import base64
+import logging
+import time
+from array import array
+from collections import deque
+from typing import Any, AsyncIterator, Callable, List, Optional
+
+from .cache import SQLiteCacheStore
+from .voters import VoterSet
+
+log = logging.getLogger(__name__)
+
+
+class VotePoller:
+    """ 투표 목록을 주기적으로 불러와, 이전에 불러온 이후 새로 투표한 사용자만 골라냅니다.
+    웹훅을 사용할 수 없는 환경에서 :class:`DBSkr.WebhookServer` 대신 사용할 수 있습니다.
+
+    투표 목록이 최신 순으로 정렬된 웹사이트(`ordered=True`, top.gg)는 지난 목록의 맨 앞 `anchor_size` 명(기준점)을 기억하고,
+    새 목록에서 기준점을 찾을 때까지만 응답을 읽습니다. 새로 투표한 사용자가 없다면 응답의 맨 앞부분만 읽고 종료합니다.
+    기준점을 찾지 못했거나 정렬되지 않은 웹사이트(UniqueBots)는 이미 확인한 사용자 목록(:class:`DBSkr.VoterSet`)에 없는 사용자를 골라냅니다.
+
+    Parameters
+    ----------
+    key: str
+        저장소에 상태를 저장할 키 값 입니다. (예: `topgg:{bot_id}`)
+    fetch: Callable[[], AsyncIterator[Any]]
+        투표한 사용자(`id` 속성을 가진 모델)를 응답 순서대로 반환하는 함수 입니다.
+    ordered: Optional[bool]
+        투표 목록이 최신 순으로 정렬되어 있는지 여부 입니다. 기본값은 True 입니다.
+    anchor_size: Optional[int]
+        기준점으로 기억할 사용자 수 입니다. 기본값은 8명 입니다.
+    max_seen: Optional[int]
+        이미 확인한 사용자 목록의 최대 크기 입니다. 넘으면 최근에 확인한 절반만 남깁니다. 기본값은 65536명 입니다.
+    emit_initial: Optional[bool]
+        저장된 상태가 없을 때 처음 불러온 사용자를 모두 새로 투표한 사용자로 반환할지 여부 입니다.
+        기본값은 False 이며, 처음 불러온 목록은 기준으로만 사용합니다.
+    store: Optional[SQLiteCacheStore]
+        기준점과 확인한 사용자 목록을 저장할 저장소 입니다. 기본값은 None이며, 프로세스 메모리에만 보관합니다.
+    retention: Optional[float]
+        저장소에 상태를 보관할 시간(초) 입니다. 기본값은 30일 입니다.
+
+    Attributes
+    ------------
+    head: List[int]
+        지난 목록의 맨 앞 사용자 ID(기준점) 입니다.
+    seen: VoterSet
+        이미 확인한 사용자의 ID 목록 입니다.
+    """
+    def __init__(self,
+                 key: str,
+                 fetch: Callable[[], AsyncIterator[Any]],
+                 ordered: bool = True,
+                 anchor_size: int = 8,
+                 max_seen: int = 65536,
+                 emit_initial: bool = False,
+                 store: SQLiteCacheStore = None,
+                 retention: float = 30 * 86400):
+        self.key = key
+        self.fetch = fetch
+        self.ordered = ordered
+        self.anchor_size = anchor_size
+        self.max_seen = max_seen
+        self.emit_initial = emit_initial
+        self.store = store
+        self.retention = retention
+
+        self.head: List[int] = []
+        self.seen: VoterSet = VoterSet()
+        self.initialized: bool = False
+        self._loaded: bool = False
+
+    def __repr__(self):
+        return "<VotePoller key={0.key} ordered={0.ordered} seen={1}>".format(self, len(self.seen))
+
+    async def load(self):
+        """
+        본 함수는 코루틴(비동기)함수 입니다.
+
+        저장소에서 기준점과 확인한 사용자 목록을 불러옵니다. :meth:`poll` 을 처음 호출할 때 자동으로 불러옵니다.
+        """
+        self._loaded = True
+        if self.store is None:
+            return
+        result = await self.store.fetch("poller:{}".format(self.key))
+        if result is None:
+            return
+        value, _ = result
+        try:
+            seen = array('Q')
+            seen.frombytes(base64.b64decode(value["seen"]))
+            self.seen = VoterSet(seen)
+            self.head = [int(x) for x in value["head"]]
+        except (KeyError, TypeError, ValueError) as exception:
+            log.warning(f"Failed to load poller state {self.key}: {exception.__class__.__name__} {exception}")
+            return
+        self.initialized = True
+
+    def save(self):
+        """ 기준점과 확인한 사용자 목록을 저장소에 저장합니다."""
+        if self.store is None:
+            return
+        value = {
+            "head": self.head,
+            "seen": base64.b64encode(self.seen.ids.tobytes()).decode("ascii")
+        }
+        self.store.submit(self.store.set, "poller:{}".format(self.key), value, time.time() + self.retention)
+
+    def reset(self):
+        """ 기준점과 확인한 사용자 목록을 초기화합니다."""
+        self.head = []
+        self.seen = VoterSet()
+        self.initialized = False
+        if self.store is not None:
+            self.store.submit(self.store.delete, "poller:{}".format(self.key))
+
+    async def poll(self) -> List[Any]:
+        """
+        본 함수는 코루틴(비동기)함수 입니다.
+
+        투표 목록을 불러와, 지난 호출 이후 새로 투표한 사용자를 응답 순서대로 반환합니다.
+        새로 투표한 사용자가 없다면 빈 목록을 반환합니다.
+
+        Returns
+        -------
+        List[Any]:
+            `fetch` 에서 반환된 새로 투표한 사용자 목록 입니다.
+        """
+        if not self._loaded:
+            await self.load()
+
+        anchor = self.head if self.ordered and self.initialized else []
+        window = deque(maxlen=max(1, len(anchor)))
+        found = False
+        received = []
+
+        iterator = self.fetch()
+        try:
+            async for user in iterator:
+                user_id = getattr(user, "id", None)
+                if user_id is None:
+                    continue
+                received.append((int(user_id), user))
+                if len(anchor) == 0:
+                    continue
+                window.append(int(user_id))
+                if len(window) == len(anchor) and list(window) == anchor:
+                    # 지난 목록의 맨 앞을 찾았으므로, 나머지 응답은 읽지 않습니다.
+                    found = True
+                    break
+        finally:
+            if hasattr(iterator, "aclose"):
+                await iterator.aclose()
+
+        if found:
+            result = received[:len(received) - len(anchor)]
+        else:
+            result = list()
+            for user_id, user in received:
+                if user_id not in self.seen:
+                    self.seen.add(user_id)
+                    result.append((user_id, user))
+
+        changed = len(result) != 0 or not self.initialized
+        for user_id, _ in result:
+            self.seen.add(user_id)
+        if len(self.seen) > self.max_seen:
+            seen = VoterSet(self.seen.ids[-(self.max_seen // 2):])
+            if not found:
+                # 전체 목록을 받은 경우, 목록에 남아있는 사용자를 지우면 다음 호출에서 다시 새로운 투표로 취급됩니다.
+                seen.update(user_id for user_id, _ in received)
+            self.seen = seen
+
+        head = [user_id for user_id, _ in received[:self.anchor_size]]
+        if head != self.head:
+            changed = True
+            self.head = head
+
+        if not self.initialized and not self.emit_initial:
+            result = list()
+        self.initialized = True
+
+        if changed:
+            log.debug(f"Polled {len(result)} new votes for {self.key}")
+            self.save()
+        return [user for _, user in result]
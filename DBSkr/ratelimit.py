@@ -0,0 +1,393 @@
+"""MIT License
+
+Copyright (c) 2021 gunyu1019
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+import logging
+import re
+import sqlite3
+import threading
+import time
+
+from typing import Dict, Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+#: 응답 헤더의 초기화 시간이 이 값(초) 이내로 차이나면 같은 주기로 취급합니다.
+RESET_TOLERANCE = 1.0
+#: 초기화 시간을 알 수 없는 상태에서 남은 요청 횟수가 없을 때 기다릴 시간(초)입니다.
+DEFAULT_WAIT = 1.0
+
+
+def _parse_number(value) -> Optional[float]:
+    if value is None:
+        return
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return
+
+
+class RateLimitBucket:
+    """ 웹사이트의 경로(Route) 하나에 대한 사용량 제한 정보를 나타냅니다.
+
+    Attributes
+    ------------
+    key: str
+        사용량 제한 정보를 구분하는 키 값 입니다.
+    limit: Optional[int]
+        주어진 시간 동안 요청할 수 있는 최대 횟수 입니다. 아직 응답을 받지 못했다면 None 입니다.
+    remaining: Optional[int]
+        초기화 되기 전까지 남은 요청 횟수 입니다. 아직 응답을 받지 못했다면 None 입니다.
+    reset: Optional[float]
+        사용량이 초기화되는 시간(Unix Timestamp) 입니다.
+    next_at: Optional[float]
+        남은 요청을 주기 안에 고르게 나누어 보내기 위하여, 다음 요청을 보낼 수 있는 가장 빠른 시간(Unix Timestamp) 입니다.
+    """
+    def __init__(self, key: str, limit: int = None, remaining: int = None, reset: float = None, next_at: float = None):
+        self.key = key
+        self.limit: Optional[int] = limit
+        self.remaining: Optional[int] = remaining
+        self.reset: Optional[float] = reset
+        self.next_at: Optional[float] = next_at
+
+    def __repr__(self):
+        return "<RateLimitBucket key={0.key!r} remaining={0.remaining} limit={0.limit} reset={0.reset}>".format(self)
+
+    def delay(self, now: float = None, quota: Tuple[int, float] = None) -> float:
+        """ 다음 요청을 보내기 전까지 기다려야 하는 시간(초)을 반환합니다.
+
+        Parameters
+        ----------
+        now: Optional[float]
+            현재 시간(Unix Timestamp) 입니다. 기본값은 :func:`time.time` 입니다.
+        quota: Optional[Tuple[int, float]]
+            웹사이트가 사용량 제한 정보를 알려주지 않을 때 사용할 (요청 횟수, 주기(초)) 입니다.
+        """
+        if now is None:
+            now = time.time()
+
+        if self.reset is not None and now >= self.reset:
+            self.remaining = self.limit
+            self.reset = None
+
+        if self.reset is None and quota is not None:
+            # 초기화 시간을 알 수 없다면, 기본 사용량 제한 정보로 새로운 주기를 시작합니다.
+            limit, period = quota
+            if self.limit is None:
+                self.limit = limit
+            if self.remaining is None:
+                self.remaining = self.limit
+            self.reset = now + period
+
+        if self.remaining is None:
+            return 0.0
+        if self.remaining <= 0:
+            if self.reset is None:
+                self.reset = now + DEFAULT_WAIT
+            return self.reset - now
+        if self.next_at is not None and self.next_at > now:
+            return self.next_at - now
+        return 0.0
+
+    def reserve(self, now: float = None):
+        """ 요청 하나를 보내기 위해 남은 요청 횟수를 하나 차감합니다.
+        초기화 시간을 알고 있다면, 남은 요청이 주기 안에 고르게 나누어지도록 다음 요청의 시간을 정합니다."""
+        if now is None:
+            now = time.time()
+
+        if self.remaining is not None:
+            if self.reset is not None and self.remaining > 0:
+                self.next_at = now + max(self.reset - now, 0.0) / self.remaining
+            self.remaining = max(self.remaining - 1, 0)
+
+    def update(self, limit: int = None, remaining: int = None, reset: float = None, now: float = None):
+        """ 웹사이트로 부터 받은 사용량 제한 정보를 반영합니다."""
+        if now is None:
+            now = time.time()
+
+        if limit is not None:
+            self.limit = limit
+
+        if reset is not None and (
+                self.reset is None or self.reset <= now or reset > self.reset + RESET_TOLERANCE
+        ):
+            # 새로운 주기가 시작된 경우, 웹사이트가 알려준 값을 그대로 사용합니다.
+            self.reset = reset
+            if remaining is not None:
+                self.remaining = remaining
+        elif remaining is not None:
+            # 같은 주기 내에서는 아직 응답받지 못한 요청을 고려하여 더 작은 값을 사용합니다.
+            self.remaining = remaining if self.remaining is None else min(self.remaining, remaining)
+
+
+def _reserve(bucket: RateLimitBucket, quota: Tuple[int, float] = None) -> float:
+    now = time.time()
+    delay = bucket.delay(now, quota)
+    if delay <= 0:
+        bucket.reserve(now)
+    return delay
+
+
+class RateLimitStore:
+    """ 사용량 제한 정보를 저장하는 저장소 입니다.
+    기본 저장소는 프로세스 메모리에 정보를 저장하며, 하나의 프로세스 안에서만 공유됩니다.
+
+    여러 프로세스가 같은 사용량 제한 정보를 공유하려면 :class:`SQLiteRateLimitStore` 를 사용해주세요.
+    """
+    #: 저장소의 함수가 I/O 작업으로 인하여 이벤트 루프를 멈출 수 있는 경우 `True` 입니다.
+    blocking: bool = False
+
+    def __init__(self):
+        self._buckets: Dict[str, RateLimitBucket] = dict()
+
+    def get(self, key: str) -> RateLimitBucket:
+        """ 키 값에 해당하는 사용량 제한 정보를 불러옵니다."""
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = RateLimitBucket(key=key)
+        return bucket
+
+    def items(self, prefix: str = "") -> Dict[str, RateLimitBucket]:
+        """ `prefix` 로 시작하는 모든 사용량 제한 정보를 불러옵니다."""
+        return {key: bucket for key, bucket in self._buckets.items() if key.startswith(prefix)}
+
+    def reserve(self, key: str, quota: Tuple[int, float] = None) -> float:
+        """ 요청을 보낼 수 있다면 남은 요청 횟수를 하나 차감하고 0을 반환합니다.
+        요청을 보낼 수 없다면 기다려야 하는 시간(초)을 반환합니다."""
+        return _reserve(self.get(key), quota)
+
+    def update(self, key: str, limit: int = None, remaining: int = None, reset: float = None) -> RateLimitBucket:
+        """ 웹사이트로 부터 받은 사용량 제한 정보를 반영한 후, 갱신된 사용량 제한 정보를 반환합니다."""
+        bucket = self.get(key)
+        bucket.update(limit=limit, remaining=remaining, reset=reset)
+        return bucket
+
+
+class SQLiteRateLimitStore(RateLimitStore):
+    """ SQLite 데이터베이스 파일에 사용량 제한 정보를 저장하는 저장소입니다.
+    같은 파일을 사용하는 모든 프로세스(클러스터)가 웹사이트와 경로별로 하나의 사용량 제한 정보를 공유합니다.
+
+    Parameters
+    ----------
+    path: str
+        SQLite 데이터베이스 파일의 경로 입니다. 같은 호스트에서 실행되는 모든 프로세스가 같은 경로를 사용해야합니다.
+    timeout: Optional[float]
+        다른 프로세스가 데이터베이스를 사용 중일 때 기다릴 최대 시간(초)입니다. 기본값은 5초 입니다.
+    """
+    blocking: bool = True
+
+    def __init__(self, path: str, timeout: float = 5.0):
+        super().__init__()
+        self.path = path
+        self.timeout = timeout
+
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=timeout, isolation_level=None, check_same_thread=False)
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS ratelimit ("
+                "key TEXT PRIMARY KEY, "
+                "max_limit INTEGER, "
+                "remaining INTEGER, "
+                "reset REAL, "
+                "next_at REAL)"
+            )
+            try:
+                # 이전 버전에서 만들어진 데이터베이스 파일에는 next_at 열이 없습니다.
+                self._connection.execute("ALTER TABLE ratelimit ADD COLUMN next_at REAL")
+            except sqlite3.OperationalError:
+                pass
+
+    def close(self):
+        """ 데이터베이스 연결을 종료합니다."""
+        with self._lock:
+            self._connection.close()
+
+    def _load(self, key: str) -> RateLimitBucket:
+        row = self._connection.execute(
+            "SELECT max_limit, remaining, reset, next_at FROM ratelimit WHERE key = ?", (key, )
+        ).fetchone()
+        if row is None:
+            return RateLimitBucket(key=key)
+        return RateLimitBucket(key=key, limit=row[0], remaining=row[1], reset=row[2], next_at=row[3])
+
+    def _save(self, bucket: RateLimitBucket):
+        self._connection.execute(
+            "INSERT OR REPLACE INTO ratelimit (key, max_limit, remaining, reset, next_at) VALUES (?, ?, ?, ?, ?)",
+            (bucket.key, bucket.limit, bucket.remaining, bucket.reset, bucket.next_at)
+        )
+
+    def _transaction(self, key: str, func) -> RateLimitBucket:
+        with self._lock:
+            # BEGIN IMMEDIATE 를 통하여 다른 프로세스가 같은 정보를 동시에 수정하지 못하도록 합니다.
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                bucket = self._load(key)
+                result = func(bucket)
+                self._save(bucket)
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+        return result
+
+    def get(self, key: str) -> RateLimitBucket:
+        with self._lock:
+            return self._load(key)
+
+    def items(self, prefix: str = "") -> Dict[str, RateLimitBucket]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT key, max_limit, remaining, reset, next_at FROM ratelimit WHERE substr(key, 1, ?) = ?",
+                (len(prefix), prefix)
+            ).fetchall()
+        return {
+            row[0]: RateLimitBucket(key=row[0], limit=row[1], remaining=row[2], reset=row[3], next_at=row[4])
+            for row in rows
+        }
+
+    def reserve(self, key: str, quota: Tuple[int, float] = None) -> float:
+        return self._transaction(key, lambda bucket: _reserve(bucket, quota))
+
+    def update(self, key: str, limit: int = None, remaining: int = None, reset: float = None) -> RateLimitBucket:
+        def _update(bucket: RateLimitBucket) -> RateLimitBucket:
+            bucket.update(limit=limit, remaining=remaining, reset=reset)
+            return bucket
+        return self._transaction(key, _update)
+
+
+class RateLimiter:
+    """ 웹사이트 하나에 대한 경로(Route)별 사용량 제한 정보를 관리합니다.
+    응답 헤더(`x-ratelimit-limit`, `x-ratelimit-remaining`, `x-ratelimit-reset`, `retry-after`)를 통하여 사용량을 추적하며,
+    남은 요청은 초기화될 때까지 고르게 나누어 보내며, 남은 요청 횟수가 없으면 초기화될 때까지 요청을 순서대로 대기시킵니다.
+
+    Parameters
+    ----------
+    name: str
+        웹사이트의 이름입니다.
+    store: Optional[RateLimitStore]
+        사용량 제한 정보를 저장할 저장소입니다. 기본값은 None이며, 프로세스 메모리에 저장합니다.
+        여러 프로세스가 사용량 제한 정보를 공유하려면 :class:`SQLiteRateLimitStore` 를 전달해주세요.
+    quota: Optional[Tuple[int, float]]
+        웹사이트가 사용량 제한 헤더를 보내주지 않을 때 사용할 기본 (요청 횟수, 주기(초)) 입니다.
+        기본값은 None이며, 응답 헤더로만 사용량을 추적합니다.
+    quotas: Optional[Dict[str, Tuple[int, float]]]
+        경로(Route)별 기본 (요청 횟수, 주기(초)) 입니다. 포함되지 않은 경로는 `quota` 를 사용합니다.
+    """
+    def __init__(self,
+                 name: str,
+                 store: RateLimitStore = None,
+                 quota: Tuple[int, float] = None,
+                 quotas: Dict[str, Tuple[int, float]] = None):
+        self.name = name
+        if store is None:
+            store = RateLimitStore()
+        self.store = store
+        self.quota: Optional[Tuple[int, float]] = quota
+        self.quotas: Dict[str, Tuple[int, float]] = dict(quotas or {})
+
+        self._locks: Dict[str, asyncio.Lock] = dict()
+
+    @property
+    def buckets(self) -> Dict[str, RateLimitBucket]:
+        """ 경로별 사용량 제한 정보가 포함됩니다."""
+        prefix = self._key("")
+        return {key[len(prefix):]: bucket for key, bucket in self.store.items(prefix).items()}
+
+    @staticmethod
+    def route(method: str, path: str) -> str:
+        """ 요청 방식과 경로를 통하여 사용량 제한 정보를 구분하는 키 값을 만듭니다.
+        경로에 포함된 디스코드 ID 값은 하나의 경로로 취급합니다."""
+        return "{} {}".format(method.upper(), re.sub(r"/\d{15,}", "/{id}", path))
+
+    def _key(self, key: str) -> str:
+        return "{}:{}".format(self.name, key)
+
+    async def _call(self, func, *args):
+        if not self.store.blocking:
+            return func(*args)
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, func, *args)
+
+    def get_quota(self, key: str) -> Optional[Tuple[int, float]]:
+        """ 경로에 해당하는 기본 (요청 횟수, 주기(초))를 불러옵니다."""
+        return self.quotas.get(key, self.quota)
+
+    def get_bucket(self, key: str) -> RateLimitBucket:
+        """ 경로에 해당하는 사용량 제한 정보를 불러옵니다."""
+        return self.store.get(self._key(key))
+
+    async def acquire(self, key: str):
+        """
+        본 함수는 코루틴(비동기)함수 입니다.
+
+        경로에 요청을 보낼 수 있을 때까지 기다린 후, 남은 요청 횟수를 하나 차감합니다.
+        동시에 들어온 요청은 들어온 순서대로 처리됩니다.
+        """
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+
+        quota = self.get_quota(key)
+        async with lock:
+            delay = await self._call(self.store.reserve, self._key(key), quota)
+            while delay > 0:
+                log.debug(f"{self.name}: {key} is rate limited. Waiting {delay:.2f} seconds")
+                await asyncio.sleep(delay)
+                delay = await self._call(self.store.reserve, self._key(key), quota)
+
+    async def update(self, key: str, headers, status: int = None) -> RateLimitBucket:
+        """
+        본 함수는 코루틴(비동기)함수 입니다.
+
+        응답 헤더를 통하여 경로의 사용량 제한 정보를 갱신한 후, 갱신된 사용량 제한 정보를 반환합니다.
+        """
+        now = time.time()
+        limit = _parse_number(headers.get('x-ratelimit-limit'))
+        remaining = _parse_number(headers.get('x-ratelimit-remaining'))
+        reset = _parse_number(headers.get('x-ratelimit-reset'))
+        retry_after = _parse_number(headers.get('retry-after'))
+
+        if reset is not None:
+            if reset > 1e12:
+                # 밀리초(ms) 단위의 Unix Timestamp
+                reset = reset / 1000
+            elif reset < 1e9:
+                # 초기화 되기까지 남은 시간(초)
+                reset = now + reset
+
+        if status == 429:
+            remaining = 0
+            if retry_after is not None:
+                reset = now + retry_after
+            elif reset is None:
+                reset = now + 1.0
+
+        return await self._call(
+            self.store.update,
+            self._key(key),
+            int(limit) if limit is not None else None,
+            int(remaining) if remaining is not None else None,
+            reset
+        )
@@ -0,0 +1,112 @@
+"""MIT License
+
+Copyright (c) 2021 gunyu1019
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import aiohttp
+import logging
+
+from typing import Optional
+
+log = logging.getLogger(__name__)
+
+
+class SessionManager:
+    """ KoreanBots 클라이언트, top.gg 클라이언트, UniqueBots 클라이언트가 함께 사용하는 aiohttp 세션을 관리합니다.
+    하나의 커넥션 풀(Connection Pool)을 공유하기 때문에, 한 번 연결된 Keep-Alive/TLS 커넥션을 계속 재사용합니다.
+
+    ClientSession은 처음 요청이 발생할 때 생성되며, 주기적으로 세션을 재생성하지 않습니다.
+
+    Parameters
+    ----------
+    session: Optional[aiohttp.ClientSession]
+        직접 생성한 aiohttp 의 ClientSession 클래스 입니다.
+        기본값은 None이며, 자동으로 ClientSession을 생성하게 됩니다.
+        직접 전달한 ClientSession은 :meth:`close` 를 통하여 종료되지 않습니다.
+    limit: Optional[int]
+        커넥션 풀에서 동시에 열 수 있는 최대 커넥션 수 입니다. 기본값은 100개 입니다.
+    limit_per_host: Optional[int]
+        호스트(웹사이트) 하나당 동시에 열 수 있는 최대 커넥션 수 입니다. 기본값은 10개 입니다.
+    ttl_dns_cache: Optional[int]
+        DNS 조회 결과를 캐시할 시간(초)입니다. 기본값은 300초(5분) 입니다.
+    keepalive_timeout: Optional[float]
+        사용하지 않는 커넥션을 유지할 시간(초)입니다. 기본값은 60초 입니다.
+    """
+    def __init__(self,
+                 session: aiohttp.ClientSession = None,
+                 limit: int = 100,
+                 limit_per_host: int = 10,
+                 ttl_dns_cache: int = 300,
+                 keepalive_timeout: float = 60.0):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.ttl_dns_cache = ttl_dns_cache
+        self.keepalive_timeout = keepalive_timeout
+
+        self._session: Optional[aiohttp.ClientSession] = session
+        self._owner: bool = session is None
+
+    @property
+    def session(self) -> Optional[aiohttp.ClientSession]:
+        """ 현재 사용 중인 ClientSession 입니다. 아직 요청이 발생하지 않았다면 None 입니다."""
+        return self._session
+
+    @property
+    def closed(self) -> bool:
+        """ ClientSession이 생성되지 않았거나, 종료된 경우 `True`를 리턴합니다."""
+        return self._session is None or self._session.closed
+
+    def _create_connector(self) -> aiohttp.TCPConnector:
+        return aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            use_dns_cache=True,
+            ttl_dns_cache=self.ttl_dns_cache,
+            keepalive_timeout=self.keepalive_timeout
+        )
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """
+        본 함수는 코루틴(비동기)함수 입니다.
+
+        공유 중인 ClientSession을 불러옵니다. ClientSession이 없거나 종료되었다면 새롭게 생성합니다.
+
+        Returns
+        -------
+        aiohttp.ClientSession:
+            모든 Http 클라이언트가 공유하는 ClientSession 입니다.
+        """
+        if self.closed:
+            if self._session is not None:
+                log.debug("Shared session was closed. Creating a new session.")
+            self._session = aiohttp.ClientSession(connector=self._create_connector())
+            self._owner = True
+        return self._session
+
+    async def close(self):
+        """
+        본 함수는 코루틴(비동기)함수 입니다.
+
+        SessionManager가 직접 생성한 ClientSession을 종료합니다.
+        사용자가 전달한 ClientSession은 종료하지 않습니다.
+        """
+        if self._owner and not self.closed:
+            await self._session.close()
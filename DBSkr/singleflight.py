@@ -0,0 +1,97 @@
+"""MIT License
+
+Copyright (c) 2021 gunyu1019
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+
+from typing import Any, Awaitable, Callable, Dict, Hashable
+from urllib.parse import urlencode
+
+
+def request_params(params: dict) -> dict:
+    """ 쿼리 값을 요청에 사용할 수 있는 문자열로 변환합니다.
+    None 인 값은 제외하며, bool 값은 `true`/`false` 로 변환합니다."""
+    result = dict()
+    for key, value in params.items():
+        if value is None:
+            continue
+        elif isinstance(value, bool):
+            value = str(value).lower()
+        result[key] = str(value)
+    return result
+
+
+def request_key(method: str, url: str, params: dict = None) -> str:
+    """ 요청 방식과 주소, 쿼리를 통하여 같은 요청을 구분하는 키 값을 만듭니다.
+    쿼리의 순서가 다르더라도 같은 요청으로 취급합니다."""
+    key = "{} {}".format(method.upper(), url)
+    if params:
+        key += "?" + urlencode(sorted(params.items()))
+    return key
+
+
+class SingleFlight:
+    """ 같은 키 값을 가진 요청이 동시에 들어오면, 하나의 요청만 보내고 결과를 모든 요청에 공유합니다.
+
+    먼저 요청한 쪽이 취소(Cancel)되더라도 같은 결과를 기다리는 다른 요청에는 영향을 주지 않습니다.
+    """
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future] = dict()
+
+    def __len__(self):
+        return len(self._calls)
+
+    def __contains__(self, key: Hashable):
+        return key in self._calls
+
+    def _done(self, key: Hashable, future: asyncio.Future):
+        if self._calls.get(key) is future:
+            self._calls.pop(key)
+
+        # 모든 요청이 취소된 경우에도 예외가 처리되지 않았다는 경고가 발생하지 않도록 합니다.
+        if not future.cancelled():
+            future.exception()
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        본 함수는 코루틴(비동기)함수 입니다.
+
+        `key` 에 해당하는 요청이 진행 중이라면 그 결과를 기다리고, 그렇지 않다면 `func` 를 실행합니다.
+
+        Parameters
+        ----------
+        key: Hashable
+            같은 요청을 구분하는 키 값 입니다.
+        func: Callable[[], Awaitable]
+            요청을 보내는 코루틴 함수 입니다.
+
+        Returns
+        -------
+        Any:
+            `func` 의 결과 값 입니다.
+        """
+        future = self._calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(func())
+            self._calls[key] = future
+            future.add_done_callback(lambda f: self._done(key, f))
+        return await asyncio.shield(future)
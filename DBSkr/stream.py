@@ -0,0 +1,121 @@
+"""MIT License
+
+Copyright (c) 2021 gunyu1019
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import codecs
+import json
+from typing import Any, AsyncIterable, AsyncIterator
+
+_decoder = json.JSONDecoder()
+_whitespace = " \t\n\r"
+
+
+async def iter_json_array(chunks: AsyncIterable[bytes], key: str = None) -> AsyncIterator[Any]:
+    """ 응답 스트림에 포함된 JSON 배열을 조금씩 읽으며, 배열의 항목을 하나씩 반환하는 비동기 제너레이터 입니다.
+    응답 전체를 한 번에 불러오지 않으므로, 배열의 크기와 관계없이 항목 하나 만큼의 메모리만 사용합니다.
+
+    Parameters
+    ----------
+    chunks: AsyncIterable[bytes]
+        응답 스트림 입니다. (예: `aiohttp.ClientResponse.content.iter_any()`)
+    key: Optional[str]
+        배열이 객체 안에 포함된 경우, 배열에 해당하는 키 값 입니다. 처음으로 나오는 `"key": [` 부터 읽습니다.
+        기본값은 None이며, 응답 전체가 배열이어야 합니다.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    iterator = chunks.__aiter__()
+    buffer = ""
+    position = 0
+    finished = False
+
+    async def read() -> bool:
+        nonlocal buffer, position, finished
+        if finished:
+            return False
+        try:
+            chunk = await iterator.__anext__()
+        except StopAsyncIteration:
+            finished = True
+            buffer = buffer[position:] + decoder.decode(b"", final=True)
+        else:
+            # 이미 읽은 부분은 버퍼에서 삭제합니다.
+            buffer = buffer[position:] + decoder.decode(chunk)
+        position = 0
+        return True
+
+    async def skip(characters: str) -> str:
+        nonlocal position
+        while True:
+            while position < len(buffer) and buffer[position] in characters:
+                position += 1
+            if position < len(buffer):
+                return buffer[position]
+            if not await read():
+                raise ValueError("Unexpected end of JSON stream")
+
+    # 배열의 시작 부분을 찾습니다.
+    if key is not None:
+        token = json.dumps(key)
+        while True:
+            index = buffer.find(token, position)
+            if index != -1:
+                position = index + len(token)
+                if await skip(_whitespace) == ":":
+                    position += 1
+                    if await skip(_whitespace) == "[":
+                        break
+                continue
+            # 키 값이 두 조각으로 나뉘어 들어올 수 있으므로, 끝 부분은 남겨둡니다.
+            position = max(position, len(buffer) - len(token))
+            if not await read():
+                return
+
+    if await skip(_whitespace) != "[":
+        raise ValueError("JSON stream is not an array")
+    position += 1
+
+    if await skip(_whitespace) == "]":
+        return
+
+    while True:
+        await skip(_whitespace)
+        while True:
+            try:
+                item, end = _decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if not await read():
+                    raise
+                continue
+            # 숫자와 같이 끝을 알 수 없는 값은 다음 구분자가 들어올 때까지 기다립니다.
+            if end == len(buffer) and not finished:
+                await read()
+                continue
+            break
+        position = end
+        yield item
+
+        separator = await skip(_whitespace)
+        position += 1
+        if separator == "]":
+            return
+        if separator != ",":
+            raise ValueError("Unexpected character {!r} in JSON array".format(separator))
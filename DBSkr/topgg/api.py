@@ -24,10 +24,15 @@ SOFTWARE.
 import logging
 import aiohttp
 import asyncio
-import json
-import time
+from typing import Any, AsyncIterator
 
 from .errors import *
+from ..cache import Cache
+from ..codec import JSONCodec, default_codec
+from ..ratelimit import RateLimiter, RateLimitStore
+from ..session import SessionManager
+from ..singleflight import SingleFlight, request_key, request_params
+from ..stream import iter_json_array
 
 log = logging.getLogger(__name__)
 
@@ -37,35 +42,52 @@ class Api:
                  token: str,
                  session: aiohttp.ClientSession = None,
                  loop: asyncio.AbstractEventLoop = None,
-                 refresh_session: int = 300):
+                 session_manager: SessionManager = None,
+                 ratelimit_store: RateLimitStore = None,
+                 cache: Cache = None,
+                 codec: JSONCodec = None):
         self.BASE = "https://top.gg/api"
         self.token = token
         self.loop = loop
-        if session is not None:
-            self.session = session
-        else:
-            self.session = aiohttp.ClientSession(loop=self.loop)
-
-        self._session_start = time.time()
-        self.refresh_session_period = refresh_session
+        if session_manager is None:
+            session_manager = SessionManager(session=session)
+        self.session_manager = session_manager
+        # top.gg 는 사용량 제한 헤더를 보내주지 않으므로, 문서에 명시된 분당 60회를 기본값으로 사용합니다.
+        self.ratelimit = RateLimiter(name="topgg", store=ratelimit_store, quota=(60, 60.0))
+        self.flight = SingleFlight()
+        self.cache = cache
+        self.codec = codec or default_codec()
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        return self.session_manager.session
 
     async def close(self):
-        await self.session.close()
-
-    async def refresh_session(self):
-        await self.session.close()
-        self.session = aiohttp.ClientSession(loop=self.loop)
-        self._session_start = time.time()
-
-    async def get_session(self):
-        if not self.session:
-            await self.refresh_session()
-        elif 0 <= self.refresh_session_period <= time.time() - self._session_start:
-            await self.refresh_session()
-        return self.session
-
-    async def requests(self, method: str, path: str, **kwargs):
-        url = "{}{}".format(self.BASE, path)
+        await self.session_manager.close()
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        return await self.session_manager.get_session()
+
+    def url(self, path: str) -> str:
+        return "{}{}".format(self.BASE, path)
+
+    async def requests(self, method: str, path: str, endpoint: str = None, **kwargs):
+        url = self.url(path)
+        if 'params' in kwargs:
+            kwargs['params'] = request_params(kwargs['params'])
+
+        if method.upper() != "GET":
+            return await self._requests(method, url, path, **kwargs)
+
+        # 같은 GET 요청이 동시에 들어오면 하나의 요청으로 처리합니다.
+        key = request_key(method, url, kwargs.get('params'))
+        if self.cache is not None and endpoint is not None:
+            return await self.cache.fetch(
+                key, lambda: self.flight.do(key, lambda: self._requests(method, url, path, **kwargs)), endpoint=endpoint
+            )
+        return await self.flight.do(key, lambda: self._requests(method, url, path, **kwargs))
+
+    async def _requests(self, method: str, url: str, path: str, **kwargs):
         headers = {
             'Content-Type': 'application/json'
         }
@@ -76,38 +98,76 @@ class Api:
             kwargs['headers'].update(headers)
         else:
             kwargs['headers'] = headers
+        if 'json' in kwargs:
+            kwargs['data'] = self.codec.dumps(kwargs.pop('json'))
 
+        route = self.ratelimit.route(method, path)
         for tries in range(5):
+            await self.ratelimit.acquire(route)
             session = await self.get_session()
             async with session.request(method, url, **kwargs) as response:
-                if response.content_type == "application/json":
-                    data = await response.json()
-                else:
-                    fp_data = await response.text()
-                    data = json.loads(fp_data)
+                data = await self.codec.read(response)
                 log.debug(f'{method} {url} returned {response.status}')
 
+                bucket = await self.ratelimit.update(route, response.headers, response.status)
                 if response.status == 429:
-                    retry_after = float(response.headers.get('retry-after'))
-
-                    log.warning(f"Rate limited. Retry in {retry_after} seconds | Tries: {tries}")
-                    await asyncio.sleep(retry_after)
+                    log.warning(f"Rate limited. Retry in {bucket.delay():.2f} seconds | Tries: {tries}")
                     continue
 
                 if 200 <= response.status < 300:
                     return data
-                elif response.status == 400:
-                    raise BadRequests(response, data)
-                elif response.status == 401:
-                    raise Unauthorized(response, data)
-                elif response.status == 403:
-                    raise Forbidden(response, data)
-                elif response.status == 404:
-                    raise NotFound(response, data)
-                else:
-                    raise HTTPException(response, data)
+                raise self._exception(response, data)
         raise TooManyRequests(response, data)
 
+    @staticmethod
+    def _exception(response: aiohttp.ClientResponse, data) -> HTTPException:
+        if response.status == 400:
+            return BadRequests(response, data)
+        elif response.status == 401:
+            return Unauthorized(response, data)
+        elif response.status == 403:
+            return Forbidden(response, data)
+        elif response.status == 404:
+            return NotFound(response, data)
+        return HTTPException(response, data)
+
+    async def stream(self, method: str, path: str, key: str = None, **kwargs) -> AsyncIterator[Any]:
+        """ 응답에 포함된 JSON 배열을 스트림으로 읽으며, 항목을 하나씩 반환합니다.
+        같은 요청을 하나로 묶거나 캐시에 저장하지 않습니다."""
+        url = self.url(path)
+        if 'params' in kwargs:
+            kwargs['params'] = request_params(kwargs['params'])
+
+        headers = {
+            'Content-Type': 'application/json'
+        }
+        if self.token is not None:
+            headers['Authorization'] = self.token
+        kwargs.setdefault('headers', dict()).update(headers)
+
+        route = self.ratelimit.route(method, path)
+        for tries in range(5):
+            await self.ratelimit.acquire(route)
+            session = await self.get_session()
+            async with session.request(method, url, **kwargs) as response:
+                log.debug(f'{method} {url} returned {response.status}')
+                bucket = await self.ratelimit.update(route, response.headers, response.status)
+                if response.status == 429:
+                    log.warning(f"Rate limited. Retry in {bucket.delay():.2f} seconds | Tries: {tries}")
+                    continue
+
+                if 200 <= response.status < 300:
+                    async for item in iter_json_array(response.content.iter_any(), key=key):
+                        yield item
+                    return
+
+                try:
+                    data = await self.codec.read(response)
+                except ValueError:
+                    data = None
+                raise self._exception(response, data)
+        raise TooManyRequests(response, None)
+
     async def get(self, path: str, **kwargs):
         return await self.requests("GET", path, **kwargs)
 
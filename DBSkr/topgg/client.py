@@ -25,13 +25,18 @@ import aiohttp
 import logging
 import discord
 
-from typing import Union, Dict, Sequence, List
+from typing import AsyncIterator, Union, Dict, Sequence, List, Optional
 
 from .enums import WidgetType
 from .errors import *
 from .https import HttpClient
 from .models import Stats, Vote, VotedUser, Bot, User, Search
 from .widget import Widget
+from ..cache import SQLiteCacheStore
+from ..poller import VotePoller
+from ..voters import VoterSet
+from ..enums import WebsiteType
+from ..events import VoteEvent
 
 log = logging.getLogger(__name__)
 
@@ -61,18 +66,35 @@ class Client:
     autopost_interval: Optional[int]
         `autopost` 를 활성화하였을 때 작동하는 매개변수 입니다. 초단위로 주기를 설정합니다.
         기본값은 3600초(30분) 간격으로 설정됩니다. 만약 설정할 경우 무조건 900분(15분) 이상 설정해야합니다.
+    poll: Optional[bool]
+        투표 목록을 주기적으로 불러와 새로 투표를 누른 사용자마다 `on_dbskr_vote` 이벤트를 발생시킬지 설정합니다. 기본값은 False 입니다.
+        웹훅을 사용할 수 없는 경우에 사용해주세요.
+    poll_interval: Optional[int]
+        `poll` 을 활성화하였을 때 작동하는 매개변수 입니다. 초단위로 주기를 설정합니다.
+        기본값은 300초(5분) 간격으로 설정됩니다. 만약 설정할 경우 무조건 60초(1분) 이상 설정해야합니다.
+    poll_store: Optional[SQLiteCacheStore]
+        `poll` 의 기준점과 확인한 사용자 목록을 저장할 저장소 입니다.
+        기본값은 None이며, 프로세스를 재시작하면 처음 불러온 목록을 다시 기준으로 사용합니다.
+    keep_data: Optional[bool]
+        모델에 응답 값(`data`)을 보관할지 설정합니다. 기본값은 True 입니다.
+        False일 경우 모델을 만든 후 응답 값을 보관하지 않아 메모리를 적게 사용하며, 모델의 `data` 는 None 입니다.
+        아직 변환하지 않은 값(프로필 사진, 소유자 등)은 원본 중 필요한 값만 남겨두고 처음 접근할 때 변환합니다.
     """
     def __init__(self,
                  bot: discord.Client, token: str = None,
                  session: aiohttp.ClientSession = None,
                  loop: asyncio.AbstractEventLoop = None,
                  autopost: bool = True,
-                 autopost_interval: int = 3600):
+                 autopost_interval: int = 3600,
+                 poll: bool = False,
+                 poll_interval: int = 300,
+                 poll_store: SQLiteCacheStore = None,
+                 keep_data: bool = True):
         self.token = token
         self.client = bot
 
         self.loop = loop or self.client.loop
-        self.http = HttpClient(token=token, session=session, loop=self.loop)
+        self.http = HttpClient(token=token, session=session, loop=self.loop, keep_data=keep_data)
 
         self.autopost = autopost
         self.autopost_interval: int = autopost_interval
@@ -83,6 +105,17 @@ class Client:
 
             self.autopost_task = self.loop.create_task(self._auto_post())
 
+        self.poll = poll
+        self.poll_interval: int = poll_interval
+        self.poll_store = poll_store
+        self.poller: Optional[VotePoller] = None
+
+        if poll:
+            if self.poll_interval < 60:
+                raise ClientException("poll_interval must be greater than or equal to 60 seconds(1 minute)")
+
+            self.poll_task = self.loop.create_task(self._poll_votes())
+
     async def _auto_post(self):
         """
         본 함수는 코루틴(비동기)함수 입니다.
@@ -105,6 +138,36 @@ class Client:
                 pass
             await asyncio.sleep(self.autopost_interval)
 
+    async def _poll_votes(self):
+        """
+        본 함수는 코루틴(비동기)함수 입니다.
+
+        투표 목록을 주기적으로 불러와, 새로 투표를 누른 사용자마다 `on_dbskr_vote` 이벤트를 발생시킵니다.
+        이벤트에는 웹훅과 같은 :class:`DBSkr.VoteEvent` 가 전달되며, `vote` 에는 :class:`VotedUser` 가 포함됩니다.
+        """
+        await self.client.wait_until_ready()
+        self.poller = VotePoller(key="topgg:{}".format(self.client.user.id),
+                                 fetch=self.iter_votes,
+                                 ordered=True,
+                                 store=self.poll_store)
+        while not self.client.is_closed():
+            try:
+                bot_id = str(self.client.user.id)
+                for user in await self.poller.poll():
+                    self.client.dispatch("dbskr_vote", VoteEvent(
+                        web_type=WebsiteType.topgg,
+                        bot_id=bot_id,
+                        user_id=str(user.id),
+                        vote=user,
+                        data=user.data
+                    ))
+            except (HTTPException, aiohttp.ClientError, asyncio.TimeoutError, ValueError) as exception:
+                # 응답이 잘렸거나 올바른 JSON이 아닌 경우(ValueError)에도 다음 주기에 다시 시도합니다.
+                log.warning(f"Failed to poll votes from topgg: {exception.__class__.__name__} {exception}")
+            except Exception:
+                log.exception("Unexpected error while polling votes from topgg")
+            await asyncio.sleep(self.poll_interval)
+
     def guild_count(self) -> int:
         """`discord.Client`의 .guilds 값에 있는 목록의 갯수를 읽어옵니다."""
         return len(self.client.guilds)
@@ -169,6 +232,31 @@ class Client:
         """
         return await self.http.votes(bot_id=self.client.user.id)
 
+    def iter_votes(self) -> AsyncIterator[VotedUser]:
+        """
+        투표를 누른 사용자 목록을 응답을 받는 대로 하나씩 불러옵니다.
+        응답 전체를 한 번에 불러오지 않으므로, 투표한 사용자 수와 관계없이 일정한 메모리를 사용합니다.
+
+        Returns
+        -------
+        AsyncIterator[VotedUser]:
+            Top.gg로 부터 투표 누른 사용자에 대한 정보가 포함되어 있습니다.
+        """
+        return self.http.iter_votes(bot_id=self.client.user.id)
+
+    async def voters(self) -> VoterSet:
+        """
+        본 함수는 코루틴(비동기)함수 입니다.
+
+        투표를 누른 사용자의 ID 목록을 :class:`DBSkr.VoterSet` 으로 불러옵니다.
+
+        Returns
+        -------
+        VoterSet:
+            Top.gg로 부터 투표 누른 사용자의 ID 목록이 포함되어 있습니다.
+        """
+        return await self.http.voters(bot_id=self.client.user.id)
+
     async def bot(self, bot_id: int = None) -> Bot:
         """
         본 함수는 코루틴(비동기)함수 입니다.
@@ -220,6 +308,48 @@ class Client:
         """
         return await self.http.search(sort=sort, search=search, fields=fields, limit=limit, offset=offset)
 
+    def iter_search(self,
+                    sort: str = None,
+                    search: Dict[str, str] = None,
+                    fields: Sequence[str] = None,
+                    limit: int = None,
+                    offset: int = 0,
+                    prefetch: int = 2,
+                    chunk_size: int = 500) -> AsyncIterator[Bot]:
+        """
+        Top.gg에서 봇을 검색한 결과를 `total` 까지 하나씩 불러옵니다.
+        `offset` 을 `chunk_size` 개씩 옮기며, 현재 결과를 처리하는 동안 다음 결과를 최대 `prefetch` 번 미리 불러옵니다.
+
+        .. code-block:: python3
+
+            async for bot in client.iter_search(sort="points", fields=["id", "username", "points"]):
+                ...
+
+        Parameters
+        ----------
+        sort: Optional[str]
+            정렬이 되는 기준이 포함됩니다.
+        search: Optional[Dict[str, str]]
+            검색할 디스코드 봇의 이름이 포함됩니다.
+        fields: Optional[Sequence[str]]
+            불러올 필드 목록입니다. 값이 있을 경우 해당 필드만 전송되며, 일부 정보만 포함된 봇 정보(`partial`)를 반환합니다.
+        limit: Optional[int]
+            불러올 최대 봇 수 입니다. 기본값은 None이며, 검색된 모든 봇을 불러옵니다.
+        offset: Optional[int]
+            건너 뛸 디스코드 봇의 갯수가 포함됩니다. 기본 값은 0입니다.
+        prefetch: Optional[int]
+            미리 불러올 최대 요청 수 입니다. 기본값은 2 입니다.
+        chunk_size: Optional[int]
+            한 번의 요청으로 불러올 봇의 갯수 입니다. 기본값과 최댓값은 500개 입니다.
+
+        Returns
+        -------
+        AsyncIterator[Bot]:
+            Top.gg로 부터 들어온 봇 정보가 포함되어 있습니다.
+        """
+        return self.http.iter_search(sort=sort, search=search, fields=fields, limit=limit, offset=offset,
+                                     prefetch=prefetch, chunk_size=chunk_size)
+
     async def users(self, user_id: int) -> User:
         """
         본 함수는 코루틴(비동기)함수 입니다.
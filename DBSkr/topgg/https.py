@@ -23,12 +23,18 @@ SOFTWARE.
 
 import aiohttp
 import asyncio
-from typing import Union, Sequence, List
+from typing import AsyncIterator, Dict, Iterable, Union, Sequence, List
 
 from .api import Api
 from .models import Bot, Search, Stats, VotedUser, User, Vote
 from .enums import WidgetType
 from .widget import Widget
+from ..bulk import gather_map, iter_pages
+from ..cache import Cache, VoteCache
+from ..codec import JSONCodec
+from ..ratelimit import RateLimiter, RateLimitStore
+from ..session import SessionManager
+from ..voters import VoterSet
 
 
 class HttpClient:
@@ -46,13 +52,54 @@ class HttpClient:
         비동기를 사용하기 위한 asyncio.AbstractEventLoop 입니다.
         기본값은 None 입니다.
         기본 asyncio.AbstractEventLoop는 asyncio.get_event_loop()를 사용하여 얻습니다.
+    session_manager: Optional[SessionManager]
+        여러 Http 클라이언트가 커넥션 풀을 공유하기 위한 SessionManager 입니다.
+        기본값은 None이며, `session` 값을 사용하는 SessionManager를 생성하게 됩니다.
+    ratelimit_store: Optional[RateLimitStore]
+        사용량 제한 정보를 저장할 저장소 입니다. 기본값은 None이며, 프로세스 메모리에 저장합니다.
+        여러 프로세스가 사용량 제한 정보를 공유하려면 :class:`DBSkr.SQLiteRateLimitStore` 를 전달해주세요.
+    cache: Optional[Cache]
+        봇 정보(:meth:`bot`)와 사용자 정보(:meth:`users`)를 저장할 캐시 입니다. 기본값은 None이며, 캐시를 사용하지 않습니다.
+    vote_cache: Optional[VoteCache]
+        사용자의 투표 여부(:meth:`vote`)를 저장할 캐시 입니다. 기본값은 None이며, 캐시를 사용하지 않습니다.
+    keep_data: Optional[bool]
+        모델에 응답 값(`data`)을 보관할지 설정합니다. 기본값은 True 입니다.
+        False일 경우 모델을 만든 후 응답 값을 보관하지 않아 메모리를 적게 사용하며, 모델의 `data` 는 None 입니다.
+        아직 변환하지 않은 값(프로필 사진, 소유자 등)은 원본 중 필요한 값만 남겨두고 처음 접근할 때 변환합니다.
+    codec: Optional[JSONCodec]
+        응답 값과 요청 본문을 변환할 JSON 변환기 입니다. 기본값은 None이며, `orjson` 이 설치되어 있다면 `orjson` 을,
+        그렇지 않다면 파이썬 표준 라이브러리(`json`)를 사용합니다.
     """
     def __init__(self, token: str = None,
                  session: aiohttp.ClientSession = None,
-                 loop: asyncio.AbstractEventLoop = None):
+                 loop: asyncio.AbstractEventLoop = None,
+                 session_manager: SessionManager = None,
+                 ratelimit_store: RateLimitStore = None,
+                 cache: Cache = None,
+                 vote_cache: VoteCache = None,
+                 keep_data: bool = True,
+                 codec: JSONCodec = None):
         self.token = token
-        self.requests = Api(token=token, session=session, loop=loop)
+        self.requests = Api(token=token, session=session, loop=loop,
+                            session_manager=session_manager, ratelimit_store=ratelimit_store,
+                            cache=cache,
+                            codec=codec)
         self.session = session
+        self.vote_cache = vote_cache
+        self.keep_data = keep_data
+
+    @property
+    def ratelimit(self) -> RateLimiter:
+        """ Top.gg API의 경로별 사용량 제한 정보를 불러옵니다."""
+        return self.requests.ratelimit
+
+    async def close(self):
+        """
+        본 함수는 코루틴(비동기)함수 입니다.
+
+        Http 클라이언트가 사용하는 세션을 종료합니다.
+        """
+        await self.requests.close()
 
     async def bot(self, bot_id: int) -> Bot:
         """
@@ -72,13 +119,13 @@ class HttpClient:
         """
         path = "/bots/{bot_id}".format(bot_id=bot_id)
 
-        result = await self.requests.get(path=path)
-        return Bot(result)
+        result = await self.requests.get(path=path, endpoint="bot")
+        return Bot(result, session=self.requests.session_manager, keep_data=self.keep_data)
 
     async def search(self,
                      sort: str = None,
-                     search=None,
-                     fields: Sequence[str] = "",
+                     search: Dict[str, str] = None,
+                     fields: Sequence[str] = None,
                      limit: int = 50,
                      offset: int = 0) -> Search:
         """
@@ -106,9 +153,13 @@ class HttpClient:
         """
         if search is None:
             search = {}
+        if fields is None:
+            fields = ""
 
         limit = min(limit, 500)
-        fields = ", ".join(fields)
+        partial = len(fields) != 0
+        if not isinstance(fields, str):
+            fields = ",".join(fields)
         search = " ".join([f"{field}: {value}" for field, value in search.items()])
 
         data = {
@@ -120,8 +171,55 @@ class HttpClient:
         }
         path = "/search"
 
-        result = await self.requests.get(path=path, query=data)
-        return Search(result)
+        result = await self.requests.get(path=path, params=data)
+        return Search(result, session=self.requests.session_manager, partial=partial,
+                      keep_data=self.keep_data)
+
+    def iter_search(self,
+                    sort: str = None,
+                    search: Dict[str, str] = None,
+                    fields: Sequence[str] = None,
+                    limit: int = None,
+                    offset: int = 0,
+                    prefetch: int = 2,
+                    chunk_size: int = 500) -> AsyncIterator[Bot]:
+        """
+        Top.gg에서 봇을 검색한 결과를 `total` 까지 하나씩 불러옵니다.
+        `offset` 을 `chunk_size` 개씩 옮기며, 현재 결과를 처리하는 동안 다음 결과를 최대 `prefetch` 번 미리 불러옵니다.
+        중간에 반복을 멈추면 남은 요청은 취소됩니다.
+
+        Parameters
+        ----------
+        sort: Optional[str]
+            정렬이 되는 기준이 포함됩니다.
+        search: Optional[Dict[str, str]]
+            검색할 디스코드 봇의 이름이 포함됩니다.
+        fields: Optional[Sequence[str]]
+            불러올 필드 목록입니다. 값이 있을 경우 해당 필드만 전송되며, 일부 정보만 포함된 봇 정보(`partial`)를 반환합니다.
+            봇을 구분하기 위하여 `id` 필드는 항상 포함됩니다.
+        limit: Optional[int]
+            불러올 최대 봇 수 입니다. 기본값은 None이며, 검색된 모든 봇을 불러옵니다.
+        offset: Optional[int]
+            건너 뛸 디스코드 봇의 갯수가 포함됩니다. 기본 값은 0입니다.
+        prefetch: Optional[int]
+            미리 불러올 최대 요청 수 입니다. 기본값은 2 입니다.
+        chunk_size: Optional[int]
+            한 번의 요청으로 불러올 봇의 갯수 입니다. 기본값과 최댓값은 500개 입니다.
+
+        Returns
+        -------
+        AsyncIterator[Bot]:
+            Top.gg로 부터 들어온 봇 정보가 포함되어 있습니다.
+        """
+        chunk_size = min(chunk_size, 500)
+        if fields is not None and not isinstance(fields, str) and len(fields) != 0 and "id" not in fields:
+            fields = ["id"] + list(fields)
+
+        async def fetch(_offset: int):
+            result = await self.search(sort=sort, search=search, fields=fields, limit=chunk_size, offset=_offset)
+            return result.results, result.total - 1 if result.total is not None else None
+
+        return iter_pages(fetch, start=offset, step=chunk_size, prefetch=prefetch, limit=limit)
 
     async def vote(self, bot_id: int, user_id: int) -> Vote:
         """
@@ -141,12 +239,49 @@ class HttpClient:
         Vote:
             Top.gg로 부터 들어온 사용자 투표 정보에 대한 정보가 포함되어 있습니다.
         """
+        if self.vote_cache is not None:
+            result = await self.vote_cache.load("topgg", bot_id, user_id)
+            if result is not None:
+                return Vote(result, keep_data=self.keep_data)
+
         data = {
             "userId": str(user_id)
         }
         path = "/bots/{bot_id}/check".format(bot_id=bot_id)
-        result = await self.requests.get(path=path, query=data)
-        return Vote(result)
+        result = await self.requests.get(path=path, params=data)
+        vote = Vote(result, keep_data=self.keep_data)
+        if self.vote_cache is not None:
+            self.vote_cache.set("topgg", bot_id, user_id, result, voted=bool(vote.voted))
+        return vote
+
+    async def vote_many(self, bot_id: int, user_ids: Iterable[int],
+                        concurrency: int = 8, return_exceptions: bool = False) -> Dict[int, Vote]:
+        """
+        본 함수는 코루틴(비동기)함수 입니다.
+
+        `user_ids`에 들어있는 사용자들이 봇에 투표를 누른 여부에 대하여 한 번에 불러옵니다.
+        중복된 사용자는 한 번만 불러오며, 캐시에 저장된 사용자는 API를 호출하지 않습니다.
+        요청은 최대 `concurrency` 개씩 동시에 보내지며, 사용량 제한에 걸리면 초기화될 때까지 순서대로 대기합니다.
+
+        Parameters
+        ----------
+        bot_id: int
+            봇 ID 값이 포함됩니다.
+        user_ids: Iterable[int]
+            유저 ID 값 목록이 포함되어 있습니다.
+        concurrency: Optional[int]
+            동시에 보낼 최대 요청 갯수 입니다. 기본값은 8개 입니다.
+        return_exceptions: Optional[bool]
+            True일 경우 예외가 발생한 사용자는 결과 대신 예외가 포함됩니다.
+            False일 경우 처음 발생한 예외를 그대로 발생시킵니다. 기본값은 False 입니다.
+
+        Returns
+        -------
+        Dict[int, Vote]:
+            유저 ID 별로 Top.gg로 부터 들어온 사용자 투표 정보가 포함되어 있습니다.
+        """
+        return await gather_map(lambda user_id: self.vote(bot_id=bot_id, user_id=user_id), user_ids,
+                                concurrency=concurrency, return_exceptions=return_exceptions)
 
     async def votes(self, bot_id: int) -> List[VotedUser]:
         """
@@ -166,7 +301,56 @@ class HttpClient:
         """
         path = "/bots/{bot_id}/votes".format(bot_id=bot_id)
         result = await self.requests.get(path=path)
-        return [VotedUser(user) for user in result]
+        return [VotedUser(user, session=self.requests.session_manager, keep_data=self.keep_data) for user in result]
+
+    async def iter_votes(self, bot_id: int) -> AsyncIterator[VotedUser]:
+        """
+        투표를 누른 사용자 목록을 응답을 받는 대로 하나씩 불러옵니다.
+        응답 전체를 한 번에 불러오지 않으므로, 투표한 사용자 수와 관계없이 일정한 메모리를 사용합니다.
+
+        .. code-block:: python3
+
+            async for user in client.iter_votes(bot_id):
+                ...
+
+        Parameters
+        ----------
+        bot_id: int
+            봇 ID 값이 포함됩니다.
+
+        Returns
+        -------
+        AsyncIterator[VotedUser]:
+            Top.gg로 부터 투표 누른 사용자에 대한 정보가 포함되어 있습니다.
+        """
+        path = "/bots/{bot_id}/votes".format(bot_id=bot_id)
+        async for user in self.requests.stream("GET", path=path):
+            yield VotedUser(user, session=self.requests.session_manager, keep_data=self.keep_data)
+
+    async def voters(self, bot_id: int) -> VoterSet:
+        """
+        본 함수는 코루틴(비동기)함수 입니다.
+
+        투표를 누른 사용자의 ID 목록을 :class:`DBSkr.VoterSet` 으로 불러옵니다.
+        사용자 정보 모델을 만들지 않으므로 :meth:`votes` 보다 적은 메모리를 사용하며,
+        사용자 정보는 :meth:`DBSkr.VoterSet.get` 혹은 :meth:`DBSkr.VoterSet.materialize` 로 불러올 수 있습니다.
+
+        Parameters
+        ----------
+        bot_id: int
+            봇 ID 값이 포함됩니다.
+
+        Returns
+        -------
+        VoterSet:
+            Top.gg로 부터 투표 누른 사용자의 ID 목록이 포함되어 있습니다.
+        """
+        path = "/bots/{bot_id}/votes".format(bot_id=bot_id)
+        result = VoterSet(loader=self.users)
+        async for user in self.requests.stream("GET", path=path):
+            if user.get("id") is not None:
+                result.add(user["id"])
+        return result
 
     async def stats(self, bot_id: int,
                     guild_count: Union[int, list] = None,
@@ -204,7 +388,7 @@ class HttpClient:
             result = await self.requests.post(path=path, json=data)
         else:
             result = await self.requests.get(path=path)
-        return Stats(result)
+        return Stats(result, keep_data=self.keep_data)
 
     async def users(self, user_id: int) -> User:
         """
@@ -225,8 +409,8 @@ class HttpClient:
         path = "/users/{user_id}".format(user_id=user_id)
 
         self.requests.version = 2
-        result = await self.requests.get(path=path)
-        return User(result)
+        result = await self.requests.get(path=path, endpoint="users")
+        return User(result, session=self.requests.session_manager, keep_data=self.keep_data)
 
     def widget(self, bot_id: int, widget_type: WidgetType = None) -> Widget:
         """
@@ -254,4 +438,4 @@ class HttpClient:
             path = "/widget/{widget_type}/{bot_id}".format(widget_type=widget_t, bot_id=bot_id)
         else:
             path = "/widget/{bot_id}".format(widget_type=widget_t, bot_id=bot_id)
-        return Widget(path=path, query=query, session=self.session)
+        return Widget(path=path, query=query, session=self.requests.session_manager)
@@ -21,15 +21,22 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-from typing import Optional
+from typing import Optional, Union
 from datetime import datetime
 
+from aiohttp import ClientSession
+
 from ..assets import DiscordAvatar
+from ..lazy import lazy_property, prune
+from ..session import SessionManager
 
 
 class BaseTopgg:
-    def __init__(self, data: dict):
-        self.data: dict = data
+    __slots__ = ("data", )
+
+    def __init__(self, data: dict, keep_data: bool = True):
+        # keep_data 가 False 일 경우, 응답 값은 모델을 만든 후 보관하지 않습니다.
+        self.data: Optional[dict] = data if keep_data else None
 
 
 class Bot(BaseTopgg):
@@ -85,13 +92,25 @@ class Bot(BaseTopgg):
         디스코드 봇의 아바타 해시값 입니다.
     verified: bool
         디스코드 봇이 인증되었다는 유/무를 반환합니다.
+    partial: bool
+        일부 필드(`fields`)만 불러온 봇 정보인지 여부 입니다. 불러오지 않은 값은 None 입니다.
     """
-    def __init__(self, data):
-        super().__init__(data)
+    __slots__ = ("_source", "_session", "partial", "id", "name", "discriminator", "_avatar", "library", "prefix",
+                 "intro", "desc", "categories", "owners", "representative_guilds", "_date", "verified", "vanity",
+                 "votes", "month_votes", "donate", "shard_count", "servers", "avatar_hash", "website", "support",
+                 "github", "invite")
+
+    def __init__(self, data,
+                 session: Union[ClientSession, SessionManager] = None,
+                 partial: bool = False,
+                 keep_data: bool = True):
+        super().__init__(data, keep_data=keep_data)
+        self._source: Optional[dict] = data
+        self._session = session
+        self.partial: bool = partial
         self.id: str = data.get("id", data.get("clientid"))
         self.name: str = data.get("username")
         self.discriminator: str = data.get("discriminator")
-        self.avatar: DiscordAvatar = DiscordAvatar(user_id=self.id, avatar=data.get("defAvatar"))
         self.library: str = data.get("lib")
         self.prefix: str = data.get("prefix")
         self.intro: str = data.get("shortdesc")
@@ -99,7 +118,6 @@ class Bot(BaseTopgg):
         self.categories: list = data.get("tag")
         self.owners: list = data.get("owners")
         self.representative_guilds: list = data.get("guilds")
-        self.date: datetime = datetime.fromisoformat(data.get("date", "1970-01-01T00:00:00").strip("Z"))
         self.verified: bool = data.get("certifiedBot")
         self.vanity: Optional[str] = data.get("vanity")
         self.votes: int = data.get("points")
@@ -112,10 +130,28 @@ class Bot(BaseTopgg):
         # Optional
         self.avatar_hash: Optional[str] = data.get("avatar")
         self.website: Optional[str] = data.get("website")
-        self.support: Optional[str] = "https://discord.gg/" + data.get("support")
+        self.support: Optional[str] = "https://discord.gg/" + data.get("support") \
+            if data.get("support") else None
         self.github: Optional[str] = data.get("github")
         self.invite: Optional[str] = data.get("invite")
 
+        if not keep_data:
+            prune(self)
+
+    @lazy_property.using("defAvatar")
+    def avatar(self) -> Optional[DiscordAvatar]:
+        avatar = self._source.get("defAvatar")
+        if avatar is None:
+            return
+        return DiscordAvatar(user_id=self.id, avatar=avatar, session=self._session)
+
+    @lazy_property
+    def date(self) -> Optional[datetime]:
+        date = self._source.get("date")
+        if date is None:
+            return
+        return datetime.fromisoformat(date.rstrip("Z"))
+
     def __eq__(self, other):
         return self.id == other.id
 
@@ -123,6 +159,8 @@ class Bot(BaseTopgg):
         return not self.__eq__(other)
 
     def __str__(self):
+        if self.discriminator is None:
+            return str(self.name or self.id)
         return self.name + "#" + self.discriminator
 
 
@@ -138,8 +176,10 @@ class Stats(BaseTopgg):
     shard_count: int
         디스코드 봇 샤드 갯수 입니다.
     """
-    def __init__(self, data):
-        super().__init__(data)
+    __slots__ = ("servers", "shards", "shard_count")
+
+    def __init__(self, data, keep_data: bool = True):
+        super().__init__(data, keep_data=keep_data)
         self.servers: Optional[int] = data.get("server_count")
         self.shards: Optional[list] = data.get("shards")
         self.shard_count: Optional[int] = data.get("shard_count")
@@ -153,8 +193,10 @@ class Vote(BaseTopgg):
     voted: bool
         하트 여부를 반환합니다.
     """
-    def __init__(self, data):
-        super().__init__(data)
+    __slots__ = ("voted", )
+
+    def __init__(self, data, keep_data: bool = True):
+        super().__init__(data, keep_data=keep_data)
         self.voted: bool = data.get("voted")
 
     def __eq__(self, other):
@@ -180,9 +222,16 @@ class Search(BaseTopgg):
     offset: int
         건너 뛸 디스코드 봇의 갯수가 포함됩니다.
     """
-    def __init__(self, data):
-        super().__init__(data)
-        self.results: list = [Bot(i) for i in data.get("results")]
+    __slots__ = ("results", "limit", "offset", "count", "total")
+
+    def __init__(self, data,
+                 session: Union[ClientSession, SessionManager] = None,
+                 partial: bool = False,
+                 keep_data: bool = True):
+        super().__init__(data, keep_data=keep_data)
+        self.results: list = [
+            Bot(i, session=session, partial=partial, keep_data=keep_data) for i in data.get("results") or []
+        ]
         self.limit: int = data.get("limit")
         self.offset: int = data.get("offset")
         self.count: int = data.get("count")
@@ -234,12 +283,19 @@ class User(BaseTopgg):
     supporter: bool
         사용자가 서포터인지 확인합니다.
     """
-    def __init__(self, data):
-        super().__init__(data)
+    __slots__ = ("_source", "_session", "id", "name", "discriminator", "_avatar", "bio", "banner", "avatar_hash",
+                 "color", "staff", "web_mod", "mod", "certified", "supporter", "youtube", "reddit", "twitter",
+                 "instagram", "github")
+
+    def __init__(self, data,
+                 session: Union[ClientSession, SessionManager] = None,
+                 keep_data: bool = True):
+        super().__init__(data, keep_data=keep_data)
+        self._source: Optional[dict] = data
+        self._session = session
         self.id: str = data.get("id")
         self.name: str = data.get("username")
         self.discriminator: str = data.get("discriminator")
-        self.avatar: DiscordAvatar = DiscordAvatar(user_id=self.id, avatar=data.get("defAvatar"))
 
         # Optional
         self.bio: Optional[str] = data.get("bio")
@@ -262,6 +318,13 @@ class User(BaseTopgg):
         self.instagram: Optional[str] = social.get("instagram")
         self.github: Optional[str] = social.get("github")
 
+        if not keep_data:
+            prune(self)
+
+    @lazy_property.using("defAvatar")
+    def avatar(self) -> DiscordAvatar:
+        return DiscordAvatar(user_id=self.id, avatar=self._source.get("defAvatar"), session=self._session)
+
 
 class VotedUser(BaseTopgg):
     """ 투표한 사용자에 대한 값입니다.
@@ -272,15 +335,30 @@ class VotedUser(BaseTopgg):
         사용자의 ID 입니다.
     name: str
         사용자의 이름 입니다.
-    avatar: DiscordAvatar
-        디스코드 봇의 프로필 사진 입니다.
+    avatar: Optional[DiscordAvatar]
+        디스코드 봇의 프로필 사진 입니다. 웹훅으로 들어온 투표 정보에는 포함되어 있지 않습니다.
     """
-    def __init__(self, data):
-        super().__init__(data)
-        self.name: str = data.get("username")
+    __slots__ = ("_source", "_session", "name", "id", "_avatar")
+
+    def __init__(self, data,
+                 session: Union[ClientSession, SessionManager] = None,
+                 keep_data: bool = True):
+        super().__init__(data, keep_data=keep_data)
+        self._source: Optional[dict] = data
+        self._session = session
+        self.name: Optional[str] = data.get("username")
         self.id: str = data.get("id")
 
-        avatar = data.get("avatar")
-        avatar = avatar.lstrip("https://cdn.discordapp.com/avatars/{}/".format(self.id))
+        if not keep_data:
+            prune(self)
+
+    @lazy_property
+    def avatar(self) -> Optional[DiscordAvatar]:
+        avatar = self._source.get("avatar")
+        if avatar is None:
+            return
+        prefix = "https://cdn.discordapp.com/avatars/{}/".format(self.id)
+        if avatar.startswith(prefix):
+            avatar = avatar[len(prefix):]
         avatar = avatar.split(".")[0]
-        self.avatar = DiscordAvatar(user_id=self.id, avatar=avatar)
+        return DiscordAvatar(user_id=self.id, avatar=avatar, session=self._session)
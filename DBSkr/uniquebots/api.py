@@ -23,35 +23,59 @@ SOFTWARE.
 
 import asyncio
 import aiohttp
+import functools
 import logging
 import json
-import time
+from typing import Any, AsyncIterator, Dict, Tuple
+
+from .errors import HTTPException
+from ..cache import Cache
+from ..codec import JSONCodec, default_codec
+from ..ratelimit import RateLimiter, RateLimitStore
+from ..session import SessionManager
+from ..singleflight import SingleFlight
+from ..stream import iter_json_array
 
 log = logging.getLogger()
 
 
-class GraphQL:
-    def __init__(self, query: str, variables: dict = None):
+class Query:
+    """ 미리 컴파일된 GraphQL 문서 입니다.
+    변수 선언과 문서의 JSON 변환은 생성할 때 한 번만 이루어지며, 요청할 때에는 변수만 변환합니다.
+
+    Parameters
+    ----------
+    query: str
+        GraphQL 문서 입니다.
+    variables: Optional[Dict[str, str]]
+        변수 이름과 GraphQL 자료형(예: `String`, `Int`) 입니다.
+    """
+    def __init__(self, query: str, variables: Dict[str, str] = None):
+        self.variables: Dict[str, str] = variables or dict()
+        query = " ".join(query.split())
+        if len(self.variables) != 0:
+            declaration = ", ".join("${}: {}!".format(key, value) for key, value in self.variables.items())
+            query = "query({})".format(declaration) + query
         self.query = query
-        self.variables = variables
-
-    def get(self):
-        _key_type = {int: "Int", str: "String", bool: "boolean"}
-        if self.variables is not None:
-            _key = [("${}: {}!".format(i, _key_type.get(type(self.variables.get(i))))) for i in self.variables.keys()]
-            key = ", ".join(_key)
-
-            return json.dumps({
-                "query": "query(%s)" % key + self.query,
-                "variables": self.variables
-            }, indent=4)
-        else:
-            return json.dumps({
-                "query": self.query
-            }, indent=4)
 
-    def set_variables(self, _variables: dict):
-        self.variables = _variables
+        self._prefix = ('{"query":' + json.dumps(query, separators=(",", ":")) + ',"variables":').encode("utf-8")
+
+    def __repr__(self):
+        return "<Query query={0.query!r}>".format(self)
+
+    def encode(self, variables: dict = None, codec: JSONCodec = None) -> bytes:
+        """ 변수를 포함한 요청 본문을 반환합니다. 변수는 `codec` 으로 변환하며, 기본값은 :func:`DBSkr.codec.default_codec` 입니다."""
+        return self._prefix + (codec or default_codec()).dumps(variables or {}) + b"}"
+
+
+@functools.lru_cache(maxsize=256)
+def _compile(query: str, variables: Tuple[Tuple[str, str], ...]) -> Query:
+    return Query(query, dict(variables))
+
+
+def compile_query(query: str, variables: Dict[str, str] = None) -> Query:
+    """ GraphQL 문서를 컴파일합니다. 최근에 사용한 256개의 문서와 변수는 저장되며, 이후에는 저장된 문서를 반환합니다."""
+    return _compile(query, tuple((variables or {}).items()))
 
 
 class Api:
@@ -59,34 +83,46 @@ class Api:
                  token: str = None,
                  session: aiohttp.ClientSession = None,
                  loop: asyncio.AbstractEventLoop = None,
-                 refresh_session: int = 300):
+                 session_manager: SessionManager = None,
+                 ratelimit_store: RateLimitStore = None,
+                 cache: Cache = None,
+                 codec: JSONCodec = None):
         self.BASE = "https://uniquebots.kr/graphql"
         self.token = token
         self.loop = loop
-        if session is not None:
-            self.session = session
-        else:
-            self.session = aiohttp.ClientSession(loop=self.loop)
-
-        self._session_start = time.time()
-        self.refresh_session_period = refresh_session
+        if session_manager is None:
+            session_manager = SessionManager(session=session)
+        self.session_manager = session_manager
+        self.ratelimit = RateLimiter(name="uniquebots", store=ratelimit_store)
+        self.flight = SingleFlight()
+        self.cache = cache
+        self.codec = codec or default_codec()
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        return self.session_manager.session
 
     async def close(self):
-        await self.session.close()
-
-    async def refresh_session(self):
-        await self.session.close()
-        self.session = aiohttp.ClientSession(loop=self.loop)
-        self._session_start = time.time()
-
-    async def get_session(self):
-        if not self.session:
-            await self.refresh_session()
-        elif 0 <= self.refresh_session_period <= time.time() - self._session_start:
-            await self.refresh_session()
-        return self.session
-
-    async def requests(self, data: GraphQL, **kwargs):
+        await self.session_manager.close()
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        return await self.session_manager.get_session()
+
+    async def requests(self, data: Query, variables: dict = None,
+                       coalesce: bool = True, endpoint: str = None, **kwargs):
+        body = data.encode(variables, codec=self.codec)
+        if not coalesce:
+            return await self._requests(body, **kwargs)
+
+        # 같은 GraphQL 문서와 변수를 가진 요청이 동시에 들어오면 하나의 요청으로 처리합니다.
+        key = "POST {} {}".format(self.BASE, body.decode("utf-8"))
+        if self.cache is not None and endpoint is not None:
+            return await self.cache.fetch(
+                key, lambda: self.flight.do(key, lambda: self._requests(body, **kwargs)), endpoint=endpoint
+            )
+        return await self.flight.do(key, lambda: self._requests(body, **kwargs))
+
+    async def _requests(self, body: bytes, **kwargs):
         headers = {
             'Content-Type': 'application/json'
         }
@@ -99,15 +135,56 @@ class Api:
         else:
             kwargs['headers'] = headers
 
-        session = await self.get_session()
-        async with session.request("POST", self.BASE, data=data.get(), **kwargs) as response:
-            if response.content_type == "application/json":
-                data = await response.json()
-            else:
-                fp_data = await response.text()
-                data = json.loads(fp_data)
+        route = self.ratelimit.route("POST", "/graphql")
+        for tries in range(5):
+            await self.ratelimit.acquire(route)
+            session = await self.get_session()
+            async with session.request("POST", self.BASE, data=body, **kwargs) as response:
+                data = await self.codec.read(response)
+
+                log.debug(f'POST {self.BASE} returned {response.status}')
+                bucket = await self.ratelimit.update(route, response.headers, response.status)
+                if response.status == 429:
+                    log.warning(f"Rate limited. Retry in {bucket.delay():.2f} seconds | Tries: {tries}")
+                    continue
+
+                if response.status == 200:
+                    return data
+                raise HTTPException(response, data)
+        raise HTTPException(response, data)
+
+    async def stream(self, data: Query, variables: dict = None, key: str = None,
+                     **kwargs) -> AsyncIterator[Any]:
+        """ 응답에 포함된 JSON 배열(`key`)을 스트림으로 읽으며, 항목을 하나씩 반환합니다.
+        같은 요청을 하나로 묶거나 캐시에 저장하지 않습니다."""
+        body = data.encode(variables, codec=self.codec)
 
-            log.debug(f'POST {self.BASE} returned {response.status}')
-
-            if response.status == 200:
-                return data
+        headers = {
+            'Content-Type': 'application/json'
+        }
+        if self.token is not None:
+            headers['Authorization'] = 'Bot ' + self.token
+        kwargs.setdefault('headers', dict()).update(headers)
+
+        route = self.ratelimit.route("POST", "/graphql")
+        for tries in range(5):
+            await self.ratelimit.acquire(route)
+            session = await self.get_session()
+            async with session.request("POST", self.BASE, data=body, **kwargs) as response:
+                log.debug(f'POST {self.BASE} returned {response.status}')
+                bucket = await self.ratelimit.update(route, response.headers, response.status)
+                if response.status == 429:
+                    log.warning(f"Rate limited. Retry in {bucket.delay():.2f} seconds | Tries: {tries}")
+                    continue
+
+                if response.status != 200:
+                    try:
+                        result = await self.codec.read(response)
+                    except ValueError:
+                        result = None
+                    raise HTTPException(response, result)
+
+                async for item in iter_json_array(response.content.iter_any(), key=key):
+                    yield item
+                return
+        raise HTTPException(response, None)
@@ -25,7 +25,20 @@ from typing import Union
 from enum import Enum
 
 from ..enums import get_value
-from .models import Category
+
+
+class Category:
+    __slots__ = ("id", "name")
+
+    def __init__(self, category_id: str, name: str):
+        self.id = category_id
+        self.name = name
+
+    def __eq__(self, other):
+        return self.id == other.id
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
 
 
 class Status(Enum):
@@ -60,3 +73,10 @@ class Categories(Enum):
 
     def __ne__(self, other):
         return not self.__eq__(other)
+
+
+class Projection(Enum):
+    """ UniqueBots에서 불러올 정보의 범위"""
+    shallow = "shallow"
+    owners = "owners"
+    full = "full"
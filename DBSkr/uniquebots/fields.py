@@ -0,0 +1,130 @@
+"""MIT License
+
+Copyright (c) 2021 gunyu1019
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from typing import Dict, Sequence, Tuple, Union
+
+from .api import Query, compile_query
+from .enums import Projection
+
+# 봇과 사용자의 기본 정보 입니다. 다른 봇이나 사용자는 ID만 불러옵니다.
+# 모델에서 사용하지 않는 정보(categories)는 불러오지 않습니다.
+BOT_SHALLOW = (
+    "id, name, avatarURL, trusted, discordVerified, guilds, status, brief, description, invite, website, "
+    "support, prefix, library { name }, slug, premium"
+)
+USER_SHALLOW = "id, tag, avatarURL, admin, description"
+
+FIELDS = {
+    "bot": {
+        Projection.shallow: BOT_SHALLOW + ", owners { id }",
+        Projection.owners: BOT_SHALLOW + ", owners { " + USER_SHALLOW + ", bots { id } }",
+        Projection.full: BOT_SHALLOW + ", hearts { from { id } }, owners { " + USER_SHALLOW + ", bots { "
+                         + BOT_SHALLOW + ", owners { id } } }"
+    },
+    "profile": {
+        Projection.shallow: USER_SHALLOW + ", bots { id }",
+        Projection.owners: USER_SHALLOW + ", bots { " + BOT_SHALLOW + ", owners { id } }",
+        Projection.full: USER_SHALLOW + ", bots { " + BOT_SHALLOW + ", owners { " + USER_SHALLOW + ", bots { id } } }"
+    },
+    "hearts": {
+        Projection.shallow: "from { " + USER_SHALLOW + " }",
+        Projection.owners: "from { " + USER_SHALLOW + ", bots { id } }",
+        Projection.full: "from { " + USER_SHALLOW + ", bots { " + BOT_SHALLOW + ", owners { "
+                         + USER_SHALLOW + ", bots { " + BOT_SHALLOW + ", owners { id } } } } }"
+    }
+}
+
+
+def get_fields(kind: str, projection: Union[Projection, str, Sequence[str]] = Projection.shallow) -> str:
+    """ 불러올 정보의 범위에 해당하는 GraphQL 필드를 반환합니다.
+
+    Parameters
+    ----------
+    kind: str
+        정보의 종류(`bot`, `profile`, `hearts`) 입니다.
+    projection: Union[Projection, str, Sequence[str]]
+        불러올 정보의 범위 입니다. :class:`Projection` 혹은 그 값(`shallow`, `owners`, `full`)을 사용하거나,
+        GraphQL 필드(예: `"id, name, owners { id }"`)나 필드 목록(예: `["id", "name"]`)을 직접 입력할 수 있습니다.
+    """
+    if isinstance(projection, Projection):
+        return FIELDS[kind][projection]
+    if isinstance(projection, str):
+        if projection in Projection.__members__:
+            return FIELDS[kind][Projection[projection]]
+        return projection
+    return ", ".join(projection)
+
+
+# 정보의 종류별 GraphQL 문서와 변수 입니다. `%s` 에는 불러올 필드가 들어갑니다.
+DOCUMENTS = {
+    "bot": ("{ bot (id: $bot_id) { %s } }", {"bot_id": "String"}),
+    "profile": ("{ profile (id: $user_id) { %s } }", {"user_id": "String"}),
+    "hearts": ("{ bot (id: $bot_id) { hearts { %s } } }", {"bot_id": "String"})
+}
+
+VOTE = compile_query("{ bot (id: $bot_id) { heartClicked(user: $user_id) } }",
+                     {"bot_id": "String", "user_id": "String"})
+STATS = compile_query("{ bot (id: $bot_id) { guilds(patch: $guild_count) } }",
+                      {"bot_id": "String", "guild_count": "Int"})
+
+# 미리 정의된 범위(Projection)의 문서는 불러올 때 한 번만 컴파일합니다.
+_queries: Dict[Tuple[str, Projection], Query] = {
+    (kind, projection): compile_query(document % FIELDS[kind][projection], variables)
+    for kind, (document, variables) in DOCUMENTS.items()
+    for projection in Projection
+}
+
+
+def get_query(kind: str, projection: Union[Projection, str, Sequence[str]] = Projection.shallow) -> Query:
+    """ 불러올 정보의 범위에 해당하는 컴파일된 GraphQL 문서를 반환합니다.
+
+    Parameters
+    ----------
+    kind: str
+        정보의 종류(`bot`, `profile`, `hearts`) 입니다.
+    projection: Union[Projection, str, Sequence[str]]
+        불러올 정보의 범위 입니다. :func:`get_fields` 와 같은 값을 사용합니다.
+    """
+    if isinstance(projection, str) and projection in Projection.__members__:
+        projection = Projection[projection]
+    if isinstance(projection, Projection):
+        return _queries[(kind, projection)]
+
+    document, variables = DOCUMENTS[kind]
+    return compile_query(document % get_fields(kind, projection), variables)
+
+
+def get_batch_query(kind: str, size: int, projection: Union[Projection, str, Sequence[str]] = Projection.shallow
+                    ) -> Query:
+    """ `size` 개의 별칭(alias)을 사용하여 여러 정보를 한 번에 불러오는 컴파일된 GraphQL 문서를 반환합니다.
+    별칭과 변수의 이름은 `a0`, `a1`, ... 이며, `vote` 의 경우 `bot_id` 변수가 추가로 사용됩니다.
+    """
+    if kind == "vote":
+        selections = " ".join("a{0}: heartClicked(user: $a{0})".format(index) for index in range(size))
+        variables = {"bot_id": "String"}
+        variables.update({"a{}".format(index): "String" for index in range(size)})
+        return compile_query("{ bot (id: $bot_id) { %s } }" % selections, variables)
+
+    fields = get_fields(kind, projection)
+    selections = " ".join("a{0}: {1} (id: $a{0}) {{ {2} }}".format(index, kind, fields) for index in range(size))
+    return compile_query("{ %s }" % selections, {"a{}".format(index): "String" for index in range(size)})
@@ -24,10 +24,18 @@ SOFTWARE.
 import asyncio
 import aiohttp
 
-from .api import Api, GraphQL
+from .api import Api, Query
+from .enums import Projection
+from . import fields
 from .models import Bot, Stats, Vote, User
+from ..bulk import gather_map, unique
+from ..cache import Cache, VoteCache
+from ..codec import JSONCodec
+from ..ratelimit import RateLimiter, RateLimitStore
+from ..session import SessionManager
+from ..voters import VoterSet
 
-from typing import List
+from typing import AsyncIterator, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 
 class HttpClient:
@@ -45,16 +53,58 @@ class HttpClient:
         비동기를 사용하기 위한 asyncio.AbstractEventLoop 입니다.
         기본값은 None 입니다.
         기본 asyncio.AbstractEventLoop는 asyncio.get_event_loop()를 사용하여 얻습니다.
+    session_manager: Optional[SessionManager]
+        여러 Http 클라이언트가 커넥션 풀을 공유하기 위한 SessionManager 입니다.
+        기본값은 None이며, `session` 값을 사용하는 SessionManager를 생성하게 됩니다.
+    ratelimit_store: Optional[RateLimitStore]
+        사용량 제한 정보를 저장할 저장소 입니다. 기본값은 None이며, 프로세스 메모리에 저장합니다.
+        여러 프로세스가 사용량 제한 정보를 공유하려면 :class:`DBSkr.SQLiteRateLimitStore` 를 전달해주세요.
+    cache: Optional[Cache]
+        봇 정보(:meth:`bot`)와 사용자 정보(:meth:`users`)를 저장할 캐시 입니다. 기본값은 None이며, 캐시를 사용하지 않습니다.
+    vote_cache: Optional[VoteCache]
+        사용자의 투표 여부(:meth:`vote`)를 저장할 캐시 입니다. 기본값은 None이며, 캐시를 사용하지 않습니다.
+    keep_data: Optional[bool]
+        모델에 응답 값(`data`)을 보관할지 설정합니다. 기본값은 True 입니다.
+        False일 경우 모델을 만든 후 응답 값을 보관하지 않아 메모리를 적게 사용하며, 모델의 `data` 는 None 입니다.
+        아직 변환하지 않은 값(프로필 사진, 소유자 등)은 원본 중 필요한 값만 남겨두고 처음 접근할 때 변환합니다.
+    codec: Optional[JSONCodec]
+        응답 값과 요청 본문을 변환할 JSON 변환기 입니다. 기본값은 None이며, `orjson` 이 설치되어 있다면 `orjson` 을,
+        그렇지 않다면 파이썬 표준 라이브러리(`json`)를 사용합니다.
     """
     def __init__(self,
                  token: str = None,
                  session: aiohttp.ClientSession = None,
-                 loop: asyncio.AbstractEventLoop = None):
+                 loop: asyncio.AbstractEventLoop = None,
+                 session_manager: SessionManager = None,
+                 ratelimit_store: RateLimitStore = None,
+                 cache: Cache = None,
+                 vote_cache: VoteCache = None,
+                 keep_data: bool = True,
+                 codec: JSONCodec = None):
         self.token = token
-        self.requests = Api(token=token, session=session, loop=loop)
+        self.requests = Api(token=token, session=session, loop=loop,
+                            session_manager=session_manager, ratelimit_store=ratelimit_store,
+                            cache=cache,
+                            codec=codec)
         self.session = session
+        self.vote_cache = vote_cache
+        self.keep_data = keep_data
 
-    async def bot(self, bot_id: int) -> Bot:
+    @property
+    def ratelimit(self) -> RateLimiter:
+        """ UniqueBots API의 경로별 사용량 제한 정보를 불러옵니다."""
+        return self.requests.ratelimit
+
+    async def close(self):
+        """
+        본 함수는 코루틴(비동기)함수 입니다.
+
+        Http 클라이언트가 사용하는 세션을 종료합니다.
+        """
+        await self.requests.close()
+
+    async def bot(self, bot_id: int,
+                  projection: Union[Projection, str, Sequence[str]] = Projection.shallow) -> Bot:
         """
         본 함수는 코루틴(비동기)함수 입니다.
 
@@ -64,32 +114,25 @@ class HttpClient:
         ----------
         bot_id: int
             봇 ID 값이 포함됩니다.
+        projection: Optional[Union[Projection, str, Sequence[str]]]
+            불러올 정보의 범위 입니다. 기본값은 `Projection.shallow` 이며, 소유자나 다른 봇은 ID만 불러옵니다.
+            `Projection.owners`, `Projection.full` 혹은 GraphQL 필드를 직접 입력하여 더 많은 정보를 불러올 수 있습니다.
+            하트 목록(`Bot.votes`)은 `Projection.full` 에서만 불러오며, 그 외에는 빈 목록입니다.
+            하트를 누른 사용자 정보는 :meth:`votes` 를 사용해주세요.
 
         Returns
         -------
         Bot:
             UniqueBots로 부터 들어온 봇 정보가 포함되어 있습니다.
         """
-        data = GraphQL(query="""{
-            bot (id: $bot_id) {
-                id, name, avatarURL, trusted, discordVerified, guilds, status, brief, description, invite, website,
-                support, prefix, library { name }, categories { name, id }, owners { 
-                    id, tag, avatarURL, admin, description, bots {
-                        id, name, avatarURL, trusted, discordVerified, guilds, status, brief, description, invite,
-                        website, support, prefix, library { name }, categories { name, id }, slug, premium, 
-                        owners { id }
-                    }
-                }
-            }
-        }""")
-
-        data.set_variables({
+        data = fields.get_query("bot", projection)
+        variables = {
             'bot_id': str(bot_id)
-        })
+        }
 
-        result = await self.requests.requests(data)
+        result = await self.requests.requests(data, variables, endpoint="bot")
         result = result.get("data", {}).get("bot")
-        return Bot(result)
+        return Bot(result, session=self.requests.session_manager, keep_data=self.keep_data)
 
     async def stats(self, bot_id: int, guild_count: int) -> Stats:
         """
@@ -108,20 +151,14 @@ class HttpClient:
         Stats:
             UniqueBots로 부터 들어온 봇 상태 정보가 포함되어 있습니다.
         """
-        data = GraphQL(query="""{
-            bot (id: $bot_id) {
-                guilds(patch: $guild_count)
-            }
-        }""")
-
-        data.set_variables({
+        variables = {
             'bot_id': str(bot_id),
             'guild_count': guild_count
-        })
+        }
 
-        result = await self.requests.requests(data)
+        result = await self.requests.requests(fields.STATS, variables, coalesce=False)
         result = result.get("data", {}).get("bot")
-        return Stats(result)
+        return Stats(result, keep_data=self.keep_data)
 
     async def vote(self, bot_id: int, user_id: int) -> Vote:
         """
@@ -141,61 +178,173 @@ class HttpClient:
         Vote:
             UniqueBots로 부터 들어온 사용자 투표 정보에 대한 정보가 포함되어 있습니다.
         """
-        data = GraphQL(query="""{
-                    bot (id: $bot_id) {
-                        heartClicked(user: $user_id)
-                    }
-                }""")
+        if self.vote_cache is not None:
+            result = await self.vote_cache.load("uniquebots", bot_id, user_id)
+            if result is not None:
+                return Vote(result, keep_data=self.keep_data)
 
-        data.set_variables({
+        variables = {
             'bot_id': str(bot_id),
             'user_id': str(user_id)
-        })
+        }
 
-        result = await self.requests.requests(data)
+        result = await self.requests.requests(fields.VOTE, variables)
         result = result.get("data", {}).get("bot")
-        return Vote(result)
+        vote = Vote(result, keep_data=self.keep_data)
+        if self.vote_cache is not None:
+            self.vote_cache.set("uniquebots", bot_id, user_id, result, voted=bool(vote.voted))
+        return vote
+
+    async def vote_many(self, bot_id: int, user_ids: Iterable[int],
+                        concurrency: int = 4, return_exceptions: bool = False,
+                        chunk_size: int = 50) -> Dict[int, Vote]:
+        """
+        본 함수는 코루틴(비동기)함수 입니다.
 
-    async def votes(self, bot_id: int) -> List[User]:
+        `user_ids`에 들어있는 사용자들이 봇에 하트를 누른 여부에 대하여 한 번에 불러옵니다.
+        중복된 사용자는 한 번만 불러오며, 캐시에 저장된 사용자는 API를 호출하지 않습니다.
+        나머지 사용자는 `chunk_size` 명씩 별칭(alias)을 사용한 하나의 GraphQL 요청으로 묶어서 불러옵니다.
+
+        Parameters
+        ----------
+        bot_id: int
+            봇 ID 값이 포함됩니다.
+        user_ids: Iterable[int]
+            유저 ID 값 목록이 포함되어 있습니다.
+        concurrency: Optional[int]
+            동시에 보낼 최대 요청 갯수 입니다. 기본값은 4개 입니다.
+        return_exceptions: Optional[bool]
+            True일 경우 예외가 발생한 사용자는 결과 대신 예외가 포함됩니다.
+            False일 경우 처음 발생한 예외를 그대로 발생시킵니다. 기본값은 False 입니다.
+        chunk_size: Optional[int]
+            하나의 요청에 포함할 최대 사용자 수 입니다. 기본값은 50명 입니다.
+
+        Returns
+        -------
+        Dict[int, Vote]:
+            유저 ID 별로 UniqueBots로 부터 들어온 사용자 투표 정보가 포함되어 있습니다.
+        """
+        user_ids = unique(user_ids)
+        cached = dict()
+        if self.vote_cache is not None:
+            for user_id in user_ids:
+                result = await self.vote_cache.load("uniquebots", bot_id, user_id)
+                if result is not None:
+                    cached[user_id] = Vote(result, keep_data=self.keep_data)
+
+        def query(chunk: Sequence[int]) -> Tuple[Query, dict]:
+            variables = {"a{}".format(index): str(user_id) for index, user_id in enumerate(chunk)}
+            variables["bot_id"] = str(bot_id)
+            return fields.get_batch_query("vote", len(chunk)), variables
+
+        def parse(data: dict, chunk: Sequence[int]) -> List[Optional[dict]]:
+            bot = data.get("bot") or {}
+            return [{"heartClicked": bot.get("a{}".format(index))} for index in range(len(chunk))]
+
+        results = await self._batch([user_id for user_id in user_ids if user_id not in cached], query, parse,
+                                    chunk_size=chunk_size, concurrency=concurrency,
+                                    return_exceptions=return_exceptions)
+        for user_id, result in results.items():
+            if isinstance(result, Exception):
+                cached[user_id] = result
+                continue
+            vote = Vote(result, keep_data=self.keep_data)
+            if self.vote_cache is not None:
+                self.vote_cache.set("uniquebots", bot_id, user_id, result, voted=bool(vote.voted))
+            cached[user_id] = vote
+        return {user_id: cached[user_id] for user_id in user_ids if user_id in cached}
+
+    async def votes(self, bot_id: int,
+                    projection: Union[Projection, str, Sequence[str]] = Projection.shallow) -> List[User]:
         """
         본 함수는 코루틴(비동기)함수 입니다.
 
         투표를 누른 사용자 목록을 모두 불러옵니다.
 
+        Parameters
+        ----------
+        bot_id: int
+            봇 ID 값이 포함됩니다.
+        projection: Optional[Union[Projection, str, Sequence[str]]]
+            불러올 사용자 정보의 범위 입니다. 기본값은 `Projection.shallow` 이며, 사용자의 기본 정보만 불러옵니다.
+            `Projection.owners`, `Projection.full` 혹은 GraphQL 필드를 직접 입력하여 더 많은 정보를 불러올 수 있습니다.
+
         Returns
         -------
         List[User]:
             UniqueBots로 부터 투표 누른 사용자 목록에 대한 정보가 포함되어 있습니다.
         """
-        data = GraphQL(query="""{
-                    bot (id: $bot_id) {
-                        hearts {
-                            from {
-                                id, tag, avatarURL, admin, description, bots {
-                                    id, name, avatarURL, trusted, discordVerified, guilds, status, brief,
-                                    description, invite, website, support, prefix, library { name },
-                                    categories { name, id }, slug, premium, owners { 
-                                        id, tag, avatarURL, admin, description, bots {
-                                            id, name, avatarURL, trusted, discordVerified, guilds, status, brief,
-                                            description, invite, website, support, prefix, library { name }, categories
-                                            { name, id }, slug, premium, owners { id }
-                                        }
-                                    } 
-                                }
-                            }
-                        }
-                    }
-                }""")
-
-        data.set_variables({
+        data = fields.get_query("hearts", projection)
+        variables = {
             'bot_id': str(bot_id)
-        })
+        }
 
-        result = await self.requests.requests(data)
+        result = await self.requests.requests(data, variables)
         result = result.get("data", {}).get("bot", {}).get("hearts", [])
-        return [User(user.get("from", {})) for user in result]
+        return [
+            User(user.get("from", {}), session=self.requests.session_manager, keep_data=self.keep_data)
+            for user in result
+        ]
+
+    async def iter_votes(self, bot_id: int,
+                         projection: Union[Projection, str, Sequence[str]] = Projection.shallow
+                         ) -> AsyncIterator[User]:
+        """
+        하트를 누른 사용자 목록을 응답을 받는 대로 하나씩 불러옵니다.
+        응답 전체를 한 번에 불러오지 않으므로, 하트를 누른 사용자 수와 관계없이 일정한 메모리를 사용합니다.
+
+        Parameters
+        ----------
+        bot_id: int
+            봇 ID 값이 포함됩니다.
+        projection: Optional[Union[Projection, str, Sequence[str]]]
+            불러올 사용자 정보의 범위 입니다. 기본값은 `Projection.shallow` 이며, 사용자의 기본 정보만 불러옵니다.
+
+        Returns
+        -------
+        AsyncIterator[User]:
+            UniqueBots로 부터 하트 누른 사용자에 대한 정보가 포함되어 있습니다.
+        """
+        data = fields.get_query("hearts", projection)
+        variables = {
+            'bot_id': str(bot_id)
+        }
+
+        async for heart in self.requests.stream(data, variables, key="hearts"):
+            yield User(heart.get("from") or {}, session=self.requests.session_manager, keep_data=self.keep_data)
 
-    async def users(self, user_id: int) -> User:
+    async def voters(self, bot_id: int) -> VoterSet:
+        """
+        본 함수는 코루틴(비동기)함수 입니다.
+
+        하트를 누른 사용자의 ID 목록을 :class:`DBSkr.VoterSet` 으로 불러옵니다.
+        사용자의 ID만 요청하므로 :meth:`votes` 보다 응답이 작고 적은 메모리를 사용하며,
+        사용자 정보는 :meth:`DBSkr.VoterSet.get` 혹은 :meth:`DBSkr.VoterSet.materialize` 로 불러올 수 있습니다.
+
+        Parameters
+        ----------
+        bot_id: int
+            봇 ID 값이 포함됩니다.
+
+        Returns
+        -------
+        VoterSet:
+            UniqueBots로 부터 하트 누른 사용자의 ID 목록이 포함되어 있습니다.
+        """
+        data = fields.get_query("hearts", "from { id }")
+        variables = {
+            'bot_id': str(bot_id)
+        }
+
+        result = VoterSet(loader=self.users)
+        async for heart in self.requests.stream(data, variables, key="hearts"):
+            user = heart.get("from") or {}
+            if user.get("id") is not None:
+                result.add(user["id"])
+        return result
+
+    async def users(self, user_id: int,
+                    projection: Union[Projection, str, Sequence[str]] = Projection.shallow) -> User:
         """
         본 함수는 코루틴(비동기)함수 입니다.
 
@@ -205,28 +354,123 @@ class HttpClient:
         ----------
         user_id: int
             사용자 ID 값이 포함됩니다.
+        projection: Optional[Union[Projection, str, Sequence[str]]]
+            불러올 정보의 범위 입니다. 기본값은 `Projection.shallow` 이며, 소유자나 다른 봇은 ID만 불러옵니다.
+            `Projection.owners`, `Projection.full` 혹은 GraphQL 필드를 직접 입력하여 더 많은 정보를 불러올 수 있습니다.
 
         Returns
         -------
         User
             UniqueBots로 부터 들어온 사용자 정보가 포함되어 있습니다.
         """
-        data = GraphQL(query="""{
-                    profile (id: $user_id) {
-                        id, tag, avatarURL, admin, description, bots {
-                            id, name, avatarURL, trusted, discordVerified, guilds, status, brief, description, invite,
-                            website, support, prefix, library { name }, categories { name, id }, slug, premium, 
-                            owners { 
-                                id, tag, avatarURL, admin, description, bots { id }
-                            }
-                        }
-                    }
-                }""")
-
-        data.set_variables({
+        data = fields.get_query("profile", projection)
+        variables = {
             'user_id': str(user_id)
-        })
+        }
 
-        result = await self.requests.requests(data)
+        result = await self.requests.requests(data, variables, endpoint="users")
         result = result.get("data", {}).get("profile")
-        return User(result)
+        return User(result, session=self.requests.session_manager, keep_data=self.keep_data)
+
+    async def _batch(self,
+                     ids: Iterable[int],
+                     query: Callable[[Sequence[int]], Tuple[Query, dict]],
+                     parse: Callable[[dict, Sequence[int]], List[Optional[dict]]],
+                     chunk_size: int = 25,
+                     concurrency: int = 4,
+                     return_exceptions: bool = False) -> Dict[int, Optional[dict]]:
+        """ `ids` 를 `chunk_size` 개씩 나누어 별칭(alias)을 사용한 하나의 GraphQL 요청으로 보낸 후, ID별 결과를 반환합니다."""
+        ids = unique(ids)
+        chunks = [tuple(ids[index:index + chunk_size]) for index in range(0, len(ids), chunk_size)]
+
+        async def request(chunk: Sequence[int]) -> List[Optional[dict]]:
+            data, variables = query(chunk)
+            result = await self.requests.requests(data, variables)
+            return parse(result.get("data") or {}, chunk)
+
+        results = await gather_map(request, chunks, concurrency=concurrency, return_exceptions=return_exceptions)
+        output = dict()
+        for chunk, result in results.items():
+            for index, key in enumerate(chunk):
+                output[key] = result if isinstance(result, Exception) else result[index]
+        return output
+
+    async def bot_many(self, bot_ids: Iterable[int],
+                       chunk_size: int = 25, concurrency: int = 4,
+                       projection: Union[Projection, str, Sequence[str]] = Projection.shallow
+                       ) -> Dict[int, Optional[Bot]]:
+        """
+        본 함수는 코루틴(비동기)함수 입니다.
+
+        여러 봇 정보를 별칭(alias)을 사용한 GraphQL 요청으로 묶어서 한 번에 불러옵니다.
+
+        Parameters
+        ----------
+        bot_ids: Iterable[int]
+            봇 ID 값 목록이 포함됩니다.
+        chunk_size: Optional[int]
+            하나의 요청에 포함할 최대 봇 수 입니다. 기본값은 25개 입니다.
+        concurrency: Optional[int]
+            동시에 보낼 최대 요청 갯수 입니다. 기본값은 4개 입니다.
+        projection: Optional[Union[Projection, str, Sequence[str]]]
+            불러올 정보의 범위 입니다. 기본값은 `Projection.shallow` 이며, 소유자나 다른 봇은 ID만 불러옵니다.
+            `Projection.owners`, `Projection.full` 혹은 GraphQL 필드를 직접 입력하여 더 많은 정보를 불러올 수 있습니다.
+
+        Returns
+        -------
+        Dict[int, Optional[Bot]]:
+            봇 ID 별로 UniqueBots로 부터 들어온 봇 정보가 포함되어 있습니다. 찾을 수 없는 봇은 None 입니다.
+        """
+        def query(chunk: Sequence[int]) -> Tuple[Query, dict]:
+            variables = {"a{}".format(index): str(key) for index, key in enumerate(chunk)}
+            return fields.get_batch_query("bot", len(chunk), projection), variables
+
+        def parse(data: dict, chunk: Sequence[int]) -> List[Optional[dict]]:
+            return [data.get("a{}".format(index)) for index in range(len(chunk))]
+
+        results = await self._batch(bot_ids, query, parse, chunk_size=chunk_size, concurrency=concurrency)
+        return {
+            bot_id: Bot(result, session=self.requests.session_manager, keep_data=self.keep_data)
+            if result is not None else None
+            for bot_id, result in results.items()
+        }
+
+    async def users_many(self, user_ids: Iterable[int],
+                         chunk_size: int = 25, concurrency: int = 4,
+                         projection: Union[Projection, str, Sequence[str]] = Projection.shallow
+                         ) -> Dict[int, Optional[User]]:
+        """
+        본 함수는 코루틴(비동기)함수 입니다.
+
+        여러 사용자 정보를 별칭(alias)을 사용한 GraphQL 요청으로 묶어서 한 번에 불러옵니다.
+
+        Parameters
+        ----------
+        user_ids: Iterable[int]
+            사용자 ID 값 목록이 포함됩니다.
+        chunk_size: Optional[int]
+            하나의 요청에 포함할 최대 사용자 수 입니다. 기본값은 25명 입니다.
+        concurrency: Optional[int]
+            동시에 보낼 최대 요청 갯수 입니다. 기본값은 4개 입니다.
+        projection: Optional[Union[Projection, str, Sequence[str]]]
+            불러올 정보의 범위 입니다. 기본값은 `Projection.shallow` 이며, 소유자나 다른 봇은 ID만 불러옵니다.
+            `Projection.owners`, `Projection.full` 혹은 GraphQL 필드를 직접 입력하여 더 많은 정보를 불러올 수 있습니다.
+
+        Returns
+        -------
+        Dict[int, Optional[User]]:
+            사용자 ID 별로 UniqueBots로 부터 들어온 사용자 정보가 포함되어 있습니다. 찾을 수 없는 사용자는 None 입니다.
+        """
+        def query(chunk: Sequence[int]) -> Tuple[Query, dict]:
+            variables = {"a{}".format(index): str(key) for index, key in enumerate(chunk)}
+            return fields.get_batch_query("profile", len(chunk), projection), variables
+
+        def parse(data: dict, chunk: Sequence[int]) -> List[Optional[dict]]:
+            return [data.get("a{}".format(index)) for index in range(len(chunk))]
+
+        results = await self._batch(user_ids, query, parse, chunk_size=chunk_size, concurrency=concurrency)
+        return {
+            user_id: User(result, session=self.requests.session_manager, keep_data=self.keep_data)
+            if result is not None else None
+            for user_id, result in results.items()
+        }
@@ -21,14 +21,32 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-from typing import Optional
+from typing import Optional, Union
 
+from aiohttp import ClientSession
+
+from .enums import Category, Status, get_value
 from ..assets import DiscordAvatar
+from ..lazy import lazy_property, prune
+from ..session import SessionManager
+
+
+def avatar_url(user_id: str, url: Optional[str], session: Union[ClientSession, SessionManager] = None
+               ) -> Optional[DiscordAvatar]:
+    if url is None:
+        return
+    prefix = "https://cdn.discordapp.com/avatars/{}/".format(user_id)
+    if url.startswith(prefix):
+        url = url[len(prefix):]
+    return DiscordAvatar(user_id=user_id, avatar=url.split(".")[0], session=session)
 
 
 class BaseUniqueBots:
-    def __init__(self, data: dict):
-        self.data: dict = data
+    __slots__ = ("data", )
+
+    def __init__(self, data: dict, keep_data: bool = True):
+        # keep_data 가 False 일 경우, 응답 값은 모델을 만든 후 보관하지 않습니다.
+        self.data: Optional[dict] = data if keep_data else None
 
 
 class Bot(BaseUniqueBots):
@@ -38,7 +56,7 @@ class Bot(BaseUniqueBots):
     ------------
     id: str
         디스코드 봇의 ID 입니다.
-    avatar: DiscordAvatar
+    avatar: Optional[DiscordAvatar]
         디스코드 봇의 프로필 사진 입니다.
     name: str
         디스코드 봇의 이름 입니다.
@@ -61,9 +79,10 @@ class Bot(BaseUniqueBots):
     premium: bool
         UniqueBots에서 프리미엄 해텍을 받고 있는 유/무를 반환힙니다.
     owners: List[Union[User, str]]
-        디스코드 봇의 소유자입니다.
+        디스코드 봇의 소유자입니다. 소유자 정보를 불러오지 않은 경우(`Projection.shallow`) ID만 포함됩니다.
     votes: List[Union[User, str]]
-        UniqueBots에 등재된 봇에 대해 하트를 사용자 목록 입니다.
+        UniqueBots에 등재된 봇에 대해 하트를 사용자 목록 입니다. 하트 목록은 `Projection.full` 로 불러온 경우에만
+        포함되며(ID만 포함), 그 외에는 빈 목록입니다. 하트를 누른 사용자 정보는 :meth:`HttpClient.votes` 를 사용해주세요.
     website: Optional[str]
         디스코드 봇의 웹사이트입니다.
     github: Optional[str]
@@ -75,10 +94,17 @@ class Bot(BaseUniqueBots):
     slug: Optional[str]
         디스코드 봇의 slug 값 입니다.
     """
-    def __init__(self, data: dict):
-        super().__init__(data=data)
+    __slots__ = ("_source", "_session", "id", "name", "trusted", "verified", "servers", "status", "intro", "desc",
+                 "prefix", "library", "premium", "_owners", "_votes", "invite", "website", "support", "github",
+                 "slug", "_avatar")
+
+    def __init__(self, data: dict,
+                 session: Union[ClientSession, SessionManager] = None,
+                 keep_data: bool = True):
+        super().__init__(data=data, keep_data=keep_data)
 
-        from .enums import Status, get_value
+        self._source: Optional[dict] = data
+        self._session = session
         self.id: str = data.get("id")
         self.name: str = data.get("name")
         self.trusted: bool = data.get("trusted")
@@ -88,12 +114,9 @@ class Bot(BaseUniqueBots):
         self.intro: str = data.get("brief")
         self.desc: str = data.get("description")
         self.prefix: str = data.get("prefix")
-        self.library: str = data.get("library", {}).get("name")
+        self.library: Optional[str] = (data.get("library") or {}).get("name")
         self.premium: bool = data.get("premium")
 
-        self.owners = [User(i) if 'tag' in i else i.get("id") for i in data.get("owners")]
-        self.votes = [User(i.get("from")) if "tag" in i.get("from") else i.get("from") for i in data.get("hearts", [])]
-
         # Optional Data
         self.invite: Optional[str] = data.get("invite")
         self.website: Optional[str] = data.get("website")
@@ -101,10 +124,27 @@ class Bot(BaseUniqueBots):
         self.github: Optional[str] = data.get("git")
         self.slug: Optional[str] = data.get("slug")
 
-        avatar = data.get("avatarURL")
-        avatar = avatar.lstrip("https://cdn.discordapp.com/avatars/{}/".format(self.id))
-        avatar = avatar.split(".")[0]
-        self.avatar = DiscordAvatar(user_id=self.id, avatar=avatar)
+        if not keep_data:
+            prune(self)
+
+    @lazy_property
+    def owners(self) -> list:
+        return [
+            User(i, session=self._session, keep_data=self.data is not None) if 'tag' in i else i.get("id")
+            for i in self._source.get("owners") or []
+        ]
+
+    @lazy_property.using("hearts")
+    def votes(self) -> list:
+        return [
+            User(i.get("from"), session=self._session, keep_data=self.data is not None)
+            if "tag" in i.get("from") else i.get("from", {}).get("id")
+            for i in self._source.get("hearts") or [] if i.get("from") is not None
+        ]
+
+    @lazy_property.using("avatarURL")
+    def avatar(self) -> Optional[DiscordAvatar]:
+        return avatar_url(self.id, self._source.get("avatarURL"), session=self._session)
 
     def __eq__(self, other):
         return self.id == other.id
@@ -124,8 +164,10 @@ class Stats(BaseUniqueBots):
     guilds: int
         디스코드 봇의 서버 갯수 입니다.
     """
-    def __init__(self, data: dict):
-        super().__init__(data=data)
+    __slots__ = ("guilds", )
+
+    def __init__(self, data: dict, keep_data: bool = True):
+        super().__init__(data=data, keep_data=keep_data)
         self.guilds: int = data.get("guilds")
 
     def __eq__(self, other):
@@ -141,18 +183,6 @@ class Stats(BaseUniqueBots):
         return self.guilds
 
 
-class Category:
-    def __init__(self, category_id: str, name: str):
-        self.id = category_id
-        self.name = name
-
-    def __eq__(self, other):
-        return self.id == other.id
-
-    def __ne__(self, other):
-        return not self.__eq__(other)
-
-
 class Vote(BaseUniqueBots):
     """ UniqueBots에 하트 정보에 대한 값입니다.
 
@@ -161,8 +191,10 @@ class Vote(BaseUniqueBots):
     voted: bool
         하트 여부를 반환합니다.
     """
-    def __init__(self, data: dict):
-        super().__init__(data=data)
+    __slots__ = ("voted", )
+
+    def __init__(self, data: dict, keep_data: bool = True):
+        super().__init__(data=data, keep_data=keep_data)
 
         self.voted: bool = data.get("heartClicked")
 
@@ -186,25 +218,38 @@ class User(BaseUniqueBots):
         사용자의 이름 입니다. 태그와 함께 불러와 집니다.
     admin: bool
         사용자가 관리자가 인지 아닌지 확인합니다.
-    bots: List[Union[Bot, dict]]
-        사용자가 소유하고 있는 디스코드 봇입니다.
-    avatar: DiscordAvatar
+    bots: List[Union[Bot, str]]
+        사용자가 소유하고 있는 디스코드 봇입니다. 봇 정보를 불러오지 않은 경우(`Projection.shallow`) ID만 포함됩니다.
+    avatar: Optional[DiscordAvatar]
         사용자의 프로필 사진입니다.
     """
-    def __init__(self, data: dict):
-        super().__init__(data=data)
+    __slots__ = ("_source", "_session", "id", "name", "desc", "admin", "_bots", "_avatar")
 
+    def __init__(self, data: dict,
+                 session: Union[ClientSession, SessionManager] = None,
+                 keep_data: bool = True):
+        super().__init__(data=data, keep_data=keep_data)
+
+        self._source: Optional[dict] = data
+        self._session = session
         self.id: str = data.get("id")
         self.name: str = data.get("tag")
         self.desc: str = data.get("description")
         self.admin: bool = data.get("admin", False)
 
-        self.bots: list = [Bot(i) if 'name' in i else i.get('id') for i in data.get("bots", [])]
+        if not keep_data:
+            prune(self)
+
+    @lazy_property
+    def bots(self) -> list:
+        return [
+            Bot(i, session=self._session, keep_data=self.data is not None) if 'name' in i else i.get('id')
+            for i in self._source.get("bots") or []
+        ]
 
-        avatar = data.get("avatarURL")
-        avatar = avatar.lstrip("https://cdn.discordapp.com/avatars/{}/".format(self.id))
-        avatar = avatar.split(".")[0]
-        self.avatar = DiscordAvatar(user_id=self.id, avatar=avatar)
+    @lazy_property.using("avatarURL")
+    def avatar(self) -> Optional[DiscordAvatar]:
+        return avatar_url(self.id, self._source.get("avatarURL"), session=self._session)
 
     def __eq__(self, other):
         return self.id == other.id
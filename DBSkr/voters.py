@@ -0,0 +1,297 @@
+"""MIT License
+
+Copyright (c) 2021 gunyu1019
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from array import array
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+from .bulk import gather_map
+
+_EMPTY = -1
+_MULTIPLIER = 0x9E3779B97F4A7C15
+_MASK = (1 << 64) - 1
+
+
+class VoterSet:
+    """ 투표 혹은 하트를 누른 사용자의 ID 목록을 적은 메모리로 보관합니다.
+
+    사용자 ID는 `array('Q')` 에, 투표 시간은 `array('d')` 에 순서대로 저장되며,
+    소속 여부는 배열 위치를 저장하는 오픈 어드레싱(open addressing) 해시 테이블로 O(1)에 확인합니다.
+    사용자 한 명당 약 16~40 바이트만 사용하며, 사용자 정보 모델은 필요할 때 `loader` 로 불러옵니다.
+
+    .. code-block:: python3
+
+        voters = await client.voters()
+        if ctx.author.id in voters:
+            ...
+        anywhere = topgg_voters | uniquebots_voters
+
+    Parameters
+    ----------
+    ids: Optional[Iterable[Union[int, str]]]
+        사용자 ID 목록 입니다. 중복된 ID는 한 번만 저장됩니다.
+    timestamps: Optional[Iterable[Union[float, datetime]]]
+        `ids` 와 같은 순서의 투표 시간 목록 입니다. 기본값은 None 이며, 투표 시간을 저장하지 않습니다.
+    loader: Optional[Callable[[int], Awaitable[Any]]]
+        사용자 ID를 받아 사용자 정보를 불러오는 코루틴 함수 입니다. :meth:`get`, :meth:`materialize` 에서 사용됩니다.
+
+    Attributes
+    ------------
+    loader: Optional[Callable[[int], Awaitable[Any]]]
+        사용자 정보를 불러오는 코루틴 함수 입니다.
+    """
+    __slots__ = ("_ids", "_timestamps", "_table", "_bits", "loader")
+
+    def __init__(self,
+                 ids: Iterable[Union[int, str]] = (),
+                 timestamps: Iterable[Union[float, datetime]] = None,
+                 loader: Callable[[int], Awaitable[Any]] = None):
+        self._ids = array('Q')
+        self._timestamps: Optional[array] = None
+        self._bits = 3
+        self._table = array('q', [_EMPTY]) * (1 << self._bits)
+        self.loader = loader
+
+        if timestamps is None:
+            for user_id in ids:
+                self.add(user_id)
+        else:
+            for user_id, timestamp in zip(ids, timestamps):
+                self.add(user_id, timestamp)
+
+    def __repr__(self):
+        return "<VoterSet size={0} timestamps={1}>".format(len(self), self._timestamps is not None)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._ids)
+
+    def __contains__(self, user_id) -> bool:
+        try:
+            user_id = int(user_id)
+        except (TypeError, ValueError):
+            return False
+        if not 0 <= user_id <= _MASK:
+            return False
+        return self._find(user_id)[1] != _EMPTY
+
+    def __or__(self, other: "VoterSet") -> "VoterSet":
+        return self.union(other)
+
+    def __and__(self, other: "VoterSet") -> "VoterSet":
+        return self.intersection(other)
+
+    def __sub__(self, other: "VoterSet") -> "VoterSet":
+        return self.difference(other)
+
+    def _find(self, user_id: int) -> Tuple[int, int]:
+        # 해시 테이블의 위치와 배열 위치를 반환합니다. 찾지 못한 경우 배열 위치는 _EMPTY 입니다.
+        mask = (1 << self._bits) - 1
+        slot = ((user_id * _MULTIPLIER) & _MASK) >> (64 - self._bits)
+        while True:
+            position = self._table[slot]
+            if position == _EMPTY or self._ids[position] == user_id:
+                return slot, position
+            slot = (slot + 1) & mask
+
+    def _resize(self):
+        self._bits += 1
+        self._table = array('q', [_EMPTY]) * (1 << self._bits)
+        for position, user_id in enumerate(self._ids):
+            slot, _ = self._find(user_id)
+            self._table[slot] = position
+
+    @staticmethod
+    def _timestamp(value: Union[float, datetime, None]) -> float:
+        if value is None:
+            return 0.0
+        if isinstance(value, datetime):
+            return value.timestamp()
+        value = float(value)
+        if value > 1e12:
+            # 밀리초 단위로 들어온 시간입니다.
+            value /= 1000
+        return value
+
+    def add(self, user_id: Union[int, str], timestamp: Union[float, datetime] = None) -> bool:
+        """ 사용자 ID를 추가합니다.
+        이미 포함된 사용자는 추가되지 않으며, 투표 시간이 주어진 경우 더 최근의 시간으로 갱신됩니다.
+
+        Parameters
+        ----------
+        user_id: Union[int, str]
+            사용자 ID 입니다.
+        timestamp: Optional[Union[float, datetime]]
+            투표 시간 입니다. UNIX 시간(초 혹은 밀리초) 혹은 datetime 을 사용할 수 있습니다.
+
+        Returns
+        -------
+        bool:
+            사용자가 새로 추가된 경우 True 입니다.
+        """
+        user_id = int(user_id)
+        if not 0 <= user_id <= _MASK:
+            raise ValueError(f"user_id must be between 0 and {_MASK}: {user_id}")
+        if timestamp is not None and self._timestamps is None:
+            self._timestamps = array('d', [0.0]) * len(self._ids)
+
+        slot, position = self._find(user_id)
+        if position != _EMPTY:
+            if timestamp is not None:
+                self._timestamps[position] = max(self._timestamps[position], self._timestamp(timestamp))
+            return False
+
+        self._table[slot] = len(self._ids)
+        self._ids.append(user_id)
+        if self._timestamps is not None:
+            self._timestamps.append(self._timestamp(timestamp))
+
+        if len(self._ids) * 2 > len(self._table):
+            self._resize()
+        return True
+
+    def update(self, other: Union["VoterSet", Iterable[Union[int, str]]]):
+        """ 다른 :class:`VoterSet` 혹은 사용자 ID 목록의 사용자를 모두 추가합니다."""
+        if isinstance(other, VoterSet):
+            for user_id, timestamp in other.items():
+                self.add(user_id, timestamp)
+            return
+        for user_id in other:
+            self.add(user_id)
+
+    def copy(self) -> "VoterSet":
+        """ 같은 사용자를 가진 새로운 :class:`VoterSet` 을 반환합니다."""
+        result = VoterSet(loader=self.loader)
+        result._ids = array('Q', self._ids)
+        result._timestamps = None if self._timestamps is None else array('d', self._timestamps)
+        result._bits = self._bits
+        result._table = array('q', self._table)
+        return result
+
+    def union(self, other: "VoterSet") -> "VoterSet":
+        """ 두 목록 중 한 곳 이상에 포함된 사용자의 목록을 반환합니다.
+        두 목록에 모두 포함된 사용자의 투표 시간은 더 최근의 시간이 사용됩니다.
+        `loader` 는 이 목록의 값을 사용하며, 없는 경우 `other` 의 값을 사용합니다.
+        """
+        if len(other) > len(self):
+            result = other.copy()
+            result.update(self)
+            result.loader = self.loader or other.loader
+            return result
+        result = self.copy()
+        result.update(other)
+        result.loader = self.loader or other.loader
+        return result
+
+    def intersection(self, other: "VoterSet") -> "VoterSet":
+        """ 두 목록에 모두 포함된 사용자의 목록을 반환합니다."""
+        result = VoterSet(loader=self.loader or other.loader)
+        for user_id, timestamp in self.items():
+            if user_id in other:
+                other_timestamp = other.timestamp(user_id)
+                if timestamp is None or (other_timestamp is not None and other_timestamp > timestamp):
+                    timestamp = other_timestamp
+                result.add(user_id, timestamp)
+        return result
+
+    def difference(self, other: "VoterSet") -> "VoterSet":
+        """ 이 목록에는 포함되어 있지만, `other` 에는 포함되지 않은 사용자의 목록을 반환합니다."""
+        result = VoterSet(loader=self.loader)
+        for user_id, timestamp in self.items():
+            if user_id not in other:
+                result.add(user_id, timestamp)
+        return result
+
+    def items(self) -> Iterator[Tuple[int, Optional[datetime]]]:
+        """ 사용자 ID와 투표 시간을 순서대로 반환합니다. 투표 시간이 없는 경우 None 입니다."""
+        if self._timestamps is None:
+            for user_id in self._ids:
+                yield user_id, None
+            return
+        for user_id, timestamp in zip(self._ids, self._timestamps):
+            yield user_id, (datetime.fromtimestamp(timestamp) if timestamp else None)
+
+    def timestamp(self, user_id: Union[int, str]) -> Optional[datetime]:
+        """ 사용자의 투표 시간을 반환합니다. 포함되지 않은 사용자이거나, 투표 시간이 없는 경우 None 입니다."""
+        if self._timestamps is None or user_id not in self:
+            return None
+        value = self._timestamps[self._find(int(user_id))[1]]
+        if not value:
+            return None
+        return datetime.fromtimestamp(value)
+
+    @property
+    def ids(self) -> array:
+        """ 사용자 ID가 저장된 배열(`array('Q')`)의 사본 입니다."""
+        return array('Q', self._ids)
+
+    @property
+    def nbytes(self) -> int:
+        """ 사용자 ID, 투표 시간과 해시 테이블이 사용하는 메모리 크기(바이트) 입니다."""
+        size = self._ids.itemsize * len(self._ids) + self._table.itemsize * len(self._table)
+        if self._timestamps is not None:
+            size += self._timestamps.itemsize * len(self._timestamps)
+        return size
+
+    async def get(self, user_id: Union[int, str]) -> Any:
+        """
+        본 함수는 코루틴(비동기)함수 입니다.
+
+        `loader` 를 이용하여 사용자 정보를 불러옵니다. 포함되지 않은 사용자인 경우 None 을 반환합니다.
+        """
+        if self.loader is None:
+            raise TypeError("VoterSet has no loader")
+        if user_id not in self:
+            return None
+        return await self.loader(int(user_id))
+
+    async def materialize(self,
+                          limit: int = None,
+                          concurrency: int = 8,
+                          return_exceptions: bool = False) -> Dict[int, Any]:
+        """
+        본 함수는 코루틴(비동기)함수 입니다.
+
+        `loader` 를 이용하여 포함된 사용자의 정보를 순서대로 불러옵니다.
+
+        Parameters
+        ----------
+        limit: Optional[int]
+            불러올 최대 사용자 수 입니다. 기본값은 None 이며, 모든 사용자의 정보를 불러옵니다.
+        concurrency: Optional[int]
+            동시에 보낼 최대 요청 갯수 입니다. 기본값은 8개 입니다.
+        return_exceptions: Optional[bool]
+            True일 경우 예외가 발생한 사용자는 결과 대신 예외가 포함됩니다.
+            False일 경우 처음 발생한 예외를 그대로 발생시킵니다. 기본값은 False 입니다.
+
+        Returns
+        -------
+        Dict[int, Any]:
+            사용자 ID 별로 불러온 사용자 정보가 포함되어 있습니다.
+        """
+        if self.loader is None:
+            raise TypeError("VoterSet has no loader")
+        ids = self._ids if limit is None else self._ids[:limit]
+        return await gather_map(self.loader, ids, concurrency=concurrency, return_exceptions=return_exceptions)
@@ -0,0 +1,237 @@
+"""MIT License
+
+Copyright (c) 2021 gunyu1019
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import hmac
+import json
+import logging
+import time
+from typing import Optional
+
+import discord
+from aiohttp import web
+
+from . import koreanbots
+from . import topgg
+from .cache import VoteCache
+from .enums import WebsiteType
+from .events import VoteEvent
+
+log = logging.getLogger(__name__)
+
+
+class WebhookServer:
+    """ top.gg와 KoreanBots의 투표 웹훅을 받는 웹서버 입니다.
+    투표가 들어오면 `discord.Client` 에 `on_dbskr_vote` 이벤트를 발생시킵니다.
+
+    .. code-block:: python3
+
+        @bot.event
+        async def on_dbskr_vote(event: DBSkr.VoteEvent):
+            ...
+
+    Parameters
+    ----------
+    bot: Optional[discord.Client]
+        이벤트를 전달받을 discord.py의 클라이언트입니다.
+    topgg_auth: Optional[str]
+        top.gg 웹훅 설정에 입력한 Authorization 값 입니다. 값이 None일 경우 top.gg 웹훅을 받지 않습니다.
+        빈 문자열은 누구나 투표를 보낼 수 있게 되므로 사용할 수 없습니다.
+    koreanbots_auth: Optional[str]
+        KoreanBots 웹훅 설정에 입력한 Authorization(시크릿) 값 입니다. 값이 None일 경우 KoreanBots 웹훅을 받지 않습니다.
+        빈 문자열은 누구나 투표를 보낼 수 있게 되므로 사용할 수 없습니다.
+    host: Optional[str]
+        웹서버의 호스트 입니다. 기본값은 `0.0.0.0` 입니다.
+    port: Optional[int]
+        웹서버의 포트 입니다. 기본값은 8080 입니다.
+    topgg_path: Optional[str]
+        top.gg 웹훅을 받을 경로 입니다. 기본값은 `/topgg` 입니다.
+    koreanbots_path: Optional[str]
+        KoreanBots 웹훅을 받을 경로 입니다. 기본값은 `/koreanbots` 입니다.
+    vote_cache: Optional[VoteCache]
+        웹훅으로 들어온 투표 정보를 저장할 캐시 입니다. :class:`Client` 에 전달한 캐시와 같은 캐시를 사용하면,
+        투표한 사용자에 대하여 `vote()` 가 API를 호출하지 않습니다.
+    """
+    def __init__(self,
+                 bot: discord.Client = None,
+                 topgg_auth: str = None,
+                 koreanbots_auth: str = None,
+                 host: str = "0.0.0.0",
+                 port: int = 8080,
+                 topgg_path: str = "/topgg",
+                 koreanbots_path: str = "/koreanbots",
+                 vote_cache: VoteCache = None):
+        for name, auth in (("topgg_auth", topgg_auth), ("koreanbots_auth", koreanbots_auth)):
+            if auth is not None and auth.strip() == "":
+                raise ValueError(f"{name} must not be empty")
+
+        self.bot = bot
+        self.topgg_auth = topgg_auth
+        self.koreanbots_auth = koreanbots_auth
+        self.host = host
+        self.port = port
+        self.topgg_path = topgg_path
+        self.koreanbots_path = koreanbots_path
+        self.vote_cache = vote_cache
+
+        self._app: Optional[web.Application] = None
+        self._runner: Optional[web.AppRunner] = None
+
+    @property
+    def app(self) -> web.Application:
+        """ 웹훅 경로가 등록된 aiohttp의 Application 입니다. 다른 웹서버에 하위 앱으로 추가할 수 있습니다."""
+        if self._app is None:
+            self._app = web.Application()
+            if self.topgg_auth is not None:
+                self._app.router.add_post(self.topgg_path, self._topgg)
+            if self.koreanbots_auth is not None:
+                self._app.router.add_post(self.koreanbots_path, self._koreanbots)
+        return self._app
+
+    async def start(self):
+        """
+        본 함수는 코루틴(비동기)함수 입니다.
+
+        웹훅 서버를 실행합니다.
+        """
+        if self._runner is not None:
+            return
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host=self.host, port=self.port)
+        await site.start()
+        log.info(f"Webhook server is listening on {self.host}:{self.port}")
+
+    async def close(self):
+        """
+        본 함수는 코루틴(비동기)함수 입니다.
+
+        웹훅 서버를 종료합니다.
+        """
+        if self._runner is None:
+            return
+        await self._runner.cleanup()
+        self._runner = None
+
+    @staticmethod
+    def _authorized(request: web.Request, auth: str) -> bool:
+        header = request.headers.get("Authorization")
+        if not header or not auth:
+            return False
+        return hmac.compare_digest(header, auth)
+
+    @staticmethod
+    async def _json(request: web.Request) -> Optional[dict]:
+        try:
+            data = await request.json()
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return
+        if not isinstance(data, dict):
+            return
+        return data
+
+    def dispatch(self, event: VoteEvent):
+        """ `on_dbskr_vote` 이벤트를 발생시킵니다."""
+        log.debug(f"Received vote from {event.web_type.value}: {event.user_id}")
+        if self.bot is not None:
+            self.bot.dispatch("dbskr_vote", event)
+
+    async def _topgg(self, request: web.Request) -> web.Response:
+        if not self._authorized(request, self.topgg_auth):
+            return web.Response(status=401)
+
+        data = await self._json(request)
+        if data is None or data.get("user") is None or data.get("bot") is None:
+            return web.Response(status=400)
+
+        bot_id = str(data.get("bot"))
+        user_id = str(data.get("user"))
+        vote = topgg.VotedUser({"id": user_id})
+        is_test = data.get("type") == "test"
+
+        if self.vote_cache is not None and not is_test:
+            self.vote_cache.set(WebsiteType.topgg.value, bot_id, user_id, {"voted": 1},
+                                voted=True, last_vote=time.time())
+
+        self.dispatch(VoteEvent(
+            web_type=WebsiteType.topgg,
+            bot_id=bot_id,
+            user_id=user_id,
+            vote=vote,
+            data=data,
+            is_test=is_test,
+            is_weekend=data.get("isWeekend", False),
+            query=data.get("query") or None
+        ))
+        return web.Response(status=200)
+
+    async def _koreanbots(self, request: web.Request) -> web.Response:
+        if not self._authorized(request, self.koreanbots_auth):
+            return web.Response(status=401)
+
+        data = await self._json(request)
+        if data is None:
+            return web.Response(status=400)
+
+        _data = data.get("data", data)
+        if isinstance(_data, str):
+            try:
+                _data = json.loads(_data)
+            except json.JSONDecodeError:
+                return web.Response(status=400)
+        if not isinstance(_data, dict):
+            return web.Response(status=400)
+
+        user_id = _data.get("userID", _data.get("userId"))
+        bot_id = _data.get("botID", _data.get("botId"))
+        if user_id is None or bot_id is None:
+            return web.Response(status=400)
+        user_id = str(user_id)
+        bot_id = str(bot_id)
+
+        last_vote = _data.get("timestamp")
+        if last_vote is None:
+            last_vote = time.time() * 1000
+        result = {
+            "code": 200,
+            "version": 2,
+            "data": {
+                "voted": True,
+                "lastVote": last_vote
+            }
+        }
+        vote = koreanbots.Vote(result)
+        is_test = data.get("type") == "test" or _data.get("type") == "test"
+
+        if self.vote_cache is not None and not is_test:
+            self.vote_cache.set(WebsiteType.koreanbots.value, bot_id, user_id, result,
+                                voted=True, last_vote=last_vote)
+
+        self.dispatch(VoteEvent(
+            web_type=WebsiteType.koreanbots,
+            bot_id=bot_id,
+            user_id=user_id,
+            vote=vote,
+            data=data,
+            is_test=is_test
+        ))
+        return web.Response(status=200)
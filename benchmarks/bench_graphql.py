@@ -0,0 +1,61 @@
+""" UniqueBots GraphQL 요청 본문을 만드는 데 걸리는 시간을 비교합니다.
+
+    PYTHONPATH=. python benchmarks/bench_graphql.py
+"""
+import json
+import timeit
+
+from DBSkr.uniquebots import fields
+
+
+def legacy_encode(query: str, variables: dict) -> bytes:
+    # 요청마다 변수의 자료형을 추론하여 변수 선언을 만들고, 문서 전체를 변환하던 이전 방식입니다.
+    _key_type = {int: "Int", str: "String", bool: "Boolean"}
+    key = ", ".join("${}: {}!".format(i, _key_type.get(type(variables.get(i)))) for i in variables.keys())
+    return json.dumps({
+        "query": "query(%s)" % key + query,
+        "variables": variables
+    }).encode("utf-8")
+
+
+def legacy_vote():
+    return legacy_encode("""{
+                bot (id: $bot_id) {
+                    heartClicked(user: $user_id)
+                }
+            }""", {
+        'bot_id': "680694763036737536",
+        'user_id': "340373909339635725"
+    })
+
+
+def compiled_vote():
+    return fields.VOTE.encode({
+        'bot_id': "680694763036737536",
+        'user_id': "340373909339635725"
+    })
+
+
+def legacy_bot():
+    return legacy_encode("{ bot (id: $bot_id) { %s } }" % fields.get_fields("bot", "full"), {
+        'bot_id': "680694763036737536"
+    })
+
+
+def compiled_bot():
+    return fields.get_query("bot", "full").encode({
+        'bot_id': "680694763036737536"
+    })
+
+
+def main(number: int = 100000):
+    for name, legacy, compiled in [("vote", legacy_vote, compiled_vote), ("bot", legacy_bot, compiled_bot)]:
+        legacy_time = min(timeit.repeat(legacy, number=number, repeat=5)) / number * 1e6
+        compiled_time = min(timeit.repeat(compiled, number=number, repeat=5)) / number * 1e6
+        print("{:<5} legacy {:>7.2f}us  compiled {:>7.2f}us  ({:.1f}x)".format(
+            name, legacy_time, compiled_time, legacy_time / compiled_time
+        ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+""" 응답 모델이 사용하는 메모리를 응답 값(`data`) 보관 여부에 따라 비교하고, 모델을 만드는 데 걸리는 시간을 측정합니다.
+
+    PYTHONPATH=. python benchmarks/bench_models.py
+"""
+import gc
+import json
+import timeit
+import tracemalloc
+
+from DBSkr.koreanbots.models import Bots
+from DBSkr.lazy import materialize
+from DBSkr.topgg.models import Search, VotedUser
+from DBSkr.uniquebots.models import User
+
+
+def search_payload(size: int = 500) -> str:
+    return json.dumps({
+        "results": [{
+            "id": str(680694763036737536 + index),
+            "clientid": str(680694763036737536 + index),
+            "username": "bot{}".format(index),
+            "discriminator": "0001",
+            "avatar": "a" * 32,
+            "defAvatar": "0",
+            "lib": "discord.py",
+            "prefix": "!",
+            "shortdesc": "짧은 소개문 입니다. " * 4,
+            "longdesc": "긴 설명문 입니다. " * 80,
+            "tags": ["Moderation", "Music", "Utility"],
+            "website": "https://example.com",
+            "support": "abcdef",
+            "github": "https://github.com/example/bot",
+            "owners": ["340373909339635725"],
+            "guilds": [],
+            "invite": "https://discord.com/oauth2/authorize?client_id={}".format(index),
+            "date": "2021-01-01T00:00:00.000Z",
+            "certifiedBot": False,
+            "vanity": None,
+            "points": 1000 + index,
+            "monthlyPoints": index,
+            "donatebotguildid": "",
+            "server_count": 1000
+        } for index in range(size)],
+        "limit": size,
+        "offset": 0,
+        "count": size,
+        "total": size
+    })
+
+
+def koreanbots_payload(size: int = 500) -> str:
+    return json.dumps({
+        "code": 200,
+        "version": 2,
+        "data": {
+            "type": "SEARCH",
+            "currentPage": 1,
+            "totalPage": 1,
+            "data": [{
+                "id": str(680694763036737536 + index),
+                "name": "bot{}".format(index),
+                "tag": "0001",
+                "avatar": "a" * 32,
+                "flags": 3,
+                "lib": "discord.py",
+                "prefix": "!",
+                "votes": 1000 + index,
+                "servers": 1000,
+                "intro": "짧은 소개문 입니다. " * 4,
+                "desc": "긴 설명문 입니다. " * 80,
+                "category": ["관리", "뮤직", "유틸리티"],
+                "status": "online",
+                "state": "ok",
+                "owners": [{"id": "340373909339635725", "username": "user", "tag": "0001", "flags": 0, "bots": []}],
+                "discord": "abcdef",
+                "bg": "https://example.com/background.png",
+                "banner": "https://example.com/banner.png"
+            } for index in range(size)]
+        }
+    })
+
+
+def votes_payload(size: int = 10000) -> str:
+    return json.dumps([{
+        "id": str(340373909339635725 + index),
+        "username": "user{}".format(index),
+        "avatar": "https://cdn.discordapp.com/avatars/{}/{}.png".format(340373909339635725 + index, "a" * 32)
+    } for index in range(size)])
+
+
+def hearts_payload(size: int = 10000) -> str:
+    return json.dumps([{
+        "id": str(340373909339635725 + index),
+        "tag": "user{}#0001".format(index),
+        "description": None,
+        "admin": False,
+        "avatarURL": "https://cdn.discordapp.com/avatars/{}/{}.png".format(340373909339635725 + index, "a" * 32),
+        "bots": []
+    } for index in range(size)])
+
+
+def measure(build) -> int:
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main(number: int = 20):
+    search = search_payload()
+    votes = votes_payload()
+    hearts = hearts_payload()
+    cases = [
+        ("top.gg Search (500 bots)",
+         lambda keep_data: Search(json.loads(search), keep_data=keep_data)),
+        ("top.gg votes (10000 users)",
+         lambda keep_data: [VotedUser(x, keep_data=keep_data) for x in json.loads(votes)]),
+        ("UniqueBots hearts (10000 users)",
+         lambda keep_data: [User(x, keep_data=keep_data) for x in json.loads(hearts)]),
+    ]
+    for name, build in cases:
+        kept = measure(lambda: build(True))
+        dropped = measure(lambda: build(False))
+        print("{:<32} keep_data=True {:>8.1f}KiB  keep_data=False {:>8.1f}KiB  ({:.1f}x)".format(
+            name, kept / 1024, dropped / 1024, kept / dropped
+        ))
+
+    # 모델을 만드는 시간에는 JSON 변환 시간이 포함되지 않습니다.
+    parsed = [
+        ("top.gg Search (500 bots)", Search, json.loads(search)),
+        ("KoreanBots Bots (500 bots)", Bots, json.loads(koreanbots_payload())),
+    ]
+    for name, model, data in parsed:
+        kept = min(timeit.repeat(lambda: model(data), number=number, repeat=5)) / number * 1e3
+        dropped = min(timeit.repeat(lambda: model(data, keep_data=False), number=number, repeat=5)) / number * 1e3
+
+        # keep_data=False 에서 모든 값을 바로 변환하는 경우(materialize)와 비교합니다.
+        def eager():
+            for result in model(data, keep_data=False).results:
+                materialize(result)
+        materialized = min(timeit.repeat(eager, number=number, repeat=5)) / number * 1e3
+        print("{:<32} parse keep_data=True {:>7.2f}ms  keep_data=False {:>7.2f}ms  materialized {:>7.2f}ms".format(
+            name, kept, dropped, materialized
+        ))
+
+
+if __name__ == "__main__":
+    main()
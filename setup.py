@@ -31,6 +31,9 @@ setup(
     long_description_content_type='text/markdown',
     include_package_data=True,
     install_requires=open('requirements.txt', encoding='UTF-8').read(),
+    extras_require={
+        'speed': ['orjson']
+    },
     classifiers=[
         'Development Status :: 5 - Production/Stable',
         'License :: OSI Approved :: MIT License',
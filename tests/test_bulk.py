@@ -0,0 +1,64 @@
+import asyncio
+import pytest
+
+from DBSkr.bulk import gather_map, iter_pages
+
+
+@pytest.mark.asyncio
+async def test_gather_map():
+    running = []
+    peak = []
+
+    async def func(key):
+        running.append(key)
+        peak.append(len(running))
+        await asyncio.sleep(0.01)
+        running.remove(key)
+        return key * 2
+
+    result = await gather_map(func, [1, 2, 3, 2, 4, 5], concurrency=2)
+    assert result == {1: 2, 2: 4, 3: 6, 4: 8, 5: 10}
+    assert max(peak) == 2
+
+
+@pytest.mark.asyncio
+async def test_iter_pages():
+    requested = []
+
+    async def fetch(page):
+        requested.append(page)
+        await asyncio.sleep(0.01)
+        return [page * 10 + index for index in range(3)], 4
+
+    result = [item async for item in iter_pages(fetch, prefetch=2)]
+    assert result == [page * 10 + index for page in range(1, 5) for index in range(3)]
+    assert requested == [1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_iter_pages_limit():
+    requested = []
+
+    async def fetch(page):
+        requested.append(page)
+        return [page] * 10, None
+
+    result = [item async for item in iter_pages(fetch, limit=15, prefetch=3)]
+    assert len(result) == 15
+    assert requested == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_iter_pages_prefetch():
+    loop = asyncio.get_event_loop()
+
+    async def fetch(page):
+        await asyncio.sleep(0.1)
+        return [page], 3
+
+    start = loop.time()
+    async for _ in iter_pages(fetch, prefetch=1):
+        # 다음 페이지는 현재 페이지를 처리하는 동안 불러옵니다.
+        await asyncio.sleep(0.1)
+    assert loop.time() - start < 0.55
+
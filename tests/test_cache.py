@@ -0,0 +1,154 @@
+import asyncio
+import time
+import pytest
+
+import DBSkr
+from DBSkr.cache import Cache, SQLiteCacheStore, VoteCache
+
+
+def test_lru_eviction():
+    cache = Cache(max_size=2, jitter=0)
+    cache.set("a", 1, endpoint="bot")
+    cache.set("b", 2, endpoint="bot")
+    assert cache.get("a").value == 1
+
+    cache.set("c", 3, endpoint="bot")
+    assert cache.get("b") is None
+    assert cache.get("a").value == 1
+    assert cache.stats.evictions == 1
+
+
+def test_ttl_expiration():
+    cache = Cache(ttl={"bot": 0}, jitter=0)
+    cache.set("a", 1, endpoint="bot")
+    assert cache.get("a") is None
+    assert cache.stats.expirations == 1
+    assert cache.stats.misses == 1
+
+
+@pytest.mark.asyncio
+async def test_fetch():
+    cache = Cache()
+    calls = []
+
+    async def request():
+        calls.append(1)
+        return {"id": "1"}
+
+    assert await cache.fetch("a", request, endpoint="bot") == {"id": "1"}
+    assert await cache.fetch("a", request, endpoint="bot") == {"id": "1"}
+    assert len(calls) == 1
+    assert cache.stats.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_negative_cache():
+    cache = Cache()
+    calls = []
+
+    async def request():
+        calls.append(1)
+        raise DBSkr.NotFound()
+
+    for _ in range(2):
+        with pytest.raises(DBSkr.NotFound):
+            await cache.fetch("a", request, endpoint="bot")
+    assert len(calls) == 1
+
+
+def test_vote_cache_last_vote():
+    cache = VoteCache(window=60)
+    now = time.time()
+    cache.set("koreanbots", 1, 2, {"voted": True}, voted=True, last_vote=(now - 30) * 1000)
+    assert cache.get("koreanbots", 1, 2) == {"voted": True}
+
+    cache.set("koreanbots", 1, 3, {"voted": True}, voted=True, last_vote=now - 90)
+    assert cache.get("koreanbots", 1, 3) is None
+
+
+def test_vote_cache_negative():
+    cache = VoteCache(window=60, positive_ttl=10, negative_ttl=0)
+    cache.set("topgg", 1, 2, {"voted": 0}, voted=False)
+    assert cache.get("topgg", 1, 2) is None
+
+    # 투표하지 않은 것을 확인한 이후 투표하였으므로, 확인한 시간부터 window 동안 유효합니다.
+    cache.set("topgg", 1, 2, {"voted": 1}, voted=True)
+    entry = cache._entries[VoteCache.key("topgg", 1, 2)]
+    assert entry.expires - time.time() > 50
+
+
+@pytest.mark.asyncio
+async def test_stale_while_revalidate():
+    cache = Cache(ttl={"bot": 0}, jitter=0, max_stale=60)
+    cache.set("a", 1, endpoint="bot")
+
+    async def request():
+        return 2
+
+    assert await cache.fetch("a", request, endpoint="bot") == 1
+    await cache.revalidate("a", request, endpoint="bot")
+    assert cache.stats.stale == 1
+    assert "a" not in cache
+    assert cache.get_stale("a").value == 2
+
+    async def failed():
+        raise DBSkr.TooManyRequests()
+
+    assert await cache.fetch("a", failed, endpoint="bot") == 2
+    await asyncio.sleep(0)
+    assert await cache.fetch("a", failed, endpoint="bot") == 2
+
+
+@pytest.mark.asyncio
+async def test_sqlite_store(tmp_path):
+    store = SQLiteCacheStore(str(tmp_path / "cache.db"))
+    store.set("GET https://koreanbots.dev/api/v2/bots/1", {"id": "1"}, time.time() + 60)
+    store.set("GET https://koreanbots.dev/api/v2/bots/2", {"id": "2"}, time.time() - 1)
+
+    # 재시작한 프로세스에서 2차 저장소의 값을 불러옵니다.
+    cache = Cache(store=store)
+
+    async def request():
+        raise AssertionError
+
+    assert await cache.fetch("GET https://koreanbots.dev/api/v2/bots/1", request, endpoint="bot") == {"id": "1"}
+    with pytest.raises(AssertionError):
+        await cache.fetch("GET https://koreanbots.dev/api/v2/bots/2", request, endpoint="bot")
+
+    vote_cache = VoteCache(store=store)
+    store.set(VoteCache.key("topgg", 1, 2), {"voted": 1}, time.time() + 60)
+    assert await vote_cache.load("topgg", 1, 2) == {"voted": 1}
+    store.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_store_clear(tmp_path):
+    store = SQLiteCacheStore(str(tmp_path / "cache.db"))
+    # 삭제가 끝난 후 다시 불러오도록 Executor 대신 바로 실행합니다.
+    store.submit = lambda func, *args: func(*args)
+    cache = Cache(store=store)
+    vote_cache = VoteCache(store=store)
+
+    store.set("GET https://koreanbots.dev/api/v2/bots/1", {"id": "1"}, time.time() + 60)
+    store.set(VoteCache.key("topgg", 1, 2), {"voted": 1}, time.time() + 60)
+    store.set("poller:topgg:1", {"head": []}, time.time() + 60)
+
+    cache.clear()
+    assert await store.fetch("GET https://koreanbots.dev/api/v2/bots/1") is None
+    assert await vote_cache.load("topgg", 1, 2) == {"voted": 1}
+
+    vote_cache.clear()
+    assert store.get(VoteCache.key("topgg", 1, 2)) is None
+    assert store.get("poller:topgg:1") is not None
+    store.close()
+
+
+def test_sqlite_store_evict(tmp_path):
+    store = SQLiteCacheStore(str(tmp_path / "cache.db"), max_bytes=64)
+    for index in range(10):
+        store.set(str(index), {"index": index}, time.time() + 60 + index)
+    store.evict()
+
+    assert store.get("0") is None
+    assert store.get("9") is not None
+    store.close()
@@ -0,0 +1,70 @@
+import json
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import DBSkr
+from DBSkr import JSONCodec, OrjsonCodec, default_codec
+from DBSkr.uniquebots import fields
+
+
+class CountingCodec(JSONCodec):
+    name = "counting"
+
+    def __init__(self):
+        self.loaded = 0
+        self.dumped = 0
+
+    def loads(self, data):
+        assert isinstance(data, bytes)
+        self.loaded += 1
+        return super().loads(data)
+
+    def dumps(self, value):
+        self.dumped += 1
+        return super().dumps(value)
+
+
+def test_codecs():
+    value = {"id": "1", "name": "봇", "tags": [1, 2.5, None, True]}
+    codecs = [JSONCodec()]
+    try:
+        codecs.append(OrjsonCodec())
+    except RuntimeError:
+        pass
+    for codec in codecs:
+        body = codec.dumps(value)
+        assert isinstance(body, bytes)
+        assert json.loads(body) == value
+        assert codec.loads(body) == value
+    assert isinstance(default_codec(), JSONCodec)
+
+    body = fields.VOTE.encode({"bot_id": "1", "user_id": "2"}, codec=JSONCodec())
+    assert json.loads(body)["variables"] == {"bot_id": "1", "user_id": "2"}
+
+
+@pytest.mark.asyncio
+async def test_codec_requests():
+    received = []
+
+    async def stats(request):
+        received.append(await request.read())
+        return web.json_response({"server_count": 10})
+
+    async def empty(request):
+        return web.Response(status=200)
+
+    app = web.Application()
+    app.router.add_post("/bots/1/stats", stats)
+    app.router.add_get("/empty", empty)
+    async with TestServer(app) as server:
+        codec = CountingCodec()
+        client = DBSkr.topgg.HttpClient(token="token", codec=codec)
+        client.requests.BASE = str(server.make_url("")).rstrip("/")
+        result = await client.stats(bot_id=1, guild_count=10)
+        assert await client.requests.get("/empty") is None
+        await client.close()
+
+    assert result.servers == 10
+    assert json.loads(received[0]) == {"server_count": 10, "shard_id": None, "shard_count": None}
+    assert codec.dumped == 1 and codec.loaded == 1
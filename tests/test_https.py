@@ -0,0 +1,114 @@
+import asyncio
+import pytest
+
+import DBSkr
+
+
+class FakeHttp:
+    def __init__(self, result=None, delay: float = 0.0, exception: Exception = None):
+        self.result = result
+        self.delay = delay
+        self.exception = exception
+
+    async def vote(self, bot_id: int, user_id: int):
+        await asyncio.sleep(self.delay)
+        if self.exception is not None:
+            raise self.exception
+        return self.result
+
+
+def make_client(koreanbots=None, topgg=None, uniquebots=None) -> DBSkr.HttpClient:
+    client = DBSkr.HttpClient()
+    client.koreanbots_http = koreanbots
+    client.topgg_http = topgg
+    client.uniquebots_http = uniquebots
+    return client
+
+
+@pytest.mark.asyncio
+async def test_gather_concurrent():
+    client = make_client(
+        koreanbots=FakeHttp(result=1, delay=0.2),
+        topgg=FakeHttp(result=2, delay=0.2),
+        uniquebots=FakeHttp(result=3, delay=0.2)
+    )
+    loop = asyncio.get_event_loop()
+    start = loop.time()
+    result = await client.vote(bot_id=0, user_id=0)
+    assert loop.time() - start < 0.4
+    assert (result.koreanbots, result.topgg, result.uniquebots) == (1, 2, 3)
+    assert not result.is_failed()
+
+
+@pytest.mark.asyncio
+async def test_gather_exception():
+    exception = DBSkr.HTTPException()
+    client = make_client(
+        koreanbots=FakeHttp(result=1),
+        topgg=FakeHttp(exception=exception)
+    )
+    result = await client.vote(bot_id=0, user_id=0)
+    assert result.koreanbots == 1
+    assert result.topgg is None
+    assert result.is_failed(DBSkr.WebsiteType.topgg)
+    assert result.exceptions[DBSkr.WebsiteType.topgg] is exception
+
+
+@pytest.mark.asyncio
+async def test_gather_timeout():
+    client = make_client(
+        koreanbots=FakeHttp(result=1),
+        topgg=FakeHttp(result=2, delay=5.0)
+    )
+    result = await client.vote(bot_id=0, user_id=0, timeout=0.1)
+    assert result.koreanbots == 1
+    assert result.topgg is None
+    assert result.is_timed_out(DBSkr.WebsiteType.topgg)
+    assert not result.is_timed_out(DBSkr.WebsiteType.koreanbots)
+
+
+@pytest.mark.asyncio
+async def test_gather_cancelled():
+    topgg = FakeHttp(result=2, delay=5.0)
+    client = make_client(topgg=topgg)
+    tasks = []
+
+    async def vote(bot_id: int, user_id: int):
+        tasks.append(asyncio.current_task())
+        return await FakeHttp.vote(topgg, bot_id, user_id)
+
+    topgg.vote = vote
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(client.vote(bot_id=0, user_id=0), timeout=0.1)
+    assert len(tasks) == 1 and tasks[0].cancelled()
+
+
+class FakeManyHttp:
+    def __init__(self, voted):
+        self.voted = voted
+        self.calls = []
+
+    async def vote(self, bot_id: int, user_id: int):
+        self.calls.append(user_id)
+        if user_id not in self.voted:
+            raise DBSkr.NotFound()
+        return self.voted[user_id]
+
+    async def vote_many(self, bot_id: int, user_ids, concurrency: int = 8, return_exceptions: bool = False):
+        return await DBSkr.koreanbots.HttpClient.vote_many(self, bot_id, user_ids, concurrency=concurrency,
+                                                           return_exceptions=return_exceptions)
+
+
+@pytest.mark.asyncio
+async def test_vote_many():
+    koreanbots = FakeManyHttp({1: True, 2: False})
+    client = make_client(koreanbots=koreanbots, topgg=FakeManyHttp({1: False, 2: True, 3: True}))
+    result = await client.vote_many(bot_id=0, user_ids=[1, 2, 2, 3, 1], concurrency=2)
+
+    assert list(result.keys()) == [1, 2, 3]
+    assert sorted(koreanbots.calls) == [1, 2, 3]
+    assert (result[1].koreanbots, result[1].topgg) == (True, False)
+    assert result[3].koreanbots is None
+    assert result[3].topgg is True
+    assert result[3].is_failed(DBSkr.WebsiteType.koreanbots)
+    assert not result[3].is_failed(DBSkr.WebsiteType.topgg)
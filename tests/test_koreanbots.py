@@ -0,0 +1,16 @@
+import DBSkr
+
+
+def test_bots_paging():
+    bots = DBSkr.koreanbots.Bots({
+        "code": 200,
+        "version": 2,
+        "data": {
+            "type": "VOTE",
+            "currentPage": 1,
+            "totalPage": 3,
+            "data": [{"id": "1", "name": "bot", "tag": "0000", "avatar": None, "category": [], "owners": []}]
+        }
+    })
+    assert (bots.current, bots.total, len(bots)) == (1, 3, 1)
+    assert bots.results[0].id == "1"
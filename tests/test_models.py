@@ -0,0 +1,114 @@
+import pytest
+
+import DBSkr
+from DBSkr.assets import Assets
+from DBSkr import koreanbots, topgg, uniquebots
+from DBSkr.topgg.models import Search
+
+
+def test_models_are_slotted():
+    models = [
+        koreanbots.Bot({"data": {"id": "1", "owners": [{"id": "2"}]}}),
+        koreanbots.User({"data": {"id": "2"}}),
+        Search({"results": [{"id": "1"}]}),
+        topgg.VotedUser({"id": "1", "avatar": "abc"}),
+        uniquebots.Bot({"id": "1", "owners": [{"id": "2", "tag": "user#0001"}]}),
+        DBSkr.WebsiteBot(),
+    ]
+    for model in models:
+        assert not hasattr(model, "__dict__"), type(model)
+
+
+def test_assets_are_slotted():
+    from DBSkr.assets import DiscordAvatar, ImageURL
+    from DBSkr.koreanbots.widget import Widget as KoreanBotsWidget
+    from DBSkr.topgg.widget import Widget as TopggWidget
+
+    assets = [
+        DiscordAvatar("1", "abc"),
+        ImageURL("https://example.com/image.png"),
+        KoreanBotsWidget("/widget/bots/servers/1", {"style": "flat"}, None),
+        TopggWidget("/widget/1", {}, None),
+    ]
+    for asset in assets:
+        assert not hasattr(asset, "__dict__"), type(asset)
+
+
+def test_keep_data():
+    search = Search({"results": [{"id": "1", "username": "bot"}]}, keep_data=False)
+    assert search.data is None
+    assert search.results[0].data is None
+    assert search.results[0].name == "bot"
+
+    bot = koreanbots.Bot({"code": 200, "data": {"id": "1", "owners": [{"id": "2"}]}}, keep_data=False)
+    assert bot.data is None and bot.owners[0].data is None
+    assert bot.code == 200
+
+    assert topgg.HttpClient(keep_data=False).keep_data is False
+    assert uniquebots.User({"id": "1"}).data == {"id": "1"}
+
+
+def test_lazy_fields():
+    data = {"data": {"id": "1", "avatar": "abc", "flags": 0, "owners": [{"id": "2", "username": "user"}]}}
+    bot = koreanbots.Bot(data)
+    assert not hasattr(bot, "_owners")
+
+    owners = bot.owners
+    assert owners[0].name == "user"
+    assert bot.owners is owners
+    assert bot.avatar.url() == "https://cdn.discordapp.com/avatars/1/abc.png"
+
+    bot.owners = []
+    assert bot.owners == []
+
+    # keep_data=False 인 경우에도 아직 변환하지 않은 값만 남겨두고, 처음 접근할 때 변환합니다.
+    bot = topgg.Bot({"id": "1", "username": "bot", "date": "2021-01-01T00:00:00.000Z"}, keep_data=False)
+    assert bot._source == {"date": "2021-01-01T00:00:00.000Z"}
+    assert not hasattr(bot, "_date")
+    assert bot.date.year == 2021
+
+    bot = koreanbots.Bot(data, keep_data=False)
+    assert set(bot._source) == {"avatar", "flags", "owners"}
+    assert bot.owners[0].name == "user" and bot.owners[0].data is None
+
+
+def test_enum_index():
+    from DBSkr.enums import get_index, get_value
+
+    index = get_index(koreanbots.Category)
+    assert index is get_index(koreanbots.Category)
+    assert get_value(koreanbots.Category, "NSFW") is koreanbots.Category.NSFW
+    assert get_value(koreanbots.Status, "unknown") == "unknown"
+    assert get_value(koreanbots.Status, ["unhashable"]) == ["unhashable"]
+
+    assert get_index(uniquebots.Categories) is None
+    category = get_value(uniquebots.Categories, uniquebots.Category("music", "음악"))
+    assert category is uniquebots.Categories.music
+
+
+@pytest.mark.asyncio
+async def test_assets_bind_session_lazily(monkeypatch):
+    client = topgg.HttpClient()
+    manager = client.requests.session_manager
+
+    async def get(path, **kwargs):
+        return [{"id": "1", "username": "user", "avatar": "abc"}]
+
+    sessions = []
+
+    async def read(self, session):
+        sessions.append(session)
+        return b"avatar"
+
+    monkeypatch.setattr(client.requests, "get", get)
+    monkeypatch.setattr(Assets, "_read", read)
+
+    users = await client.votes(bot_id=1)
+    avatar = users[0].avatar
+    assert avatar.session is manager
+    assert manager.session is None
+
+    assert await avatar.read() == b"avatar"
+    assert manager.session is not None
+    assert sessions == [manager.session]
+    await client.close()
@@ -0,0 +1,111 @@
+import pytest
+
+import DBSkr
+from DBSkr import SQLiteCacheStore, VotePoller
+
+
+class FakeUser:
+    def __init__(self, user_id):
+        self.id = str(user_id)
+        self.data = {"id": self.id}
+
+
+class FakeVotes:
+    def __init__(self, ids):
+        self.ids = ids
+        self.read = 0
+
+    async def __call__(self):
+        for user_id in self.ids:
+            self.read += 1
+            yield FakeUser(user_id)
+
+
+@pytest.mark.asyncio
+async def test_ordered_poller():
+    votes = FakeVotes(list(range(100, 0, -1)))
+    poller = VotePoller(key="topgg:1", fetch=votes)
+
+    assert await poller.poll() == []
+    assert poller.head == list(range(100, 92, -1))
+
+    votes.read = 0
+    assert await poller.poll() == []
+    assert votes.read == 8
+
+    # 이미 투표한 사용자(50)가 다시 투표한 경우에도 새로운 투표로 반환됩니다.
+    votes.ids = [102, 50, 101] + votes.ids
+    votes.read = 0
+    assert [user.id for user in await poller.poll()] == ["102", "50", "101"]
+    assert votes.read == 11
+    assert poller.head[:3] == [102, 50, 101]
+
+
+@pytest.mark.asyncio
+async def test_unordered_poller(tmp_path):
+    store = SQLiteCacheStore(str(tmp_path / "poller.db"))
+    # 저장이 끝난 후 다시 불러오도록 Executor 대신 바로 실행합니다.
+    store.submit = lambda func, *args: func(*args)
+    votes = FakeVotes([1, 2, 3])
+    poller = VotePoller(key="uniquebots:1", fetch=votes, ordered=False, store=store)
+
+    assert await poller.poll() == []
+    votes.ids = [1, 4, 2, 3, 5]
+    assert [user.id for user in await poller.poll()] == ["4", "5"]
+    assert await poller.poll() == []
+
+    restored = VotePoller(key="uniquebots:1", fetch=votes, ordered=False, store=store)
+    votes.ids = [1, 2, 3, 4, 5, 6]
+    assert [user.id for user in await restored.poll()] == ["6"]
+    store.close()
+
+
+@pytest.mark.asyncio
+async def test_unordered_poller_trim():
+    votes = FakeVotes(list(range(1, 11)))
+    poller = VotePoller(key="uniquebots:1", fetch=votes, ordered=False, max_seen=4)
+
+    assert await poller.poll() == []
+    # 목록에 남아있는 사용자는 확인한 사용자 목록을 줄일 때 지워지지 않습니다.
+    assert await poller.poll() == []
+    votes.ids = votes.ids + [11]
+    assert [user.id for user in await poller.poll()] == ["11"]
+
+
+class FakeBot:
+    def __init__(self, votes):
+        self.loop = None
+        self.user = FakeUser(10)
+        self.events = []
+        self.votes = votes
+        self.checked = 0
+
+    async def wait_until_ready(self):
+        return
+
+    def is_closed(self):
+        self.checked += 1
+        if self.checked == 2:
+            self.votes.ids = [4] + self.votes.ids
+        return self.checked > 2
+
+    def dispatch(self, event, *args):
+        self.events.append((event, args))
+
+
+@pytest.mark.asyncio
+async def test_client_poll_dispatches_vote_event():
+    votes = FakeVotes([3, 2, 1])
+    bot = FakeBot(votes)
+    client = DBSkr.topgg.Client(bot, token="token", autopost=False)
+    client.iter_votes = votes
+    client.poll_interval = 0
+
+    await client._poll_votes()
+    assert len(bot.events) == 1
+    name, (event, ) = bot.events[0]
+    assert name == "dbskr_vote"
+    assert isinstance(event, DBSkr.VoteEvent)
+    assert event.web_type == DBSkr.WebsiteType.topgg
+    assert (event.bot_id, event.user_id) == ("10", "4")
+    assert event.vote.id == "4"
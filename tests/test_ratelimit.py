@@ -0,0 +1,108 @@
+import asyncio
+import time
+import pytest
+
+from DBSkr.ratelimit import RateLimitBucket, RateLimiter, SQLiteRateLimitStore
+
+
+def test_route():
+    assert RateLimiter.route("get", "/bots/680694763036737536/vote") == "GET /bots/{id}/vote"
+
+
+@pytest.mark.asyncio
+async def test_update_headers():
+    limiter = RateLimiter(name="test")
+    reset = time.time() + 60
+    await limiter.update("GET /bots", {
+        'x-ratelimit-limit': '10',
+        'x-ratelimit-remaining': '0',
+        'x-ratelimit-reset': str(int(reset))
+    }, 200)
+
+    bucket = limiter.get_bucket("GET /bots")
+    assert bucket.limit == 10
+    assert bucket.remaining == 0
+    assert bucket.delay() > 0
+
+
+@pytest.mark.asyncio
+async def test_retry_after():
+    limiter = RateLimiter(name="test")
+    bucket = await limiter.update("GET /bots", {'retry-after': '30'}, 429)
+    assert bucket.remaining == 0
+
+    bucket = limiter.get_bucket("GET /bots")
+    assert bucket.remaining == 0
+    assert 29 < bucket.delay() <= 30
+
+
+@pytest.mark.asyncio
+async def test_acquire_wait():
+    limiter = RateLimiter(name="test")
+    await limiter.update("GET /bots", {
+        'x-ratelimit-limit': '2',
+        'x-ratelimit-remaining': '2',
+        'x-ratelimit-reset': '0.3'
+    }, 200)
+
+    loop = asyncio.get_event_loop()
+    start = loop.time()
+    await limiter.acquire("GET /bots")
+    await limiter.acquire("GET /bots")
+    assert loop.time() - start < 0.2
+
+    await limiter.acquire("GET /bots")
+    assert loop.time() - start >= 0.2
+
+
+@pytest.mark.asyncio
+async def test_sqlite_store(tmp_path):
+    path = str(tmp_path / "ratelimit.sqlite")
+    limiter1 = RateLimiter(name="test", store=SQLiteRateLimitStore(path))
+    limiter2 = RateLimiter(name="test", store=SQLiteRateLimitStore(path))
+
+    bucket = await limiter1.update("GET /bots", {
+        'x-ratelimit-limit': '2',
+        'x-ratelimit-remaining': '2',
+        'x-ratelimit-reset': '60'
+    }, 200)
+    assert bucket.limit == 2 and bucket.remaining == 2
+    await limiter1.acquire("GET /bots")
+
+    # 남은 요청 1회는 주기의 나머지 절반에 배분되므로, 다른 프로세스도 기다려야 합니다.
+    bucket = limiter2.get_bucket("GET /bots")
+    assert bucket.remaining == 1
+    assert 29 < bucket.delay() <= 30
+    assert list(limiter1.buckets.keys()) == ["GET /bots"]
+
+
+def test_exhausted_without_reset():
+    bucket = RateLimitBucket("GET /bots", remaining=0)
+    assert bucket.delay(now=100.0) > 0
+
+
+def test_quota_spacing():
+    bucket = RateLimitBucket("GET /bots")
+    assert bucket.delay(now=100.0, quota=(60, 60.0)) == 0
+    bucket.reserve(now=100.0)
+    assert bucket.limit == 60 and bucket.remaining == 59
+    assert bucket.delay(now=100.5, quota=(60, 60.0)) == pytest.approx(0.5)
+
+    # 주기가 끝나면 기본 사용량 제한 정보로 새로운 주기를 시작합니다.
+    assert bucket.delay(now=161.0, quota=(60, 60.0)) == 0
+    assert bucket.remaining == 60 and bucket.reset == 221.0
+
+
+def test_relative_reset_keeps_window():
+    bucket = RateLimitBucket("GET /bots")
+    bucket.update(limit=10, remaining=5, reset=160.0, now=100.0)
+    bucket.reserve(now=100.0)
+    bucket.reserve(now=100.0)
+
+    # 응답 지연으로 초기화 시간이 조금 달라져도 같은 주기로 취급하여, 응답받지 못한 요청을 유지합니다.
+    bucket.update(limit=10, remaining=4, reset=160.4, now=100.4)
+    assert bucket.remaining == 3
+    assert bucket.reset == 160.0
+
+    bucket.update(limit=10, remaining=10, reset=220.0, now=161.0)
+    assert bucket.remaining == 10
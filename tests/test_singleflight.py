@@ -0,0 +1,45 @@
+import asyncio
+import pytest
+
+from DBSkr.singleflight import SingleFlight, request_key, request_params
+
+
+def test_request_key():
+    key1 = request_key("get", "https://koreanbots.dev/api/v2/bots/1/vote", {"userID": "1", "a": "b"})
+    key2 = request_key("GET", "https://koreanbots.dev/api/v2/bots/1/vote", {"a": "b", "userID": "1"})
+    assert key1 == key2
+
+
+def test_request_params():
+    assert request_params({"limit": 10, "search": None, "sort": True}) == {"limit": "10", "sort": "true"}
+
+
+@pytest.mark.asyncio
+async def test_single_flight():
+    flight = SingleFlight()
+    calls = []
+
+    async def request():
+        calls.append(1)
+        await asyncio.sleep(0.1)
+        return {"voted": True}
+
+    results = await asyncio.gather(*[flight.do("key", request) for _ in range(10)])
+    assert len(calls) == 1
+    assert all(result == {"voted": True} for result in results)
+    assert len(flight) == 0
+
+
+@pytest.mark.asyncio
+async def test_single_flight_cancel():
+    flight = SingleFlight()
+
+    async def request():
+        await asyncio.sleep(0.1)
+        return 1
+
+    first = asyncio.ensure_future(flight.do("key", request))
+    second = asyncio.ensure_future(flight.do("key", request))
+    await asyncio.sleep(0)
+    first.cancel()
+    assert await second == 1
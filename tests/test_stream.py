@@ -0,0 +1,68 @@
+import json
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import DBSkr
+from DBSkr.stream import iter_json_array
+
+
+async def chunks(data: str, size: int):
+    data = data.encode("utf-8")
+    for index in range(0, len(data), size):
+        yield data[index:index + size]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", [1, 7, 4096])
+async def test_iter_json_array(size):
+    items = [{"id": str(index), "username": "사용자{}".format(index), "tags": ["a]", 1.5]} for index in range(100)]
+    result = [item async for item in iter_json_array(chunks(json.dumps(items, ensure_ascii=False), size))]
+    assert result == items
+
+    document = json.dumps({"data": {"bot": {"name": "hearts", "hearts": items}}}, ensure_ascii=False)
+    result = [item async for item in iter_json_array(chunks(document, size), key="hearts")]
+    assert result == items
+
+
+@pytest.mark.asyncio
+async def test_topgg_iter_votes():
+    votes = [{"id": str(index), "username": "user", "avatar": None} for index in range(1000)]
+
+    async def handler(request):
+        return web.json_response(votes)
+
+    app = web.Application()
+    app.router.add_get("/bots/1/votes", handler)
+    async with TestServer(app) as server:
+        client = DBSkr.topgg.HttpClient()
+        client.requests.BASE = str(server.make_url("")).rstrip("/")
+        result = [user async for user in client.iter_votes(bot_id=1)]
+        await client.close()
+
+    assert len(result) == 1000
+    assert isinstance(result[0], DBSkr.topgg.VotedUser)
+    assert result[-1].id == "999"
+
+
+@pytest.mark.asyncio
+async def test_uniquebots_iter_votes_retry():
+    hearts = [{"from": {"id": str(index), "tag": "user#0000"}} for index in range(100)]
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            return web.json_response({"error": "Too Many Requests"}, status=429, headers={"retry-after": "0"})
+        return web.json_response({"data": {"bot": {"hearts": hearts}}})
+
+    app = web.Application()
+    app.router.add_post("/graphql", handler)
+    async with TestServer(app) as server:
+        client = DBSkr.uniquebots.HttpClient()
+        client.requests.BASE = str(server.make_url("/graphql"))
+        result = [user async for user in client.iter_votes(bot_id=1)]
+        await client.close()
+
+    assert len(calls) == 2
+    assert [user.id for user in result] == [str(index) for index in range(100)]
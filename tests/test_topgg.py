@@ -0,0 +1,46 @@
+import pytest
+
+import DBSkr
+
+
+class FakeApi:
+    def __init__(self, total: int):
+        self.total = total
+        self.offsets = []
+        self.session_manager = None
+
+    async def get(self, path, params=None, **kwargs):
+        self.offsets.append(params["offset"])
+        assert params["fields"] == "id,username"
+        end = min(params["offset"] + params["limit"], self.total)
+        return {
+            "results": [{"id": str(index), "username": "bot"} for index in range(params["offset"], end)],
+            "limit": params["limit"],
+            "offset": params["offset"],
+            "count": end - params["offset"],
+            "total": self.total
+        }
+
+
+@pytest.mark.asyncio
+async def test_iter_search():
+    client = DBSkr.topgg.HttpClient()
+    client.requests = FakeApi(total=1200)
+
+    bots = [bot async for bot in client.iter_search(fields=["username"])]
+    assert len(bots) == 1200
+    assert sorted(client.requests.offsets) == [0, 500, 1000]
+    assert bots[-1].id == "1199"
+    assert bots[0].partial
+    assert bots[0].avatar is None
+    assert str(bots[0]) == "bot"
+
+
+@pytest.mark.asyncio
+async def test_iter_search_limit():
+    client = DBSkr.topgg.HttpClient()
+    client.requests = FakeApi(total=5000)
+
+    bots = [bot async for bot in client.iter_search(fields=["id", "username"], limit=600, chunk_size=300)]
+    assert len(bots) == 600
+    assert sorted(client.requests.offsets) == [0, 300]
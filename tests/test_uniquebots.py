@@ -0,0 +1,157 @@
+import json
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import DBSkr
+from DBSkr.uniquebots.api import _compile, compile_query
+from DBSkr.uniquebots.fields import get_batch_query
+
+
+class FakeApi:
+    def __init__(self, voted=()):
+        self.voted = voted
+        self.requests_count = 0
+        self.session_manager = None
+
+    async def requests(self, data, variables=None, **kwargs):
+        self.requests_count += 1
+        if "bot_id" in variables:
+            bot = {
+                key: variables[key] in self.voted
+                for key in variables.keys() if key != "bot_id"
+            }
+            return {"data": {"bot": bot}}
+        return {"data": {
+            key: {"id": value, "tag": "user#0000", "bots": [],
+                    "avatarURL": "https://cdn.discordapp.com/avatars/{}/avatar.png".format(value)} if value != "0" else None
+            for key, value in variables.items()
+        }}
+
+
+def make_client(api: FakeApi) -> DBSkr.uniquebots.HttpClient:
+    client = DBSkr.uniquebots.HttpClient()
+    client.requests = api
+    return client
+
+
+@pytest.mark.asyncio
+async def test_vote_many_batch():
+    api = FakeApi(voted=("1", "3"))
+    vote_cache = DBSkr.VoteCache()
+    client = make_client(api)
+    client.vote_cache = vote_cache
+
+    result = await client.vote_many(bot_id=10, user_ids=[1, 2, 3, 4, 5, 1], chunk_size=2)
+    assert api.requests_count == 3
+    assert [result[user_id].voted for user_id in [1, 2, 3, 4, 5]] == [True, False, True, False, False]
+
+    result = await client.vote_many(bot_id=10, user_ids=[1, 3])
+    assert api.requests_count == 3
+    assert result[1].voted
+
+
+@pytest.mark.asyncio
+async def test_users_many_batch():
+    api = FakeApi()
+    client = make_client(api)
+
+    result = await client.users_many(user_ids=[1, 2, 0], chunk_size=25)
+    assert api.requests_count == 1
+    assert result[1].id == "1"
+    assert result[0] is None
+
+
+def test_projection():
+    from DBSkr.uniquebots.fields import get_fields
+
+    assert get_fields("bot") == get_fields("bot", "shallow")
+    assert "owners { id }" in get_fields("bot", DBSkr.uniquebots.Projection.shallow)
+    assert "bots" in get_fields("bot", DBSkr.uniquebots.Projection.full)
+    assert "categories" not in get_fields("bot")
+    assert "hearts" not in get_fields("bot") and "hearts { from { id } }" in get_fields("bot", "full")
+    assert get_fields("profile", ["id", "tag"]) == "id, tag"
+    assert get_fields("hearts", "from { id }") == "from { id }"
+
+    bot = DBSkr.uniquebots.Bot({"id": "1", "name": "bot", "owners": [{"id": "2"}]})
+    assert bot.owners == ["2"]
+    assert bot.avatar is None
+    assert bot.library is None
+    assert bot.votes == []
+
+    bot = DBSkr.uniquebots.Bot({"id": "1", "hearts": [{"from": {"id": "3"}}]})
+    assert bot.votes == ["3"]
+
+    user = DBSkr.uniquebots.User({"id": "2"})
+    assert user.bots == []
+
+
+def test_compiled_query():
+    from DBSkr.uniquebots import fields
+
+    assert fields.get_query("bot") is fields.get_query("bot", "shallow")
+    assert fields.get_batch_query("profile", 3) is fields.get_batch_query("profile", 3)
+
+    body = fields.VOTE.encode({"bot_id": "1", "user_id": "2"})
+    assert json.loads(body) == {
+        "query": "query($bot_id: String!, $user_id: String!){ bot (id: $bot_id) { heartClicked(user: $user_id) } }",
+        "variables": {"bot_id": "1", "user_id": "2"}
+    }
+
+
+@pytest.mark.asyncio
+async def test_batch_http_error():
+    async def handler(request):
+        return web.json_response({"error": "Service Unavailable"}, status=503)
+
+    app = web.Application()
+    app.router.add_post("/graphql", handler)
+    async with TestServer(app) as server:
+        client = DBSkr.uniquebots.HttpClient()
+        client.requests.BASE = str(server.make_url("/graphql"))
+        with pytest.raises(DBSkr.uniquebots.HTTPException):
+            await client.users_many(user_ids=[1, 2])
+
+        result = await client._batch(
+            [1, 2],
+            lambda chunk: (get_batch_query("profile", len(chunk)), {"a0": str(chunk[0]), "a1": str(chunk[1])}),
+            lambda data, chunk: [data.get("a0"), data.get("a1")],
+            return_exceptions=True
+        )
+        await client.close()
+
+    assert all(isinstance(value, DBSkr.uniquebots.HTTPException) for value in result.values())
+
+
+@pytest.mark.asyncio
+async def test_requests_retry():
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        if len(calls) == 1 or request.query.get("limited"):
+            return web.json_response({"error": "Too Many Requests"}, status=429, headers={"retry-after": "0"})
+        return web.json_response({"data": {"profile": {"id": "1", "tag": "user#0000", "bots": []}}})
+
+    app = web.Application()
+    app.router.add_post("/graphql", handler)
+    async with TestServer(app) as server:
+        client = DBSkr.uniquebots.HttpClient()
+        client.requests.BASE = str(server.make_url("/graphql"))
+        user = await client.users(1)
+        assert user.id == "1"
+        assert len(calls) == 2
+
+        client.requests.BASE = str(server.make_url("/graphql").with_query(limited="1"))
+        with pytest.raises(DBSkr.uniquebots.HTTPException):
+            await client.users(2)
+        assert len(calls) == 7
+        await client.close()
+
+
+def test_compile_query_bounded():
+    query = compile_query("{ profile (id: $user_id) { id } }", {"user_id": "String"})
+    assert compile_query("{ profile (id: $user_id) { id } }", {"user_id": "String"}) is query
+    for index in range(_compile.cache_info().maxsize + 1):
+        compile_query("{ profile (id: $user_id) { id%d } }" % index, {"user_id": "String"})
+    assert _compile.cache_info().currsize == _compile.cache_info().maxsize
@@ -0,0 +1,82 @@
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import DBSkr
+from DBSkr import VoterSet
+
+
+def test_voter_set_membership():
+    ids = [(index * 7919 + 1) << 22 for index in range(10000)]
+    voters = VoterSet(ids + ids[:100])
+
+    assert len(voters) == 10000
+    assert all(user_id in voters for user_id in ids)
+    assert str(ids[0]) in voters
+    assert 12345 not in voters and "abc" not in voters and -1 not in voters
+    assert list(voters) == ids
+    assert voters.nbytes < 40 * len(ids)
+
+
+def test_voter_set_invalid_id():
+    voters = VoterSet([1, 2])
+    for user_id in (-5, 1 << 64):
+        with pytest.raises(ValueError):
+            voters.add(user_id)
+
+    voters.add(3)
+    assert list(voters) == [1, 2, 3]
+    assert all(user_id in voters for user_id in (1, 2, 3))
+    assert sorted(position for position in voters._table if position != -1) == [0, 1, 2]
+
+
+def test_voter_set_operations():
+    topgg = VoterSet([1, 2, 3], timestamps=[100, 200, 300])
+    uniquebots = VoterSet([3, 4])
+
+    anywhere = topgg | uniquebots
+    assert sorted(anywhere) == [1, 2, 3, 4]
+    assert anywhere.timestamp(2).timestamp() == 200
+    assert anywhere.timestamp(4) is None
+
+    assert sorted(topgg - uniquebots) == [1, 2]
+    assert list(topgg & uniquebots) == [3]
+    assert (topgg & uniquebots).timestamp(3).timestamp() == 300
+
+    topgg.add(1, 1_600_000_000_000)
+    assert topgg.timestamp(1).timestamp() == 1_600_000_000
+
+
+@pytest.mark.asyncio
+async def test_voter_set_materialize():
+    calls = []
+
+    async def loader(user_id):
+        calls.append(user_id)
+        return {"id": user_id}
+
+    voters = VoterSet(range(1, 6), loader=loader)
+    assert await voters.get(10) is None
+    assert await voters.get("3") == {"id": 3}
+
+    result = await voters.materialize(limit=2)
+    assert result == {1: {"id": 1}, 2: {"id": 2}}
+    assert calls == [3, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_topgg_voters():
+    async def handler(request):
+        return web.json_response([{"id": str(index), "username": "user"} for index in range(1, 501)])
+
+    app = web.Application()
+    app.router.add_get("/bots/1/votes", handler)
+    async with TestServer(app) as server:
+        client = DBSkr.topgg.HttpClient()
+        client.requests.BASE = str(server.make_url("")).rstrip("/")
+        voters = await client.voters(bot_id=1)
+        await client.close()
+
+    assert len(voters) == 500
+    assert 250 in voters and 501 not in voters
+    assert voters.loader == client.users
@@ -0,0 +1,73 @@
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+
+import DBSkr
+
+
+class FakeBot:
+    def __init__(self):
+        self.events = []
+
+    def dispatch(self, event, *args):
+        self.events.append((event, args))
+
+
+@pytest.mark.asyncio
+async def test_topgg_webhook():
+    bot = FakeBot()
+    vote_cache = DBSkr.VoteCache()
+    server = DBSkr.WebhookServer(bot=bot, topgg_auth="secret", vote_cache=vote_cache)
+
+    async with TestClient(TestServer(server.app)) as client:
+        response = await client.post("/topgg", json={"bot": "1", "user": "2", "type": "upvote"})
+        assert response.status == 401
+
+        response = await client.post("/topgg", json={"user": "2", "type": "upvote"},
+                                     headers={"Authorization": "secret"})
+        assert response.status == 400
+
+        response = await client.post("/topgg", json={"bot": "1", "user": "2", "type": "upvote", "isWeekend": True},
+                                     headers={"Authorization": "secret"})
+        assert response.status == 200
+
+    assert len(bot.events) == 1
+    name, (event, ) = bot.events[0]
+    assert name == "dbskr_vote"
+    assert event.web_type == DBSkr.WebsiteType.topgg
+    assert event.user_id == "2"
+    assert event.is_weekend
+    assert isinstance(event.vote, DBSkr.topgg.VotedUser)
+    assert vote_cache.get("topgg", "1", "2") == {"voted": 1}
+
+
+@pytest.mark.asyncio
+async def test_koreanbots_webhook():
+    bot = FakeBot()
+    server = DBSkr.WebhookServer(bot=bot, koreanbots_auth="secret")
+
+    async with TestClient(TestServer(server.app)) as client:
+        response = await client.post("/koreanbots", data="[]", headers={"Authorization": "secret"})
+        assert response.status == 400
+
+        for data in ({"type": "vote", "data": []}, {"type": "vote", "data": "[]"}, {"type": "vote", "userID": "2"}):
+            response = await client.post("/koreanbots", json=data, headers={"Authorization": "secret"})
+            assert response.status == 400
+
+        response = await client.post("/koreanbots",
+                                     json={"type": "vote", "data": {"userID": "2", "botID": "1",
+                                                                    "timestamp": 1614906230000}},
+                                     headers={"Authorization": "secret"})
+        assert response.status == 200
+
+    name, (event, ) = bot.events[0]
+    assert event.web_type == DBSkr.WebsiteType.koreanbots
+    assert event.vote.voted
+    assert event.vote.last_vote.year == 2021
+
+
+def test_empty_auth():
+    for auth in ("", "  "):
+        with pytest.raises(ValueError):
+            DBSkr.WebhookServer(topgg_auth=auth)
+        with pytest.raises(ValueError):
+            DBSkr.WebhookServer(koreanbots_auth=auth)